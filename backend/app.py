@@ -6,6 +6,12 @@ from routes.college_routes import colleges_bp
 from routes.program_routes import programs_bp
 from routes.auth_routes import auth_bp
 from routes.dashboard_routes import dashboard_bp
+from routes.batch_routes import batch_bp
+from routes.metrics_routes import metrics_bp
+from utils.compression import compress_response, send_static
+from utils.json_provider import FastJSONProvider
+from utils.timing import start_request_timer, add_timing_headers
+from utils.profiling import start_profile, finish_profile, discard_profile
 import os
 from dotenv import load_dotenv
 
@@ -18,6 +24,9 @@ app = Flask(
 )
 CORS(app)
 
+# Serialize responses with orjson when it is installed
+app.json = FastJSONProvider(app)
+
 # JWT config
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY')
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = 86400
@@ -29,11 +38,28 @@ app.register_blueprint(students_bp)
 app.register_blueprint(colleges_bp)
 app.register_blueprint(programs_bp)
 app.register_blueprint(dashboard_bp)    
+app.register_blueprint(batch_bp)
+app.register_blueprint(metrics_bp)
+
+# Per-layer Server-Timing on every response; registered first so it runs
+# last among the after_request hooks and its total covers compression
+app.before_request(start_request_timer)
+app.after_request(add_timing_headers)
+
+# Compress API responses above the size threshold
+app.after_request(compress_response)
+
+# Authenticated ?profile=1 requests get their cProfile stats as the body
+app.before_request(start_profile)
+app.after_request(finish_profile)
+app.teardown_request(discard_profile)
+
+# Serve frontend, using the .br/.gz files generated by the Vite build
+app.view_functions['static'] = lambda filename: send_static(app.static_folder, filename)
 
-# Serve frontend
 @app.route("/")
 def serve_frontend():
-    return app.send_static_file("index.html")
+    return send_static(app.static_folder, "index.html")
 
 if __name__ == "__main__":
     app.run(debug=True)
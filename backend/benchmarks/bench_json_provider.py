@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Compare Flask's DefaultJSONProvider with FastJSONProvider on the payloads
+the API actually returns. No database is needed:
+
+    python benchmarks/bench_json_provider.py --runs 200
+
+Without orjson installed FastJSONProvider falls back to the standard
+encoder, so both columns should then be about equal.
+"""
+
+import argparse
+import decimal
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from psycopg2.extras import RealDictRow
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_provider import FastJSONProvider, orjson
+
+YEAR_LEVELS = ['1st', '2nd', '3rd', '4th', '4th+']
+
+def student_rows(count):
+    return [
+        RealDictRow({
+            'id_number': f'2024-{i:04d}',
+            'first_name': f'First{i % 997}',
+            'last_name': f'Last{i % 1499}',
+            'year_level': YEAR_LEVELS[i % 5],
+            'gender': 'Male' if i % 2 else 'Female',
+            'program_code': f'P{i % 60}',
+            'picture': f'https://example.supabase.co/storage/v1/object/public/pictures/2024-{i:04d}.jpg'
+        })
+        for i in range(count)
+    ]
+
+def build_payloads():
+    """Payload name -> object, shaped like the real responses"""
+    def page(count):
+        return {
+            'students': student_rows(count),
+            'total': 48213,
+            'page': 1,
+            'per_page': count,
+            'total_pages': 48213 // count + 1
+        }
+    
+    dashboard = {
+        'total_students': 48213,
+        'total_programs': 60,
+        'total_colleges': 8,
+        'students_per_college': [
+            RealDictRow({'college_code': f'C{i}', 'college_name': f'College {i}', 'student_count': 6000 - i})
+            for i in range(8)
+        ],
+        'top_programs': [
+            RealDictRow({'program_code': f'P{i}', 'program_name': f'Program {i}', 'student_count': 900 - i})
+            for i in range(7)
+        ],
+        'college_stats': [
+            RealDictRow({
+                'college_code': f'C{i}',
+                'college_name': f'College {i}',
+                'program_count': 7,
+                'student_count': 6000 - i,
+                'share': decimal.Decimal('12.45'),
+                'updated_at': datetime(2024, 6, 1, 8, 30)
+            })
+            for i in range(8)
+        ]
+    }
+    
+    return [
+        ('student page, 10 rows', page(10)),
+        ('student page, 100 rows', page(100)),
+        ('dashboard summary', dashboard),
+        ('student list, 5000 rows', student_rows(5000)),
+    ]
+
+def time_provider(app, provider, payload, runs):
+    samples = []
+    with app.app_context():
+        provider.response(payload)  # Warm up
+        for _ in range(runs):
+            started = time.perf_counter()
+            provider.response(payload).get_data()
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=200)
+    args = parser.parse_args()
+    
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    fast = FastJSONProvider(app)
+    
+    print(f"orjson: {orjson.__version__ if orjson else 'not installed (fallback)'}")
+    print(f"\n{'payload':<28}{'default p50':>13}{'p95':>9}{'fast p50':>11}{'p95':>9}{'speedup':>10}")
+    
+    for name, payload in build_payloads():
+        with app.app_context():
+            expected = json.loads(default.response(payload).get_data())
+            actual = json.loads(fast.response(payload).get_data())
+        assert expected == actual, f"Output differs for {name}"
+        
+        default_p50, default_p95 = time_provider(app, default, payload, args.runs)
+        fast_p50, fast_p95 = time_provider(app, fast, payload, args.runs)
+        print(f"{name:<28}{default_p50:>11.3f}ms{default_p95:>7.3f}ms"
+              f"{fast_p50:>9.3f}ms{fast_p95:>7.3f}ms{default_p50 / fast_p50:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
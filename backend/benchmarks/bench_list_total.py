@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Compare the old two-query list path (COUNT + page) with the single
+query that returns the page and its total, as used by StudentRepository.find_all.
+
+Seeds a throwaway schema with synthetic data, so point DATABASE_URL at a
+scratch database:
+
+    python benchmarks/bench_list_total.py --students 100000 --runs 30
+
+Use --rtt-ms to add a simulated network round trip per statement when the
+database runs on the same host; a hosted database pays this for real.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from queries.student_queries import StudentQueries
+
+SCHEMA = "bench_list_total"
+
+SELECT_LIST = "id_number, first_name, last_name, year_level, gender, program_code, picture"
+
+# The list query as it was before the window count was added
+LEGACY_FIND_ALL_SEARCH = """
+    SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
+    FROM students
+    WHERE
+        (LOWER(id_number) LIKE %s OR
+        LOWER(first_name) LIKE %s OR
+        LOWER(last_name) LIKE %s OR
+        LOWER(program_code) LIKE %s OR
+        CAST(year_level AS TEXT) LIKE %s)
+        {filter_clause}
+    ORDER BY {sort_field} {sort_direction}
+    LIMIT %s OFFSET %s;
+"""
+
+LEGACY_FIND_ALL_FILTER = """
+    SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
+    FROM students
+    WHERE 1=1
+        {filter_clause}
+    ORDER BY {sort_field} {sort_direction}
+    LIMIT %s OFFSET %s;
+"""
+
+LEGACY_FIND_ALL = """
+    SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
+    FROM students
+    ORDER BY {sort_field} {sort_direction}
+    LIMIT %s OFFSET %s;
+"""
+
+SEED_SQL = """
+    DROP SCHEMA IF EXISTS {schema} CASCADE;
+    CREATE SCHEMA {schema};
+    SET search_path TO {schema};
+
+    CREATE TABLE colleges (
+        college_code VARCHAR(20) PRIMARY KEY,
+        college_name VARCHAR(255) NOT NULL
+    );
+    CREATE TABLE programs (
+        program_code VARCHAR(20) PRIMARY KEY,
+        program_name VARCHAR(255) NOT NULL,
+        college_code VARCHAR(20) REFERENCES colleges(college_code)
+    );
+    CREATE TABLE students (
+        id_number VARCHAR(20) PRIMARY KEY,
+        first_name VARCHAR(100) NOT NULL,
+        last_name VARCHAR(100) NOT NULL,
+        year_level INTEGER NOT NULL,
+        gender VARCHAR(20) NOT NULL,
+        program_code VARCHAR(20) REFERENCES programs(program_code),
+        picture TEXT
+    );
+
+    INSERT INTO colleges
+    SELECT 'C' || g, 'College ' || g FROM generate_series(1, 8) g;
+
+    INSERT INTO programs
+    SELECT 'P' || g, 'Program ' || g, 'C' || (1 + g %% 8) FROM generate_series(1, 60) g;
+
+    INSERT INTO students
+    SELECT
+        lpad(g::text, 9, '0'),
+        'First' || (g %% 997),
+        'Last' || (g %% 1499),
+        1 + g %% 4,
+        CASE WHEN g %% 2 = 0 THEN 'Male' ELSE 'Female' END,
+        'P' || (1 + g %% 60),
+        'https://example.com/pictures/' || g || '.jpg'
+    FROM generate_series(1, %s) g;
+
+    ANALYZE;
+"""
+
+def build_scenarios(students):
+    """Scenario name -> (filters, search, page) covering each find_all branch"""
+    deep_page = max(1, students // 20 // 2)
+    return [
+        ('all, page 1', None, '', 1),
+        (f'all, page {deep_page}', None, '', deep_page),
+        ('filter gender+year, page 1', {'gender': 'Male', 'year_level': 2}, '', 1),
+        ('search "first9", page 1', None, 'first9', 1),
+        ('search "first9" + program filter', {'program_code': 'P7'}, 'first9', 1),
+    ]
+
+def filter_clause_for(filters):
+    clause = ""
+    params = []
+    for field in ('gender', 'year_level', 'program_code'):
+        if filters and filters.get(field):
+            clause += f" AND {field} = %s"
+            params.append(filters[field])
+    return clause, params
+
+def two_query_path(cur, filters, search, page, per_page=20, rtt=0.0):
+    queries = StudentQueries
+    offset = (page - 1) * per_page
+    filter_clause, filter_params = filter_clause_for(filters)
+    fmt = dict(sort_field='last_name', sort_direction='asc', filter_clause=filter_clause)
+
+    if search:
+        search_params = (f'%{search}%',) * 5
+        cur.execute(queries.COUNT_ALL_SEARCH.format(search_clause=queries.SEARCH_CLAUSE,
+                                                    filter_clause=filter_clause),
+                    search_params + tuple(filter_params))
+        total = cur.fetchone()['total']
+        time.sleep(rtt)
+        cur.execute(LEGACY_FIND_ALL_SEARCH.format(**fmt),
+                    search_params + tuple(filter_params) + (per_page, offset))
+    elif filter_clause:
+        cur.execute(queries.COUNT_ALL_FILTER.format(filter_clause=filter_clause), tuple(filter_params))
+        total = cur.fetchone()['total']
+        time.sleep(rtt)
+        cur.execute(LEGACY_FIND_ALL_FILTER.format(**fmt), tuple(filter_params) + (per_page, offset))
+    else:
+        cur.execute(queries.COUNT_ALL)
+        total = cur.fetchone()['total']
+        time.sleep(rtt)
+        cur.execute(LEGACY_FIND_ALL.format(**fmt), (per_page, offset))
+
+    rows = cur.fetchall()
+    time.sleep(rtt)
+    return total, rows
+
+def single_query_path(cur, filters, search, page, per_page=20, rtt=0.0):
+    queries = StudentQueries
+    offset = (page - 1) * per_page
+    filter_clause, filter_params = filter_clause_for(filters)
+    fmt = dict(sort_field='last_name', sort_direction='asc', filter_clause=filter_clause,
+               select_list=SELECT_LIST, join_clause='')
+
+    if search:
+        search_params = (f'%{search}%',) * 5
+        cur.execute(queries.FIND_ALL_SEARCH.format(select_list=fmt['select_list'],
+                                                   join_clause='',
+                                                   search_clause=queries.SEARCH_CLAUSE,
+                                                   filter_clause=filter_clause,
+                                                   order_clause='last_name asc'),
+                    search_params + tuple(filter_params) + (per_page, offset))
+    elif filter_clause:
+        cur.execute(queries.FIND_ALL_FILTER.format(**fmt), tuple(filter_params) + (per_page, offset))
+    else:
+        cur.execute(queries.FIND_ALL.format(**fmt), (per_page, offset))
+
+    rows = cur.fetchall()
+    time.sleep(rtt)
+    total = rows[0]['total_count'] if rows else 0
+    return total, rows
+
+def time_path(conn, path, scenario, runs, rtt):
+    _, filters, search, page = scenario
+    samples = []
+    with conn.cursor() as cur:
+        path(cur, filters, search, page)  # Warm the cache
+        for _ in range(runs):
+            started = time.perf_counter()
+            path(cur, filters, search, page, rtt=rtt)
+            samples.append((time.perf_counter() - started) * 1000)
+    conn.rollback()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--rtt-ms', type=float, default=0.0, help='Simulated network round trip per statement')
+    parser.add_argument('--keep', action='store_true', help='Keep the seeded schema afterwards')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(os.getenv("DATABASE_URL"), cursor_factory=RealDictCursor)
+    try:
+        print(f"Seeding {args.students} students into schema '{SCHEMA}'...")
+        with conn.cursor() as cur:
+            cur.execute(SEED_SQL.format(schema=SCHEMA), (args.students,))
+        conn.commit()
+
+        with conn.cursor() as cur:
+            cur.execute(f"SET search_path TO {SCHEMA}")
+        conn.commit()
+
+        print(f"\n{'scenario':<36}{'two-query p50':>15}{'p95':>9}{'single p50':>13}{'p95':>9}{'speedup':>10}")
+        for scenario in build_scenarios(args.students):
+            two_total, _ = two_query_path(conn.cursor(), *scenario[1:])
+            one_total, _ = single_query_path(conn.cursor(), *scenario[1:])
+            conn.rollback()
+            assert two_total == one_total, f"Totals differ for {scenario[0]}: {two_total} != {one_total}"
+
+            two_p50, two_p95 = time_path(conn, two_query_path, scenario, args.runs, args.rtt_ms / 1000)
+            one_p50, one_p95 = time_path(conn, single_query_path, scenario, args.runs, args.rtt_ms / 1000)
+            print(f"{scenario[0]:<36}{two_p50:>13.2f}ms{two_p95:>7.2f}ms"
+                  f"{one_p50:>11.2f}ms{one_p95:>7.2f}ms{two_p50 / one_p50:>9.2f}x")
+    finally:
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            conn.commit()
+        conn.close()
+
+if __name__ == "__main__":
+    main()
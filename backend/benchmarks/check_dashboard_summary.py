@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Check that the single-statement dashboard summary returns exactly what the
+per-section queries return, and time the two paths.
+
+Seeds a throwaway schema with synthetic data, including colleges without
+programs, programs without a college or students, students without a
+program and tied counts, so point DATABASE_URL at a scratch database:
+
+    python benchmarks/check_dashboard_summary.py --students 1000000 --runs 20
+
+Exits non-zero if any section differs.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from queries.dashboard_queries import DashboardQueries
+
+SCHEMA = "check_dashboard_summary"
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+# The aggregate tables the summary reads, seeded from the synthetic data
+AGGREGATE_MIGRATIONS = ['0004_program_enrollment.sql', '0005_table_counters.sql']
+
+# The section queries as they were before program_enrollment, counting students directly
+LEGACY_STUDENTS_PER_COLLEGE = """
+    SELECT c.college_code, c.college_name, COUNT(s.id_number) as student_count
+    FROM colleges c
+    LEFT JOIN programs p ON c.college_code = p.college_code
+    LEFT JOIN students s ON p.program_code = s.program_code
+    GROUP BY c.college_code, c.college_name
+    ORDER BY student_count DESC, c.college_code
+"""
+
+LEGACY_TOP_PROGRAMS = """
+    SELECT p.program_code, p.program_name, COUNT(s.id_number) as student_count
+    FROM programs p
+    LEFT JOIN students s ON p.program_code = s.program_code
+    GROUP BY p.program_code, p.program_name
+    ORDER BY student_count DESC, p.program_code
+    LIMIT 7;
+"""
+
+LEGACY_COLLEGE_STATS = """
+    SELECT 
+        c.college_code, c.college_name,
+        COUNT(DISTINCT p.program_code) as program_count,
+        COUNT(s.id_number) as student_count
+    FROM colleges c
+    LEFT JOIN programs p ON c.college_code = p.college_code
+    LEFT JOIN students s ON p.program_code = s.program_code
+    GROUP BY c.college_code, c.college_name
+    ORDER BY student_count DESC, c.college_code;
+"""
+
+SEED_SQL = """
+    DROP SCHEMA IF EXISTS {schema} CASCADE;
+    CREATE SCHEMA {schema};
+    SET search_path TO {schema};
+
+    -- The enum types the application schema uses for these columns
+    CREATE TYPE year_level_type AS ENUM ('1st', '2nd', '3rd', '4th', '4th+');
+    CREATE TYPE gender_type AS ENUM ('Male', 'Female', 'Others', 'Prefer not to say');
+
+    CREATE TABLE colleges (
+        college_code VARCHAR(20) PRIMARY KEY,
+        college_name VARCHAR(255) NOT NULL
+    );
+    CREATE TABLE programs (
+        program_code VARCHAR(20) PRIMARY KEY,
+        program_name VARCHAR(255) NOT NULL,
+        college_code VARCHAR(20) REFERENCES colleges(college_code)
+            ON UPDATE CASCADE ON DELETE SET NULL
+    );
+    CREATE TABLE students (
+        id_number VARCHAR(20) PRIMARY KEY,
+        first_name VARCHAR(100) NOT NULL,
+        last_name VARCHAR(100) NOT NULL,
+        year_level year_level_type NOT NULL,
+        gender gender_type NOT NULL,
+        program_code VARCHAR(20) REFERENCES programs(program_code)
+            ON UPDATE CASCADE ON DELETE SET NULL,
+        picture TEXT
+    );
+    CREATE INDEX ON students (program_code);
+
+    -- Colleges 13-15 get no programs
+    INSERT INTO colleges
+    SELECT 'C' || g, 'College ' || g FROM generate_series(1, 15) g;
+
+    -- Every 25th program has no college; programs 81-90 get no students
+    INSERT INTO programs
+    SELECT 'P' || g, 'Program ' || g,
+        CASE WHEN g %% 25 = 0 THEN NULL ELSE 'C' || (1 + g %% 12) END
+    FROM generate_series(1, 90) g;
+
+    -- Every 97th student has no program; the modulo spread leaves tied counts
+    INSERT INTO students
+    SELECT
+        lpad(g::text, 9, '0'),
+        'First' || (g %% 997),
+        'Last' || (g %% 1499),
+        (enum_range(NULL::year_level_type))[1 + g %% 5],
+        (enum_range(NULL::gender_type))[1 + g %% 4],
+        CASE WHEN g %% 97 = 0 THEN NULL ELSE 'P' || (1 + g %% 80) END,
+        NULL
+    FROM generate_series(1, %s) g;
+"""
+
+def section_path(cur):
+    """The dashboard summary as six separate statements"""
+    queries = DashboardQueries
+    cur.execute(queries.GET_TOTAL_STUDENTS)
+    total_students = cur.fetchone()['total_students']
+    cur.execute(queries.GET_TOTAL_PROGRAMS)
+    total_programs = cur.fetchone()['total_programs']
+    cur.execute(queries.GET_TOTAL_COLLEGES)
+    total_colleges = cur.fetchone()['total_colleges']
+    cur.execute(queries.GET_STUDENTS_PER_COLLEGE)
+    students_per_college = cur.fetchall()
+    cur.execute(queries.GET_TOP_PROGRAMS)
+    top_programs = cur.fetchall()
+    cur.execute(queries.GET_COLLEGE_STATS)
+    college_stats = cur.fetchall()
+    return {
+        'total_students': total_students,
+        'total_programs': total_programs,
+        'total_colleges': total_colleges,
+        'students_per_college': students_per_college,
+        'top_programs': top_programs,
+        'college_stats': college_stats
+    }
+
+def legacy_path(cur):
+    """The section path counting students with the original joins"""
+    summary = section_path(cur)
+    for key, query in (('students_per_college', LEGACY_STUDENTS_PER_COLLEGE),
+                       ('top_programs', LEGACY_TOP_PROGRAMS),
+                       ('college_stats', LEGACY_COLLEGE_STATS)):
+        cur.execute(query)
+        summary[key] = cur.fetchall()
+    return summary
+
+def single_path(cur):
+    """The dashboard summary as one statement"""
+    cur.execute(DashboardQueries.GET_DASHBOARD_SUMMARY)
+    return dict(cur.fetchone())
+
+def normalize(summary):
+    """Plain dicts and lists, so RealDictRows compare equal to decoded JSON"""
+    return {
+        key: [dict(row) for row in value] if isinstance(value, list) else value
+        for key, value in summary.items()
+    }
+
+def compare(expected, actual):
+    """List the sections that differ"""
+    return [key for key in expected if expected[key] != actual.get(key)]
+
+def time_path(conn, path, runs):
+    samples = []
+    with conn.cursor() as cur:
+        path(cur)  # Warm the cache
+        for _ in range(runs):
+            started = time.perf_counter()
+            path(cur)
+            samples.append((time.perf_counter() - started) * 1000)
+    conn.rollback()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=1000000)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--keep', action='store_true', help='Keep the seeded schema afterwards')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(os.getenv("DATABASE_URL"), cursor_factory=RealDictCursor)
+    try:
+        print(f"Seeding {args.students} students into schema '{SCHEMA}'...")
+        with conn.cursor() as cur:
+            cur.execute(SEED_SQL.format(schema=SCHEMA), (args.students,))
+            for filename in AGGREGATE_MIGRATIONS:
+                with open(os.path.join(MIGRATIONS_DIR, filename), encoding='utf-8') as f:
+                    cur.execute(f.read())
+            cur.execute("ANALYZE")
+        conn.commit()
+
+        with conn.cursor() as cur:
+            cur.execute(f"SET search_path TO {SCHEMA}")
+        conn.commit()
+
+        with conn.cursor() as cur:
+            expected = normalize(legacy_path(cur))
+            sections = normalize(section_path(cur))
+            single = normalize(single_path(cur))
+        conn.rollback()
+
+        failures = []
+        for name, actual in (('section queries', sections), ('single query', single)):
+            differing = compare(expected, actual)
+            print(f"{name:<18} {'OK' if not differing else 'differs in ' + ', '.join(differing)}")
+            failures.extend(differing)
+
+        section_p50, section_p95 = time_path(conn, section_path, args.runs)
+        single_p50, single_p95 = time_path(conn, single_path, args.runs)
+        print(f"\n{'path':<18}{'p50':>11}{'p95':>11}")
+        print(f"{'section queries':<18}{section_p50:>9.2f}ms{section_p95:>9.2f}ms")
+        print(f"{'single query':<18}{single_p50:>9.2f}ms{single_p95:>9.2f}ms")
+
+        if failures:
+            raise SystemExit(1)
+    finally:
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            conn.commit()
+        conn.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
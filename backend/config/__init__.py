@@ -1,5 +1,13 @@
 from .storage_config import StorageConfig
+from .database_config import DatabaseConfig
+from .search_config import SearchConfig
+from .student_config import StudentConfig
+from .compression_config import CompressionConfig
 
 __all__ = [
-    'StorageConfig'
+    'StorageConfig',
+    'DatabaseConfig',
+    'SearchConfig',
+    'StudentConfig',
+    'CompressionConfig'
 ]
\ No newline at end of file
@@ -0,0 +1,41 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class AdmissionConfig:
+    """Configuration for per-route concurrency limits in front of the database"""
+    
+    # Requests of each class allowed to run at once, and how many more may
+    # wait for a free slot; 0 concurrency turns the limit off. Keep the
+    # concurrency totals at or below DB_POOL_MAX_SIZE.
+    BUDGETS = {
+        # Single-row lookups, list pages and writes
+        'light': {
+            'concurrency': int(os.getenv("ADMISSION_LIGHT_CONCURRENCY", 6)),
+            'queue_size': int(os.getenv("ADMISSION_LIGHT_QUEUE_SIZE", 32))
+        },
+        # Dashboard aggregates, stats, imports and batch writes
+        'heavy': {
+            'concurrency': int(os.getenv("ADMISSION_HEAVY_CONCURRENCY", 2)),
+            'queue_size': int(os.getenv("ADMISSION_HEAVY_QUEUE_SIZE", 8))
+        },
+        # Streaming exports hold their slot for the whole download, so slow
+        # clients must not crowd out the dashboard
+        'export': {
+            'concurrency': int(os.getenv("ADMISSION_EXPORT_CONCURRENCY", 1)),
+            'queue_size': int(os.getenv("ADMISSION_EXPORT_QUEUE_SIZE", 2))
+        },
+        # POST /batch itself; a sequential batch holds one pinned connection
+        # throughout, while its sub-requests also take their own budgets' slots
+        'batch': {
+            'concurrency': int(os.getenv("ADMISSION_BATCH_CONCURRENCY", 1)),
+            'queue_size': int(os.getenv("ADMISSION_BATCH_QUEUE_SIZE", 4))
+        }
+    }
+    
+    # Seconds a queued request waits for a slot before it is turned away
+    QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 2))
+    
+    # Retry-After sent with 503 responses (seconds)
+    RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", 1))
\ No newline at end of file
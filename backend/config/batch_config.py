@@ -0,0 +1,14 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class BatchConfig:
+    """Configuration for POST /batch"""
+    
+    MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", 20))
+    
+    # Threads for parallel batches; each one checks out its own pooled connection
+    MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", 4))
+    
+    METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
\ No newline at end of file
@@ -0,0 +1,31 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class CompressionConfig:
+    """Configuration for response compression and static file caching"""
+    
+    # Bodies smaller than this gain too little to be worth compressing
+    MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    
+    GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 6))
+    
+    # Responses are compressed per request, so a fast quality level is used;
+    # static files are precompressed at maximum quality at build time
+    BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 4))
+    
+    MIMETYPES = {
+        'application/json',
+        'text/html',
+        'text/css',
+        'text/plain',
+        'application/javascript',
+        'text/javascript',
+        'image/svg+xml'
+    }
+    
+    # Vite puts content-hashed files in assets/, e.g. assets/index-C0WcXWwV.js
+    HASHED_ASSET_PATTERN = r'^assets/.+-[\w-]{8}\.\w+$'
+    
+    HASHED_ASSET_MAX_AGE = 31536000  # One year
\ No newline at end of file
@@ -0,0 +1,34 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class DashboardConfig:
+    """Configuration for dashboard aggregates"""
+    
+    # Seconds a computed dashboard section is reused; writes through the
+    # student, program and college services clear it sooner. 0 disables it.
+    CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", 30))
+    
+    # Seconds between reads of the data versions that key the cache, which
+    # is how writes made by other processes are noticed
+    VERSION_CHECK_INTERVAL = float(os.getenv("DASHBOARD_VERSION_CHECK_INTERVAL", 5))
+    
+    # 'exact' reads the trigger-maintained counters from
+    # migrations/0005_table_counters.sql; 'estimated' reads the planner's
+    # pg_class.reltuples, which can lag writes until the next ANALYZE
+    TOTALS_MODES = {'exact', 'estimated'}
+    
+    TOTALS_MODE = os.getenv("DASHBOARD_TOTALS_MODE", "exact").lower()
+    if TOTALS_MODE not in TOTALS_MODES:
+        TOTALS_MODE = 'exact'
+    
+    # /dashboard/stream sends a comment line this often so proxies keep idle streams open
+    STREAM_HEARTBEAT = float(os.getenv("DASHBOARD_STREAM_HEARTBEAT", 15))
+    
+    # Changes buffered per stream client before it is told to resync instead
+    STREAM_QUEUE_SIZE = int(os.getenv("DASHBOARD_STREAM_QUEUE_SIZE", 100))
+    
+    # Days /dashboard/trends covers without from/to, and the most it will return
+    TRENDS_DEFAULT_DAYS = 30
+    TRENDS_MAX_DAYS = 366
\ No newline at end of file
@@ -0,0 +1,19 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class DatabaseConfig:
+    """Configuration for the PostgreSQL connection pool"""
+
+    POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+    POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+
+    # Seconds a request waits for a free connection before giving up
+    POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+
+    # Connections older than this are closed and replaced (seconds)
+    POOL_MAX_AGE = float(os.getenv("DB_POOL_MAX_AGE", 1800))
+
+    # Idle connections unused for longer than this are pinged before reuse (seconds)
+    POOL_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", 30))
@@ -0,0 +1,20 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ProfilingConfig:
+    """Configuration for ?profile=1 request profiling"""
+    
+    # 'off' ignores ?profile=1; profiling is only ever run for authenticated requests
+    MODES = {'on', 'off'}
+    
+    MODE = os.getenv("REQUEST_PROFILING", "on").lower()
+    if MODE not in MODES:
+        MODE = 'on'
+    
+    # Functions listed in the returned profile, by cumulative time
+    TOP_FUNCTIONS = int(os.getenv("REQUEST_PROFILE_TOP_FUNCTIONS", 30))
+    
+    # Directory .prof files are written to for snakeviz or flameprof; empty keeps none
+    OUTPUT_DIR = os.getenv("REQUEST_PROFILE_DIR", "")
\ No newline at end of file
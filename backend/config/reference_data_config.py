@@ -0,0 +1,11 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ReferenceDataConfig:
+    """Configuration for the in-memory college and program snapshot"""
+    
+    # Seconds between data version checks; writes made through this process
+    # refresh the snapshot on the next read regardless
+    CHECK_INTERVAL = float(os.getenv("REFERENCE_DATA_CHECK_INTERVAL", 5))
\ No newline at end of file
@@ -0,0 +1,16 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class SearchConfig:
+    """Configuration for list search"""
+    
+    # 'like' runs LOWER(col) LIKE on every searchable column.
+    # 'trigram' matches one indexed search document per table and can rank
+    # by relevance; it needs migrations/0002_search_trigram_indexes.sql.
+    ENGINES = {'like', 'trigram'}
+    
+    ENGINE = os.getenv("SEARCH_ENGINE", "like").lower()
+    if ENGINE not in ENGINES:
+        ENGINE = 'like'
\ No newline at end of file
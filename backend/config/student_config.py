@@ -0,0 +1,12 @@
+class StudentConfig:
+    """Allowed student field values, mirroring the frontend forms"""
+    
+    YEAR_LEVELS = ['1st', '2nd', '3rd', '4th', '4th+']
+    
+    GENDERS = ['Male', 'Female', 'Others', 'Prefer not to say']
+    
+    # Rows validated and copied into the staging table per round
+    IMPORT_BATCH_SIZE = 1000
+    
+    # Most student IDs a single batch update or delete may list
+    BATCH_MAX_IDS = 5000
\ No newline at end of file
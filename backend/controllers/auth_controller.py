@@ -2,7 +2,9 @@ from flask import request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from services.auth_service import AuthService
 from utils.validators import ValidationError
+from utils.timing import timed_layer
 
+@timed_layer('controller')
 class AuthController:
     def __init__(self):
         self.auth_service = AuthService()
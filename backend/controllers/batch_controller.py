@@ -0,0 +1,130 @@
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from flask import request, jsonify, current_app
+from werkzeug.http import is_hop_by_hop_header
+from werkzeug.test import EnvironBuilder
+from config.batch_config import BatchConfig
+from db import pinned_connection
+from utils.auth import VERIFIED_JWT_KEY, get_verified_jwt
+from utils.exceptions import ValidationError
+from utils.timing import timed_layer
+
+@timed_layer('controller')
+class BatchController:
+    # Only content negotiation carries over; no Accept-Encoding, so
+    # sub-responses are not compressed twice. Auth is passed as the
+    # already verified JWT instead of the Authorization header.
+    FORWARDED_HEADERS = ('Accept',)
+    
+    # Dropped from each sub-request's own headers, besides hop-by-hop ones:
+    # the batch response is compressed once, and bodies are sized by the builder
+    IGNORED_HEADERS = frozenset(('accept-encoding', 'content-length', 'content-encoding'))
+    
+    # Headers worth returning with each sub-response
+    RETURNED_HEADERS = ('Content-Type', 'ETag', 'Cache-Control', 'Location', 'Retry-After', 'Server-Timing')
+    
+    def _parse_requests(self, data):
+        """Validate the sub-request list, returning (method, path, headers, body) tuples"""
+        if not isinstance(data, dict) or not isinstance(data.get('requests'), list):
+            raise ValidationError("Body must be an object with a 'requests' list")
+        items = data['requests']
+        if not items:
+            raise ValidationError("requests must not be empty")
+        if len(items) > BatchConfig.MAX_REQUESTS:
+            raise ValidationError(f"At most {BatchConfig.MAX_REQUESTS} requests per batch")
+        
+        parsed = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValidationError(f"Request {index} must be an object")
+            method = str(item.get('method', 'GET')).upper()
+            path = item.get('path')
+            headers = item.get('headers') or {}
+            if method not in BatchConfig.METHODS:
+                raise ValidationError(f"Request {index}: method must be one of {', '.join(sorted(BatchConfig.METHODS))}")
+            if not isinstance(path, str) or not path.startswith('/'):
+                raise ValidationError(f"Request {index}: path must start with '/'")
+            if path.split('?', 1)[0].rstrip('/') == '/batch':
+                raise ValidationError(f"Request {index}: batches cannot be nested")
+            if not isinstance(headers, dict):
+                raise ValidationError(f"Request {index}: headers must be an object")
+            headers = {
+                name: value for name, value in headers.items()
+                if name.lower() not in self.IGNORED_HEADERS and not is_hop_by_hop_header(name)
+            }
+            parsed.append((method, path, headers, item.get('body')))
+        return parsed
+    
+    def _dispatch(self, app, forwarded, verified_jwt, method, path, headers, body):
+        """Run one sub-request through the app's normal dispatch, in-process"""
+        builder = EnvironBuilder(
+            path=path,
+            method=method,
+            headers={**forwarded, **headers},
+            json=body if body is not None and method != 'GET' else None
+        )
+        try:
+            environ = builder.get_environ()
+        finally:
+            builder.close()
+        # Sub-requests run as the batch's user without decoding the token again
+        environ[VERIFIED_JWT_KEY] = verified_jwt
+        
+        try:
+            with app.request_context(environ):
+                response = app.full_dispatch_request()
+        except Exception as e:
+            return {'status': 500, 'headers': {}, 'body': {'error': str(e)}}
+        
+        if response.direct_passthrough:
+            # Files are read whole like any other body
+            response.direct_passthrough = False
+        elif inspect.isgenerator(response.response):
+            # Streams (exports, /dashboard/stream) may be huge or never end
+            response.close()
+            return {'status': 400, 'headers': {}, 'body': {'error': "Streaming endpoints cannot be batched"}}
+        
+        try:
+            return {
+                'status': response.status_code,
+                'headers': {
+                    name: response.headers[name]
+                    for name in self.RETURNED_HEADERS if name in response.headers
+                },
+                'body': response.get_json(silent=True) if response.is_json else response.get_data(as_text=True)
+            }
+        finally:
+            # Runs close callbacks, e.g. releasing an admission slot
+            response.close()
+    
+    def dispatch(self):
+        """Run several API requests in one round trip, returning their responses in order"""
+        try:
+            data = request.get_json(silent=True)
+            items = self._parse_requests(data)
+            parallel = bool(data.get('parallel', False))
+            
+            app = current_app._get_current_object()
+            verified_jwt = get_verified_jwt()
+            forwarded = {
+                name: request.headers[name]
+                for name in self.FORWARDED_HEADERS if name in request.headers
+            }
+            
+            if parallel and len(items) > 1:
+                # Independent requests: each worker thread uses its own pooled connection
+                with ThreadPoolExecutor(max_workers=min(BatchConfig.MAX_WORKERS, len(items))) as executor:
+                    responses = list(executor.map(
+                        lambda item: self._dispatch(app, forwarded, verified_jwt, *item), items
+                    ))
+            else:
+                # In order, sharing one pooled connection
+                with pinned_connection():
+                    responses = [self._dispatch(app, forwarded, verified_jwt, *item) for item in items]
+            
+            return jsonify({'responses': responses}), 200
+            
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
\ No newline at end of file
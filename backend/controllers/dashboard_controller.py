@@ -1,6 +1,10 @@
-from flask import jsonify
+from flask import request, jsonify, Response
 from services.dashboard_service import DashboardService
+from utils.sse import KEEPALIVE, format_event
+from utils.exceptions import ValidationError
+from utils.timing import timed_layer
 
+@timed_layer('controller')
 class DashboardController:
     def __init__(self):
         self.dashboard_service = DashboardService()
@@ -43,4 +47,62 @@ class DashboardController:
             data = self.dashboard_service.get_college_stats()
             return jsonify(data), 200
         except Exception as e:
-            return jsonify({'error': str(e)}), 500
\ No newline at end of file
+            return jsonify({'error': str(e)}), 500
+    
+    def get_trends(self):
+        """Get daily enrollment trends"""
+        try:
+            filters = {
+                field: request.args.get(field, '', type=str)
+                for field in ('program_code', 'college_code', 'year_level', 'gender')
+            }
+            data = self.dashboard_service.get_trends(
+                group_by=request.args.get('group_by', 'total', type=str),
+                start=request.args.get('from', None, type=str),
+                end=request.args.get('to', None, type=str),
+                filters=filters
+            )
+            return jsonify(data), 200
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    def trend_range_key(self):
+        """ETag input for the dates a trends request resolves to, which move with today"""
+        try:
+            start, end = self.dashboard_service.resolve_trend_range(
+                request.args.get('from', None, type=str),
+                request.args.get('to', None, type=str)
+            )
+        except ValidationError:
+            # Answered with 400, which carries no ETag
+            return ''
+        return f"{start.isoformat()}:{end.isoformat()}"
+    
+    def stream(self):
+        """Stream a dashboard snapshot, then each count change, as Server-Sent Events"""
+        try:
+            snapshot, subscription = self.dashboard_service.open_change_stream()
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+        
+        def events():
+            yield format_event('snapshot', snapshot)
+            while True:
+                change = self.dashboard_service.next_change(subscription)
+                if change is None:
+                    yield KEEPALIVE
+                elif change['type'] == 'resync':
+                    yield format_event('resync', change)
+                else:
+                    yield format_event('change', change)
+        
+        response = Response(
+            events(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+        # Runs on disconnect, and also when the body is never iterated
+        response.call_on_close(lambda: self.dashboard_service.close_change_stream(subscription))
+        return response
\ No newline at end of file
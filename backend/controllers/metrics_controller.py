@@ -0,0 +1,16 @@
+from flask import jsonify
+from db import get_pool_stats
+from utils.admission import get_admission_stats
+from utils.timing import timed_layer
+
+@timed_layer('controller')
+class MetricsController:
+    def get_admission(self):
+        """Get admission budget usage alongside the connection pool it protects"""
+        try:
+            return jsonify({
+                'admission': get_admission_stats(),
+                'pool': get_pool_stats()
+            }), 200
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
\ No newline at end of file
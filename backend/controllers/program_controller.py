@@ -1,7 +1,9 @@
 from flask import request, jsonify
 from services.program_service import ProgramService
-from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError
+from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError, ValidationError
+from utils.timing import timed_layer
 
+@timed_layer('controller')
 class ProgramController:
     def __init__(self):
         self.program_service = ProgramService()
@@ -15,6 +17,13 @@ class ProgramController:
             search = request.args.get('search', '', type=str)
             sort_field = request.args.get('sort_field', 'program_code', type=str)
             sort_direction = request.args.get('sort_direction', 'asc', type=str)
+            fields = request.args.get('fields', '', type=str)
+            
+            # ?format=columnar returns {columns, rows} instead of one object per row
+            response_format = request.args.get('format', 'objects', type=str).lower()
+            if response_format not in ('objects', 'columnar'):
+                return jsonify({'error': "Unsupported format. Allowed formats: objects, columnar"}), 400
+            columnar = response_format == 'columnar'
             
             # Validate pagination parameters
             if page < 1:
@@ -22,11 +31,20 @@ class ProgramController:
             if per_page < 1 or per_page > 100:  # Max 100 items per page
                 per_page = 10
             
-            result = self.program_service.get_all_programs(
-                page, per_page, search, sort_field, sort_direction
-            )
+            # Opt-in keyset pagination: ?pagination=cursor starts it, ?cursor= continues it
+            cursor = request.args.get('cursor', type=str)
+            if cursor is not None or request.args.get('pagination') == 'cursor':
+                result = self.program_service.get_programs_by_cursor(
+                    per_page, search, sort_field, sort_direction, cursor, fields, columnar
+                )
+            else:
+                result = self.program_service.get_all_programs(
+                    page, per_page, search, sort_field, sort_direction, fields, columnar
+                )
             
             return jsonify(result), 200
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
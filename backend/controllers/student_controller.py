@@ -1,11 +1,26 @@
-from flask import request, jsonify
+from flask import request, jsonify, Response, stream_with_context
 from services.student_service import StudentService
-from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError
+from utils.export import EXPORT_MIMETYPES, prefetch_first, stream_csv, stream_ndjson
+from utils.importers import read_csv_records, read_json_records
+from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError, ValidationError
+from utils.timing import timed_layer
 
+@timed_layer('controller')
 class StudentController:
     def __init__(self):
         self.student_service = StudentService()
     
+    def _get_filters(self):
+        """Get filter parameters from the query string"""
+        filters = {}
+        if request.args.get('gender'):
+            filters['gender'] = request.args.get('gender', type=str)
+        if request.args.get('year_level'):
+            filters['year_level'] = request.args.get('year_level', type=str)
+        if request.args.get('program_code'):
+            filters['program_code'] = request.args.get('program_code', type=str)
+        return filters
+    
     def get_all(self):
         """Get all students with pagination, search, sorting, and filtering"""
         try:
@@ -15,15 +30,17 @@ class StudentController:
             search = request.args.get('search', '', type=str)
             sort_field = request.args.get('sort_field', 'id_number', type=str)
             sort_direction = request.args.get('sort_direction', 'asc', type=str)
+            fields = request.args.get('fields', '', type=str)
+            # ?expand=program,college adds the program's name and college to each row
+            expand = request.args.get('expand', '', type=str)
+            
+            # ?format=columnar returns {columns, rows} instead of one object per row
+            response_format = request.args.get('format', 'objects', type=str).lower()
+            if response_format not in ('objects', 'columnar'):
+                return jsonify({'error': "Unsupported format. Allowed formats: objects, columnar"}), 400
+            columnar = response_format == 'columnar'
             
-            # Get filter parameters
-            filters = {}
-            if request.args.get('gender'):
-                filters['gender'] = request.args.get('gender', type=str)
-            if request.args.get('year_level'):
-                filters['year_level'] = request.args.get('year_level', type=str)
-            if request.args.get('program_code'):
-                filters['program_code'] = request.args.get('program_code', type=str)
+            filters = self._get_filters()
             
             # Validate pagination parameters
             if page < 1:
@@ -31,12 +48,99 @@ class StudentController:
             if per_page < 1 or per_page > 100:  # Max 100 items per page
                 per_page = 10
             
-            result = self.student_service.get_all_students(
-                page, per_page, search, sort_field, sort_direction, filters if filters else None
-            )
+            # Opt-in keyset pagination: ?pagination=cursor starts it, ?cursor= continues it
+            cursor = request.args.get('cursor', type=str)
+            if cursor is not None or request.args.get('pagination') == 'cursor':
+                result = self.student_service.get_students_by_cursor(
+                    per_page, search, sort_field, sort_direction, filters if filters else None, cursor, fields, columnar, expand
+                )
+            else:
+                result = self.student_service.get_all_students(
+                    page, per_page, search, sort_field, sort_direction, filters if filters else None, fields, columnar, expand
+                )
             
             return jsonify(result), 200
             
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    def get_one(self, student_id):
+        """Get a single student, optionally expanded with program and college fields"""
+        try:
+            fields = request.args.get('fields', '', type=str)
+            expand = request.args.get('expand', '', type=str)
+            
+            student = self.student_service.get_student(student_id, fields, expand)
+            return jsonify(student), 200
+            
+        except NotFoundError as e:
+            return jsonify({'error': str(e)}), 404
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    def export(self):
+        """Stream all matching students as CSV or NDJSON"""
+        try:
+            export_format = request.args.get('format', 'csv', type=str).lower()
+            if export_format not in EXPORT_MIMETYPES:
+                return jsonify({
+                    'error': f"Unsupported export format. Allowed formats: {', '.join(EXPORT_MIMETYPES)}"
+                }), 400
+            
+            search = request.args.get('search', '', type=str)
+            sort_field = request.args.get('sort_field', 'id_number', type=str)
+            sort_direction = request.args.get('sort_direction', 'asc', type=str)
+            filters = self._get_filters()
+            
+            columns, rows = self.student_service.export_students(
+                search, sort_field, sort_direction, filters if filters else None
+            )
+            
+            # Run the query now so errors still get a proper status code
+            rows = prefetch_first(rows)
+            
+            if export_format == 'csv':
+                body = stream_csv(rows, columns)
+            else:
+                body = stream_ndjson(rows)
+            
+            return Response(
+                stream_with_context(body),
+                mimetype=EXPORT_MIMETYPES[export_format],
+                headers={'Content-Disposition': f'attachment; filename=students.{export_format}'}
+            )
+            
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    def import_students(self):
+        """Bulk-import students from an uploaded CSV/JSON file or a JSON body"""
+        try:
+            on_conflict = request.args.get('on_conflict', 'skip', type=str).lower()
+            upload = request.files.get('file')
+            
+            if upload:
+                import_format = request.args.get('format', type=str)
+                if not import_format:
+                    import_format = 'json' if upload.filename.lower().endswith('.json') else 'csv'
+                if import_format.lower() == 'json':
+                    records = read_json_records(upload.stream)
+                else:
+                    records = read_csv_records(upload.stream)
+            elif request.is_json:
+                records = read_json_records(request.get_json(silent=True))
+            else:
+                return jsonify({'error': "Provide a CSV/JSON 'file' upload or a JSON body"}), 400
+            
+            report = self.student_service.import_students(records, on_conflict)
+            return jsonify(report), 200
+            
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
@@ -85,6 +189,36 @@ class StudentController:
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     
+    def batch_update(self):
+        """Apply the same changes to many students"""
+        try:
+            data = request.get_json(silent=True) or {}
+            
+            result = self.student_service.batch_update_students(
+                data.get('changes'), data.get('ids'), data.get('filters')
+            )
+            return jsonify(result), 200
+            
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except ForeignKeyError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
+    def batch_delete(self):
+        """Delete many students"""
+        try:
+            data = request.get_json(silent=True) or {}
+            
+            result = self.student_service.batch_delete_students(data.get('ids'), data.get('filters'))
+            return jsonify(result), 200
+            
+        except ValidationError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    
     def get_students_per_program(self):
         """Get number of students per program"""
         try:
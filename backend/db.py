@@ -1,7 +1,13 @@
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from supabase import create_client
+from config.database_config import DatabaseConfig
+from utils.connection_pool import ConnectionPool
+from utils.notification_listener import NotificationListener
+import contextvars
+import threading
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,8 +16,81 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
-def get_connection():
+_pool = None
+_pool_lock = threading.Lock()
+
+# Set by pinned_connection() so every get_connection() in the context shares one connection
+_pinned_connection = contextvars.ContextVar('pinned_connection', default=None)
+# How many get_connection() blocks are open on the pinned connection; only the outermost ends the transaction
+_pinned_depth = contextvars.ContextVar('pinned_depth', default=0)
+
+def _connect():
     return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
 
+def get_pool():
+    """Get the process-wide connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _connect,
+                    min_size=DatabaseConfig.POOL_MIN_SIZE,
+                    max_size=DatabaseConfig.POOL_MAX_SIZE,
+                    timeout=DatabaseConfig.POOL_TIMEOUT,
+                    max_age=DatabaseConfig.POOL_MAX_AGE,
+                    health_check_interval=DatabaseConfig.POOL_HEALTH_CHECK_INTERVAL
+                )
+    return _pool
+
+def get_connection():
+    """Check out a pooled connection; returned to the pool when the with block exits"""
+    pinned = _pinned_connection.get()
+    if pinned is not None:
+        return _use_pinned(pinned)
+    return get_pool().connection()
+
+@contextmanager
+def _use_pinned(conn):
+    """Commit or roll back like a pooled checkout, but keep the connection checked out.
+
+    A get_connection() nested inside another one on the same pinned
+    connection joins the outer transaction instead of ending it.
+    """
+    depth = _pinned_depth.get()
+    token = _pinned_depth.set(depth + 1)
+    try:
+        yield conn
+    except BaseException:
+        if depth == 0:
+            conn.rollback()
+        raise
+    else:
+        if depth == 0:
+            conn.commit()
+    finally:
+        _pinned_depth.reset(token)
+
+@contextmanager
+def pinned_connection():
+    """Serve every get_connection() in this context (and thread) from one pooled connection"""
+    with get_pool().connection() as conn:
+        token = _pinned_connection.set(conn)
+        try:
+            yield conn
+        finally:
+            _pinned_connection.reset(token)
+
+def create_listener(listen_query, queue_size=100):
+    """Create a shared LISTEN connection; it connects when the first subscriber arrives"""
+    return NotificationListener(
+        lambda: psycopg2.connect(DATABASE_URL),
+        listen_query,
+        queue_size=queue_size
+    )
+
+def get_pool_stats():
+    return get_pool().stats()
+
 def get_supabase_client():
     return create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
\ No newline at end of file
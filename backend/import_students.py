@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Bulk-import students from a CSV or JSON file.
+
+CSV files need a header row with id_number, first_name, last_name,
+year_level, gender and program_code. JSON files hold a list of objects
+with the same fields, or {"students": [...]}.
+
+    python import_students.py roster.csv
+    python import_students.py roster.json --on-conflict update
+"""
+
+import argparse
+import json
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.student_service import StudentService
+from utils.exceptions import ValidationError
+from utils.importers import read_csv_records, read_json_records
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-import students from CSV or JSON")
+    parser.add_argument('file', help='CSV or JSON file to import')
+    parser.add_argument('--format', choices=['csv', 'json'],
+                        help='File format (default: guessed from the extension)')
+    parser.add_argument('--on-conflict', choices=['skip', 'update'], default='skip',
+                        help='What to do with student IDs that already exist (default: skip)')
+    parser.add_argument('--report', metavar='PATH', help='Also write the full report as JSON')
+    args = parser.parse_args(argv)
+
+    import_format = args.format or ('json' if args.file.lower().endswith('.json') else 'csv')
+
+    try:
+        with open(args.file, 'rb') as f:
+            if import_format == 'json':
+                records = read_json_records(f)
+            else:
+                records = read_csv_records(f)
+            report = StudentService().import_students(records, args.on_conflict)
+    except ValidationError as e:
+        raise SystemExit(f"Import failed: {e}")
+
+    print(f"{report['total']} rows: {report['inserted']} inserted, {report['updated']} updated, "
+          f"{report['skipped']} skipped, {report['failed']} failed")
+    for error in report['errors']:
+        print(f"  row {error['row']} ({error['id_number']}): {error['error']}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    return 1 if report['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Versioned schema migrations.
+
+Migrations are the numbered .sql files in migrations/, applied in order.
+Each file runs in its own transaction and is recorded in schema_migrations.
+
+    python migrate.py                    # apply all pending migrations
+    python migrate.py upgrade --to 0001  # apply pending migrations up to a version
+    python migrate.py status             # list applied and pending migrations
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+import psycopg2
+from dotenv import load_dotenv
+
+from queries.migration_queries import MigrationQueries
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILENAME = re.compile(r'^(\d+)_([\w-]+)\.sql$')
+
+# Arbitrary key for the advisory lock held while migrating
+LOCK_KEY = 181_000_001
+
+class Migration:
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+
+        with open(path, encoding='utf-8') as f:
+            self.sql = f.read()
+        self.checksum = hashlib.sha256(self.sql.encode('utf-8')).hexdigest()
+
+def discover_migrations(directory=MIGRATIONS_DIR):
+    """Load migration files in version order"""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILENAME.match(filename)
+        if match:
+            migrations.append(
+                Migration(match.group(1), match.group(2), os.path.join(directory, filename))
+            )
+
+    migrations.sort(key=lambda m: int(m.version))
+
+    versions = [int(m.version) for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise SystemExit("Duplicate migration versions in migrations/")
+
+    return migrations
+
+def get_applied(conn):
+    """Get applied migrations keyed by version"""
+    queries = MigrationQueries()
+    with conn.cursor() as cur:
+        cur.execute(queries.CREATE_TRACKING_TABLE)
+        cur.execute(queries.FIND_APPLIED)
+        rows = cur.fetchall()
+    conn.commit()
+    return {row[0]: {'name': row[1], 'checksum': row[2], 'applied_at': row[3]} for row in rows}
+
+def upgrade(conn, target=None):
+    """Apply pending migrations up to and including target"""
+    queries = MigrationQueries()
+
+    with conn.cursor() as cur:
+        cur.execute(queries.ACQUIRE_LOCK, (LOCK_KEY,))
+    conn.commit()
+
+    try:
+        applied = get_applied(conn)
+        pending = [
+            m for m in discover_migrations()
+            if m.version not in applied and (target is None or int(m.version) <= int(target))
+        ]
+
+        if not pending:
+            print("No pending migrations.")
+            return
+
+        for migration in pending:
+            print(f"Applying {migration.version}_{migration.name}...")
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(migration.sql)
+                    cur.execute(
+                        queries.INSERT_APPLIED,
+                        (migration.version, migration.name, migration.checksum)
+                    )
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise SystemExit(f"Migration {migration.version}_{migration.name} failed: {e}")
+
+        print(f"Applied {len(pending)} migration(s).")
+    finally:
+        with conn.cursor() as cur:
+            cur.execute(queries.RELEASE_LOCK, (LOCK_KEY,))
+        conn.commit()
+
+def status(conn):
+    """Print applied and pending migrations"""
+    applied = get_applied(conn)
+
+    for migration in discover_migrations():
+        record = applied.get(migration.version)
+        if not record:
+            state = "pending"
+        elif record['checksum'] != migration.checksum:
+            state = f"applied {record['applied_at']:%Y-%m-%d %H:%M} (file changed since)"
+        else:
+            state = f"applied {record['applied_at']:%Y-%m-%d %H:%M}"
+        print(f"{migration.version}_{migration.name:<40} {state}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    subparsers = parser.add_subparsers(dest='command')
+
+    upgrade_parser = subparsers.add_parser('upgrade', help='Apply pending migrations (default)')
+    upgrade_parser.add_argument('--to', metavar='VERSION', help='Stop after this version')
+    subparsers.add_parser('status', help='List applied and pending migrations')
+
+    args = parser.parse_args(argv)
+
+    if not DATABASE_URL:
+        raise SystemExit("DATABASE_URL is not set")
+
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        if args.command == 'status':
+            status(conn)
+        else:
+            upgrade(conn, getattr(args, 'to', None))
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,16 @@
+-- Indexes for the hot list, filter and dashboard queries.
+
+-- StudentRepository.find_all filters on program_code, year_level and gender
+-- in any combination. The leading program_code column also serves the
+-- students(program_code) foreign key and the programs -> students joins.
+CREATE INDEX IF NOT EXISTS idx_students_program_year_gender
+    ON students (program_code, year_level, gender);
+
+-- Year level filters without a program, optionally narrowed by gender.
+-- Gender alone matches about half the roster, so it gets no index of its own.
+CREATE INDEX IF NOT EXISTS idx_students_year_gender
+    ON students (year_level, gender);
+
+-- colleges -> programs joins in the dashboard and college stats.
+CREATE INDEX IF NOT EXISTS idx_programs_college_code
+    ON programs (college_code);
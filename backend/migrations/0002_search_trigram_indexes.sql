@@ -0,0 +1,47 @@
+-- Trigram indexes backing SEARCH_ENGINE=trigram.
+--
+-- Each table gets one GIN index over a lower-cased search document. The
+-- expressions must stay identical to the SEARCH_DOCUMENT expressions in
+-- queries/, otherwise the planner cannot match them to the index.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Casting year_level to text is not IMMUTABLE when it is an enum, so the
+-- student document cannot be an index expression. It is kept in a column
+-- maintained by a trigger instead.
+ALTER TABLE students ADD COLUMN IF NOT EXISTS search_document TEXT;
+
+CREATE OR REPLACE FUNCTION students_search_document() RETURNS trigger AS $$
+BEGIN
+    NEW.search_document := LOWER(
+        NEW.id_number || ' ' || NEW.first_name || ' ' || NEW.last_name || ' ' ||
+        COALESCE(NEW.program_code, '') || ' ' || CAST(NEW.year_level AS TEXT)
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_students_search_document ON students;
+CREATE TRIGGER trg_students_search_document
+    BEFORE INSERT OR UPDATE OF id_number, first_name, last_name, program_code, year_level
+    ON students
+    FOR EACH ROW EXECUTE FUNCTION students_search_document();
+
+UPDATE students
+SET search_document = LOWER(
+    id_number || ' ' || first_name || ' ' || last_name || ' ' ||
+    COALESCE(program_code, '') || ' ' || CAST(year_level AS TEXT)
+);
+
+CREATE INDEX IF NOT EXISTS idx_students_search_trgm
+    ON students USING GIN (search_document gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_programs_search_trgm
+    ON programs USING GIN ((LOWER(
+        program_code || ' ' || program_name || ' ' || COALESCE(college_code, '')
+    )) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_colleges_search_trgm
+    ON colleges USING GIN ((LOWER(
+        college_code || ' ' || college_name
+    )) gin_trgm_ops);
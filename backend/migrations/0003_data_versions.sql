@@ -0,0 +1,11 @@
+-- Per-table data versions behind the ETags of list and dropdown endpoints.
+-- The services layer bumps a table's version after every write to it.
+
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name VARCHAR(64) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1
+);
+
+INSERT INTO data_versions (table_name)
+VALUES ('colleges'), ('programs'), ('students')
+ON CONFLICT (table_name) DO NOTHING;
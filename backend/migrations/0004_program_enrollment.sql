@@ -0,0 +1,28 @@
+-- Materialized student counts per program, read by the dashboard and stats
+-- endpoints instead of joining and grouping every student per request.
+-- The repositories apply +1/-1 deltas in the same transaction as each
+-- student, program and college write; python rebuild_aggregates.py
+-- recomputes everything from scratch.
+
+CREATE TABLE IF NOT EXISTS program_enrollment (
+    program_code VARCHAR(20) PRIMARY KEY,
+    student_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- Per-college counts roll up the per-program rows, O(#programs)
+CREATE OR REPLACE VIEW college_enrollment AS
+SELECT
+    c.college_code,
+    COUNT(p.program_code) AS program_count,
+    COALESCE(SUM(e.student_count), 0) AS student_count
+FROM colleges c
+LEFT JOIN programs p ON p.college_code = c.college_code
+LEFT JOIN program_enrollment e ON e.program_code = p.program_code
+GROUP BY c.college_code;
+
+INSERT INTO program_enrollment (program_code, student_count)
+SELECT p.program_code, COUNT(s.id_number)
+FROM programs p
+LEFT JOIN students s ON s.program_code = p.program_code
+GROUP BY p.program_code
+ON CONFLICT (program_code) DO UPDATE SET student_count = EXCLUDED.student_count;
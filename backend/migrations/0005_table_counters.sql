@@ -0,0 +1,74 @@
+-- Exact row counts for /dashboard/totals without scanning the tables.
+-- Statement-level triggers add or subtract the rows each INSERT or DELETE
+-- touched, in the writer's transaction, so bulk imports cost one update.
+
+-- Hold off writers while the counts are seeded and the triggers installed
+LOCK TABLE colleges, programs, students IN SHARE MODE;
+
+CREATE TABLE IF NOT EXISTS table_counters (
+    table_name VARCHAR(64) PRIMARY KEY,
+    row_count BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO table_counters (table_name, row_count)
+VALUES
+    ('colleges', (SELECT COUNT(*) FROM colleges)),
+    ('programs', (SELECT COUNT(*) FROM programs)),
+    ('students', (SELECT COUNT(*) FROM students))
+ON CONFLICT (table_name) DO UPDATE SET row_count = EXCLUDED.row_count;
+
+CREATE OR REPLACE FUNCTION count_table_rows() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE table_counters
+        SET row_count = row_count + (SELECT COUNT(*) FROM inserted_rows)
+        WHERE table_name = TG_TABLE_NAME;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE table_counters
+        SET row_count = row_count - (SELECT COUNT(*) FROM deleted_rows)
+        WHERE table_name = TG_TABLE_NAME;
+    ELSE
+        UPDATE table_counters
+        SET row_count = 0
+        WHERE table_name = TG_TABLE_NAME;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS colleges_count_insert ON colleges;
+CREATE TRIGGER colleges_count_insert AFTER INSERT ON colleges
+    REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS colleges_count_delete ON colleges;
+CREATE TRIGGER colleges_count_delete AFTER DELETE ON colleges
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS colleges_count_truncate ON colleges;
+CREATE TRIGGER colleges_count_truncate AFTER TRUNCATE ON colleges
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+
+DROP TRIGGER IF EXISTS programs_count_insert ON programs;
+CREATE TRIGGER programs_count_insert AFTER INSERT ON programs
+    REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS programs_count_delete ON programs;
+CREATE TRIGGER programs_count_delete AFTER DELETE ON programs
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS programs_count_truncate ON programs;
+CREATE TRIGGER programs_count_truncate AFTER TRUNCATE ON programs
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+
+DROP TRIGGER IF EXISTS students_count_insert ON students;
+CREATE TRIGGER students_count_insert AFTER INSERT ON students
+    REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS students_count_delete ON students;
+CREATE TRIGGER students_count_delete AFTER DELETE ON students
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
+DROP TRIGGER IF EXISTS students_count_truncate ON students;
+CREATE TRIGGER students_count_truncate AFTER TRUNCATE ON students
+    FOR EACH STATEMENT EXECUTE FUNCTION count_table_rows();
\ No newline at end of file
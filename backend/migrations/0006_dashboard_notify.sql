@@ -0,0 +1,69 @@
+-- Publish dashboard count changes on the dashboard_changes channel for the
+-- /dashboard/stream listener. The triggers sit on the aggregate tables, so
+-- every student, program and college write that moves a count announces it,
+-- and NOTIFY only delivers once the writing transaction commits.
+-- Payloads carry the delta and the new count; Postgres drops identical
+-- payloads sent twice in one transaction, so clients should trust count.
+-- A full rebuild (rebuild_aggregates.py) ends with a {"type": "resync"}
+-- message telling clients to refetch instead.
+
+CREATE OR REPLACE FUNCTION notify_total_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('dashboard_changes', json_build_object(
+        'type', 'total',
+        'table', NEW.table_name,
+        'delta', NEW.row_count - OLD.row_count,
+        'count', NEW.row_count
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS table_counters_notify ON table_counters;
+CREATE TRIGGER table_counters_notify AFTER UPDATE ON table_counters
+    FOR EACH ROW WHEN (NEW.row_count <> OLD.row_count)
+    EXECUTE FUNCTION notify_total_change();
+
+CREATE OR REPLACE FUNCTION notify_enrollment_change() RETURNS trigger AS $$
+DECLARE
+    changed_code VARCHAR(20);
+    previous_code VARCHAR(20);
+    college VARCHAR(20);
+    new_count INTEGER;
+    delta INTEGER;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed_code := OLD.program_code;
+        new_count := 0;
+        delta := -OLD.student_count;
+    ELSE
+        changed_code := NEW.program_code;
+        new_count := NEW.student_count;
+        delta := NEW.student_count - CASE WHEN TG_OP = 'UPDATE' THEN OLD.student_count ELSE 0 END;
+        IF TG_OP = 'UPDATE' AND NEW.program_code <> OLD.program_code THEN
+            previous_code := OLD.program_code;
+        END IF;
+    END IF;
+
+    IF delta = 0 AND previous_code IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Lets clients roll the change up into their per-college counts
+    SELECT p.college_code INTO college FROM programs p WHERE p.program_code = changed_code;
+
+    PERFORM pg_notify('dashboard_changes', json_build_object(
+        'type', 'program',
+        'program_code', changed_code,
+        'previous_program_code', previous_code,
+        'college_code', college,
+        'delta', delta,
+        'count', new_count
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS program_enrollment_notify ON program_enrollment;
+CREATE TRIGGER program_enrollment_notify AFTER INSERT OR UPDATE OR DELETE ON program_enrollment
+    FOR EACH ROW EXECUTE FUNCTION notify_enrollment_change();
\ No newline at end of file
@@ -0,0 +1,18 @@
+-- Daily enrollment history behind /dashboard/trends. python rollup_enrollment.py
+-- stores one row per program, college, year level and gender with the number
+-- of students in that group when it ran, so trend queries never touch students.
+
+CREATE TABLE IF NOT EXISTS enrollment_daily (
+    day DATE NOT NULL,
+    program_code VARCHAR(20),
+    college_code VARCHAR(20),
+    year_level VARCHAR(10) NOT NULL,
+    gender VARCHAR(20) NOT NULL,
+    student_count INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_enrollment_daily_day ON enrollment_daily (day);
+
+INSERT INTO data_versions (table_name)
+VALUES ('enrollment_daily')
+ON CONFLICT (table_name) DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,82 @@
+-- Dashboard change events for program and college writes that move students
+-- between colleges without touching program_enrollment. Program events
+-- carry previous_college_code so clients can move the program's count out
+-- of its old college; college events tell clients to rename or drop one.
+-- Deleting a college sets its programs' college_code to NULL, and renaming
+-- one cascades to them, so both also arrive as program events.
+
+CREATE OR REPLACE FUNCTION notify_program_change() RETURNS trigger AS $$
+DECLARE
+    enrolled INTEGER;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        -- Runs before the repository drops the program_enrollment row, while
+        -- the program's college is still known
+        SELECT e.student_count INTO enrolled
+        FROM program_enrollment e WHERE e.program_code = OLD.program_code;
+
+        PERFORM pg_notify('dashboard_changes', json_build_object(
+            'type', 'program',
+            'program_code', OLD.program_code,
+            'previous_program_code', NULL,
+            'college_code', OLD.college_code,
+            'previous_college_code', NULL,
+            'delta', -COALESCE(enrolled, 0),
+            'count', 0
+        )::text);
+        RETURN NULL;
+    END IF;
+
+    -- A rename in the same statement is applied to program_enrollment after this
+    SELECT e.student_count INTO enrolled
+    FROM program_enrollment e WHERE e.program_code IN (NEW.program_code, OLD.program_code)
+    ORDER BY e.program_code = NEW.program_code DESC
+    LIMIT 1;
+
+    PERFORM pg_notify('dashboard_changes', json_build_object(
+        'type', 'program',
+        'program_code', NEW.program_code,
+        'previous_program_code', NULLIF(OLD.program_code, NEW.program_code),
+        'college_code', NEW.college_code,
+        'previous_college_code', OLD.college_code,
+        'delta', 0,
+        'count', COALESCE(enrolled, 0)
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS programs_notify ON programs;
+CREATE TRIGGER programs_notify AFTER UPDATE OF college_code ON programs
+    FOR EACH ROW WHEN (OLD.college_code IS DISTINCT FROM NEW.college_code)
+    EXECUTE FUNCTION notify_program_change();
+
+DROP TRIGGER IF EXISTS programs_notify_delete ON programs;
+CREATE TRIGGER programs_notify_delete AFTER DELETE ON programs
+    FOR EACH ROW EXECUTE FUNCTION notify_program_change();
+
+-- Program deletes are announced by programs_notify_delete above; by the time
+-- the program_enrollment row goes, its college can no longer be looked up
+DROP TRIGGER IF EXISTS program_enrollment_notify ON program_enrollment;
+CREATE TRIGGER program_enrollment_notify AFTER INSERT OR UPDATE ON program_enrollment
+    FOR EACH ROW EXECUTE FUNCTION notify_enrollment_change();
+
+CREATE OR REPLACE FUNCTION notify_college_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('dashboard_changes', json_build_object(
+        'type', 'college',
+        'college_code', CASE WHEN TG_OP = 'DELETE' THEN NULL ELSE NEW.college_code END,
+        'previous_college_code', OLD.college_code
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS colleges_notify ON colleges;
+CREATE TRIGGER colleges_notify AFTER UPDATE OF college_code ON colleges
+    FOR EACH ROW WHEN (OLD.college_code IS DISTINCT FROM NEW.college_code)
+    EXECUTE FUNCTION notify_college_change();
+
+DROP TRIGGER IF EXISTS colleges_notify_delete ON colleges;
+CREATE TRIGGER colleges_notify_delete AFTER DELETE ON colleges
+    FOR EACH ROW EXECUTE FUNCTION notify_college_change();
\ No newline at end of file
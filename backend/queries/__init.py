@@ -3,11 +3,17 @@ from .college_queries import CollegeQueries
 from .program_queries import ProgramQueries
 from .student_queries import StudentQueries
 from .dashboard_queries import DashboardQueries
+from .migration_queries import MigrationQueries
+from .data_version_queries import DataVersionQueries
+from .enrollment_queries import EnrollmentQueries
 
 __all__ = [
     'AuthQueries',
     'CollegeQueries',
     'ProgramQueries',
     'StudentQueries',
-    'DashboardQueries'
+    'DashboardQueries',
+    'MigrationQueries',
+    'DataVersionQueries',
+    'EnrollmentQueries'
 ]
\ No newline at end of file
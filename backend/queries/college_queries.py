@@ -1,10 +1,17 @@
 class CollegeQueries:
 
+    # Unfiltered pages join a separate count: a window count would force a
+    # full sort of the table instead of a top-N sort or index scan
     FIND_ALL = """
-        SELECT college_code, college_name
-        FROM colleges
-        ORDER BY {sort_field} {sort_direction}
-        LIMIT %s OFFSET %s;
+        SELECT page.*, totals.total_count
+        FROM (
+            SELECT {select_list}
+            FROM colleges
+            ORDER BY {sort_field} {sort_direction}
+            LIMIT %s OFFSET %s
+        ) page
+        CROSS JOIN (SELECT COUNT(*) AS total_count FROM colleges) totals
+        ORDER BY {sort_field} {sort_direction};
     """
     
     COUNT_ALL = """
@@ -13,23 +20,46 @@ class CollegeQueries:
     """
     
     FIND_ALL_SEARCH = """
-        SELECT college_code, college_name
+        SELECT {select_list},
+            COUNT(*) OVER() AS total_count
         FROM colleges
-        WHERE 
-            LOWER(college_code) LIKE %s OR
-            LOWER(college_name) LIKE %s
-        ORDER BY {sort_field} {sort_direction}
+        WHERE 1=1
+            {search_clause}
+        ORDER BY {order_clause}
         LIMIT %s OFFSET %s;
     """
     
     COUNT_ALL_SEARCH = """
         SELECT COUNT(*) as total
         FROM colleges
-        WHERE 
-            LOWER(college_code) LIKE %s OR
-            LOWER(college_name) LIKE %s;
+        WHERE 1=1
+            {search_clause};
+    """
+    
+    FIND_ALL_KEYSET = """
+        SELECT {select_list}
+        FROM colleges
+        WHERE 1=1
+            {search_clause}
+            {keyset_clause}
+        ORDER BY {order_clause}
+        LIMIT %s;
     """
     
+    SEARCH_CLAUSE = """
+            AND (LOWER(college_code) LIKE %s OR
+            LOWER(college_name) LIKE %s)
+    """
+    
+    # Must match the expression indexed by migrations/0002_search_trigram_indexes.sql
+    SEARCH_DOCUMENT = "LOWER(college_code || ' ' || college_name)"
+    
+    SEARCH_CLAUSE_TRIGRAM = f"""
+            AND {SEARCH_DOCUMENT} LIKE %s
+    """
+    
+    SEARCH_RANK_TRIGRAM = f"word_similarity(%s, {SEARCH_DOCUMENT})"
+    
     FIND_BY_CODE = """
         SELECT college_code, college_name
         FROM colleges
@@ -59,13 +89,11 @@ class CollegeQueries:
         SELECT 
             c.college_code, 
             c.college_name, 
-            COUNT(DISTINCT p.program_code) AS program_count,
-            COUNT(s.id_number) AS student_count
+            e.program_count,
+            e.student_count
         FROM colleges c
-        LEFT JOIN programs p ON c.college_code = p.college_code
-        LEFT JOIN students s ON p.program_code = s.program_code
-        GROUP BY c.college_code, c.college_name
-        ORDER BY student_count DESC;
+        JOIN college_enrollment e ON c.college_code = e.college_code
+        ORDER BY e.student_count DESC, c.college_code;
     """
     
     COLLEGE_LIST = """
@@ -12,27 +12,75 @@ class DashboardQueries:
         SELECT COUNT(*) as total_colleges FROM colleges;
     """
     
+    # Kept current by the triggers from migrations/0005_table_counters.sql
+    GET_TOTALS = """
+        SELECT table_name, row_count
+        FROM table_counters
+        WHERE table_name IN ('students', 'programs', 'colleges');
+    """
+    
+    # Planner estimates, refreshed by VACUUM/ANALYZE; -1 means never analyzed
+    GET_ESTIMATED_TOTALS = """
+        SELECT relname AS table_name, GREATEST(reltuples, 0)::bigint AS row_count
+        FROM pg_class
+        WHERE oid IN ('students'::regclass, 'programs'::regclass, 'colleges'::regclass);
+    """
+    
+    REBUILD_TOTALS = """
+        UPDATE table_counters t
+        SET row_count = c.row_count
+        FROM (
+            SELECT 'students' AS table_name, COUNT(*) AS row_count FROM students
+            UNION ALL
+            SELECT 'programs', COUNT(*) FROM programs
+            UNION ALL
+            SELECT 'colleges', COUNT(*) FROM colleges
+        ) c
+        WHERE t.table_name = c.table_name;
+    """
+    
+    # Published by the triggers from migrations/0006_dashboard_notify.sql
+    LISTEN_CHANGES = """
+        LISTEN dashboard_changes;
+    """
+    
+    # Replaces the day's rows with the current per-group counts, so re-running is safe
+    ROLLUP_DAY = """
+        DELETE FROM enrollment_daily WHERE day = %(day)s;
+        INSERT INTO enrollment_daily (day, program_code, college_code, year_level, gender, student_count)
+        SELECT %(day)s, s.program_code, p.college_code, s.year_level::text, s.gender, COUNT(*)
+        FROM students s
+        LEFT JOIN programs p ON p.program_code = s.program_code
+        GROUP BY s.program_code, p.college_code, s.year_level, s.gender;
+    """
+    
+    GET_TRENDS = """
+        SELECT day::text AS day, {group_select}SUM(student_count) AS student_count
+        FROM enrollment_daily
+        WHERE day BETWEEN %s AND %s
+            {filter_clause}
+        GROUP BY day{group_clause}
+        ORDER BY day{group_clause};
+    """
+    
     GET_STUDENTS_PER_COLLEGE = """
         SELECT 
             c.college_code, 
             c.college_name,
-            COUNT(s.id_number) as student_count
+            e.student_count
         FROM colleges c
-        LEFT JOIN programs p ON c.college_code = p.college_code
-        LEFT JOIN students s ON p.program_code = s.program_code
-        GROUP BY c.college_code, c.college_name
-        ORDER BY student_count DESC
+        JOIN college_enrollment e ON c.college_code = e.college_code
+        ORDER BY e.student_count DESC, c.college_code
     """
     
     GET_TOP_PROGRAMS = """
         SELECT 
             p.program_code, 
             p.program_name,
-            COUNT(s.id_number) as student_count
+            COALESCE(e.student_count, 0) as student_count
         FROM programs p
-        LEFT JOIN students s ON p.program_code = s.program_code
-        GROUP BY p.program_code, p.program_name
-        ORDER BY student_count DESC
+        LEFT JOIN program_enrollment e ON p.program_code = e.program_code
+        ORDER BY student_count DESC, p.program_code
         LIMIT 7;
     """
     
@@ -40,72 +88,83 @@ class DashboardQueries:
         SELECT 
             c.college_code, 
             c.college_name,
-            COUNT(DISTINCT p.program_code) as program_count,
-            COUNT(s.id_number) as student_count
+            e.program_count,
+            e.student_count
         FROM colleges c
-        LEFT JOIN programs p ON c.college_code = p.college_code
-        LEFT JOIN students s ON p.program_code = s.program_code
-        GROUP BY c.college_code, c.college_name
-        ORDER BY student_count DESC;
+        JOIN college_enrollment e ON c.college_code = e.college_code
+        ORDER BY e.student_count DESC, c.college_code;
     """
     
+    # Totals, per-college, top-program and college-stats sections in one
+    # statement: one GROUPING SETS pass over programs and their enrollment
+    # counts, with the overall student total read from table_counters
     GET_DASHBOARD_SUMMARY = """
-        WITH student_counts AS (
-            SELECT COUNT(*) as total_students FROM students
-        ),
-        program_counts AS (
-            SELECT COUNT(*) as total_programs FROM programs
-        ),
-        college_counts AS (
-            SELECT COUNT(*) as total_colleges FROM colleges
-        ),
-        students_per_college AS (
+        WITH grouped AS (
             SELECT 
-                c.college_code, 
+                GROUPING(c.college_code, p.program_code) AS grouping_level,
+                c.college_code,
                 c.college_name,
-                COUNT(s.id_number) as student_count
-            FROM colleges c
-            LEFT JOIN programs p ON c.college_code = p.college_code
-            LEFT JOIN students s ON p.program_code = s.program_code
-            GROUP BY c.college_code, c.college_name
-            ORDER BY student_count DESC
-            LIMIT 7
-        ),
-        top_programs AS (
-            SELECT 
-                p.program_code, 
+                p.program_code,
                 p.program_name,
-                COUNT(s.id_number) as student_count
+                COUNT(DISTINCT c.college_code) AS college_count,
+                COUNT(p.program_code) AS program_count,
+                COALESCE(SUM(e.student_count), 0) AS student_count
             FROM programs p
-            LEFT JOIN students s ON p.program_code = s.program_code
-            GROUP BY p.program_code, p.program_name
-            ORDER BY student_count DESC
-            LIMIT 7
+            LEFT JOIN program_enrollment e ON p.program_code = e.program_code
+            FULL JOIN colleges c ON c.college_code = p.college_code
+            GROUP BY GROUPING SETS (
+                (c.college_code, c.college_name),
+                (p.program_code, p.program_name),
+                ()
+            )
+        ),
+        ranked AS (
+            SELECT 
+                *,
+                ROW_NUMBER() OVER (
+                    PARTITION BY grouping_level
+                    ORDER BY student_count DESC, college_code, program_code
+                ) AS position
+            FROM grouped
+            -- Drop the NULL groups left by programs without a college and colleges without programs
+            WHERE grouping_level = 3
+                OR (grouping_level = 1 AND college_code IS NOT NULL)
+                OR (grouping_level = 2 AND program_code IS NOT NULL)
         )
         SELECT 
-            (SELECT total_students FROM student_counts) as total_students,
-            (SELECT total_programs FROM program_counts) as total_programs,
-            (SELECT total_colleges FROM college_counts) as total_colleges,
+            (SELECT row_count FROM table_counters WHERE table_name = 'students') as total_students,
+            COALESCE(MAX(program_count) FILTER (WHERE grouping_level = 3), 0) as total_programs,
+            COALESCE(MAX(college_count) FILTER (WHERE grouping_level = 3), 0) as total_colleges,
             COALESCE(
                 json_agg(
                     json_build_object(
-                        'college_code', spc.college_code,
-                        'college_name', spc.college_name,
-                        'student_count', COALESCE(spc.student_count, 0)
-                    )
-                ),
+                        'college_code', college_code,
+                        'college_name', college_name,
+                        'student_count', student_count
+                    ) ORDER BY position
+                ) FILTER (WHERE grouping_level = 1),
                 '[]'::json
             ) as students_per_college,
             COALESCE(
                 json_agg(
                     json_build_object(
-                        'program_code', tp.program_code,
-                        'program_name', tp.program_name,
-                        'student_count', COALESCE(tp.student_count, 0)
-                    )
-                ),
+                        'program_code', program_code,
+                        'program_name', program_name,
+                        'student_count', student_count
+                    ) ORDER BY position
+                ) FILTER (WHERE grouping_level = 2 AND position <= 7),
+                '[]'::json
+            ) as top_programs,
+            COALESCE(
+                json_agg(
+                    json_build_object(
+                        'college_code', college_code,
+                        'college_name', college_name,
+                        'program_count', program_count,
+                        'student_count', student_count
+                    ) ORDER BY position
+                ) FILTER (WHERE grouping_level = 1),
                 '[]'::json
-            ) as top_programs
-        FROM students_per_college spc
-        CROSS JOIN top_programs tp;
+            ) as college_stats
+        FROM ranked;
     """
\ No newline at end of file
@@ -0,0 +1,13 @@
+class DataVersionQueries:
+    
+    FIND_VERSIONS = """
+        SELECT table_name, version
+        FROM data_versions
+        WHERE table_name = ANY(%s);
+    """
+    
+    BUMP_VERSIONS = """
+        UPDATE data_versions
+        SET version = version + 1
+        WHERE table_name = ANY(%s);
+    """
\ No newline at end of file
@@ -0,0 +1,33 @@
+class EnrollmentQueries:
+    
+    # Deltas are (program_code, change) pairs for execute_values
+    APPLY_DELTAS = """
+        INSERT INTO program_enrollment (program_code, student_count)
+        VALUES %s
+        ON CONFLICT (program_code) DO UPDATE
+        SET student_count = program_enrollment.student_count + EXCLUDED.student_count;
+    """
+    
+    RENAME_PROGRAM = """
+        UPDATE program_enrollment
+        SET program_code = %s
+        WHERE program_code = %s;
+    """
+    
+    # Deleting a program sets its students' program_code to NULL, so its count goes too
+    DELETE_PROGRAM = """
+        DELETE FROM program_enrollment
+        WHERE program_code = %s;
+    """
+    
+    # TRUNCATE waits for in-flight writers, so no delta is lost or counted twice;
+    # the resync message tells /dashboard/stream clients to refetch
+    REBUILD = """
+        TRUNCATE program_enrollment;
+        INSERT INTO program_enrollment (program_code, student_count)
+        SELECT p.program_code, COUNT(s.id_number)
+        FROM programs p
+        LEFT JOIN students s ON s.program_code = p.program_code
+        GROUP BY p.program_code;
+        SELECT pg_notify('dashboard_changes', '{"type": "resync"}');
+    """
\ No newline at end of file
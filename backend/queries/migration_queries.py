@@ -0,0 +1,30 @@
+class MigrationQueries:
+    
+    CREATE_TRACKING_TABLE = """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(32) PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+    """
+    
+    FIND_APPLIED = """
+        SELECT version, name, checksum, applied_at
+        FROM schema_migrations
+        ORDER BY version ASC;
+    """
+    
+    INSERT_APPLIED = """
+        INSERT INTO schema_migrations (version, name, checksum)
+        VALUES (%s, %s, %s);
+    """
+    
+    # Serializes concurrent runners, e.g. several workers starting at once
+    ACQUIRE_LOCK = """
+        SELECT pg_advisory_lock(%s);
+    """
+    
+    RELEASE_LOCK = """
+        SELECT pg_advisory_unlock(%s);
+    """
\ No newline at end of file
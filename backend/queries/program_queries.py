@@ -1,11 +1,18 @@
 class ProgramQueries:
     
+    # Unfiltered pages join a separate count: a window count would force a
+    # full sort of the table instead of a top-N sort or index scan
     FIND_ALL = """
-        SELECT p.program_code, p.program_name, p.college_code, c.college_name
-        FROM programs p
-        LEFT JOIN colleges c ON p.college_code = c.college_code
-        ORDER BY {sort_field} {sort_direction}
-        LIMIT %s OFFSET %s;
+        SELECT page.*, totals.total_count
+        FROM (
+            SELECT {select_list}
+            FROM programs p
+            LEFT JOIN colleges c ON p.college_code = c.college_code
+            ORDER BY {sort_field} {sort_direction}
+            LIMIT %s OFFSET %s
+        ) page
+        CROSS JOIN (SELECT COUNT(*) AS total_count FROM programs) totals
+        ORDER BY {sort_field} {sort_direction};
     """
     
     COUNT_ALL = """
@@ -15,15 +22,13 @@ class ProgramQueries:
     """
     
     FIND_ALL_SEARCH = """
-        SELECT p.program_code, p.program_name, p.college_code, c.college_name
+        SELECT {select_list},
+            COUNT(*) OVER() AS total_count
         FROM programs p
         LEFT JOIN colleges c ON p.college_code = c.college_code
-        WHERE 
-            LOWER(p.program_code) LIKE %s OR
-            LOWER(p.program_name) LIKE %s OR
-            LOWER(p.college_code) LIKE %s OR
-            LOWER(c.college_name) LIKE %s
-        ORDER BY {sort_field} {sort_direction}
+        WHERE 1=1
+            {search_clause}
+        ORDER BY {order_clause}
         LIMIT %s OFFSET %s;
     """
     
@@ -31,13 +36,50 @@ class ProgramQueries:
         SELECT COUNT(*) as total
         FROM programs p
         LEFT JOIN colleges c ON p.college_code = c.college_code
-        WHERE 
-            LOWER(p.program_code) LIKE %s OR
+        WHERE 1=1
+            {search_clause};
+    """
+    
+    FIND_ALL_KEYSET = """
+        SELECT {select_list}
+        FROM programs p
+        LEFT JOIN colleges c ON p.college_code = c.college_code
+        WHERE 1=1
+            {search_clause}
+            {keyset_clause}
+        ORDER BY {order_clause}
+        LIMIT %s;
+    """
+    
+    SEARCH_CLAUSE = """
+            AND (LOWER(p.program_code) LIKE %s OR
             LOWER(p.program_name) LIKE %s OR
             LOWER(p.college_code) LIKE %s OR
-            LOWER(c.college_name) LIKE %s;
+            LOWER(c.college_name) LIKE %s)
+    """
+    
+    # Must match the expressions indexed by migrations/0002_search_trigram_indexes.sql
+    SEARCH_DOCUMENT = """LOWER(
+            p.program_code || ' ' || p.program_name || ' ' || COALESCE(p.college_code, '')
+        )"""
+    
+    COLLEGE_SEARCH_DOCUMENT = "LOWER(college_code || ' ' || college_name)"
+    
+    # The college name lives on the joined table, so it is matched through the
+    # colleges index and folded back in by college_code
+    SEARCH_CLAUSE_TRIGRAM = f"""
+            AND ({SEARCH_DOCUMENT} LIKE %s OR
+            p.college_code IN (
+                SELECT college_code FROM colleges
+                WHERE {COLLEGE_SEARCH_DOCUMENT} LIKE %s
+            ))
     """
     
+    SEARCH_RANK_TRIGRAM = f"""GREATEST(
+            word_similarity(%s, {SEARCH_DOCUMENT}),
+            word_similarity(%s, LOWER(COALESCE(c.college_name, '')))
+        )"""
+    
     FIND_BY_CODE = """
         SELECT program_code, program_name, college_code
         FROM programs
@@ -1,10 +1,17 @@
 class StudentQueries:
     
+    # Unfiltered pages join a separate count: a window count would force a
+    # full sort of the table instead of a top-N sort or index scan
     FIND_ALL = """
-        SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
-        FROM students
-        ORDER BY {sort_field} {sort_direction}
-        LIMIT %s OFFSET %s;
+        SELECT page.*, totals.total_count
+        FROM (
+            SELECT {select_list}
+            FROM students{join_clause}
+            ORDER BY {sort_field} {sort_direction}
+            LIMIT %s OFFSET %s
+        ) page
+        CROSS JOIN (SELECT COUNT(*) AS total_count FROM students) totals
+        ORDER BY {sort_field} {sort_direction};
     """
     
     COUNT_ALL = """
@@ -13,34 +20,28 @@ class StudentQueries:
     """
     
     FIND_ALL_SEARCH = """
-        SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
-        FROM students
-        WHERE 
-            (LOWER(id_number) LIKE %s OR
-            LOWER(first_name) LIKE %s OR
-            LOWER(last_name) LIKE %s OR
-            LOWER(program_code) LIKE %s OR
-            CAST(year_level AS TEXT) LIKE %s)
+        SELECT {select_list},
+            COUNT(*) OVER() AS total_count
+        FROM students{join_clause}
+        WHERE 1=1
+            {search_clause}
             {filter_clause}
-        ORDER BY {sort_field} {sort_direction}
+        ORDER BY {order_clause}
         LIMIT %s OFFSET %s;
     """
     
     COUNT_ALL_SEARCH = """
         SELECT COUNT(*) as total
         FROM students
-        WHERE 
-            (LOWER(id_number) LIKE %s OR
-            LOWER(first_name) LIKE %s OR
-            LOWER(last_name) LIKE %s OR
-            LOWER(program_code) LIKE %s OR
-            CAST(year_level AS TEXT) LIKE %s)
+        WHERE 1=1
+            {search_clause}
             {filter_clause};
     """
     
     FIND_ALL_FILTER = """
-        SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
-        FROM students
+        SELECT {select_list},
+            COUNT(*) OVER() AS total_count
+        FROM students{join_clause}
         WHERE 1=1
             {filter_clause}
         ORDER BY {sort_field} {sort_direction}
@@ -54,6 +55,58 @@ class StudentQueries:
             {filter_clause};
     """
     
+    FIND_ALL_KEYSET = """
+        SELECT {select_list}
+        FROM students{join_clause}
+        WHERE 1=1
+            {search_clause}
+            {filter_clause}
+            {keyset_clause}
+        ORDER BY {order_clause}
+        LIMIT %s;
+    """
+    
+    FIND_ALL_EXPORT = """
+        SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
+        FROM students
+        WHERE 1=1
+            {search_clause}
+            {filter_clause}
+        ORDER BY {order_clause};
+    """
+    
+    SEARCH_CLAUSE = """
+            AND (LOWER(id_number) LIKE %s OR
+            LOWER(first_name) LIKE %s OR
+            LOWER(last_name) LIKE %s OR
+            LOWER(program_code) LIKE %s OR
+            CAST(year_level AS TEXT) LIKE %s)
+    """
+    
+    # Trigger-maintained column indexed by migrations/0002_search_trigram_indexes.sql
+    SEARCH_DOCUMENT = "search_document"
+    
+    SEARCH_CLAUSE_TRIGRAM = f"""
+            AND {SEARCH_DOCUMENT} LIKE %s
+    """
+    
+    SEARCH_RANK_TRIGRAM = f"word_similarity(%s, {SEARCH_DOCUMENT})"
+    
+    # ?expand= joins. USING merges the join columns, so the unqualified
+    # program_code in filter, search and sort clauses stays unambiguous
+    EXPAND_JOINS = {
+        'program': """
+        LEFT JOIN programs USING (program_code)""",
+        'college': """
+        LEFT JOIN colleges USING (college_code)"""
+    }
+    
+    FIND_DETAIL = """
+        SELECT {select_list}
+        FROM students{join_clause}
+        WHERE id_number = %s;
+    """
+    
     FIND_BY_ID = """
         SELECT id_number, first_name, last_name, year_level, gender, program_code, picture
         FROM students
@@ -66,12 +119,17 @@ class StudentQueries:
         RETURNING id_number, first_name, last_name, year_level, gender, program_code, picture;
     """
     
+    # previous_program_code feeds the program_enrollment counts
     UPDATE = """
-        UPDATE students
+        UPDATE students s
         SET id_number = %s, first_name = %s, last_name = %s, year_level = %s, 
             gender = %s, program_code = %s, picture = %s
-        WHERE id_number = %s
-        RETURNING id_number, first_name, last_name, year_level, gender, program_code, picture;
+        FROM (
+            SELECT id_number, program_code FROM students WHERE id_number = %s FOR UPDATE
+        ) previous
+        WHERE s.id_number = previous.id_number
+        RETURNING s.id_number, s.first_name, s.last_name, s.year_level, s.gender, s.program_code, s.picture,
+            previous.program_code AS previous_program_code;
     """
     
     DELETE = """
@@ -80,16 +138,87 @@ class StudentQueries:
         RETURNING id_number, first_name, last_name, year_level, gender, program_code, picture;
     """
     
+    # Set-based batch operations; {selection_clause} is AND-ed conditions
+    # on id_number and the filter columns
+    UPDATE_MANY = """
+        UPDATE students s
+        SET {set_clause}
+        FROM (
+            SELECT id_number, program_code FROM students
+            WHERE 1=1
+                {selection_clause}
+            FOR UPDATE
+        ) previous
+        WHERE s.id_number = previous.id_number
+        RETURNING s.id_number, s.first_name, s.last_name, s.year_level, s.gender, s.program_code, s.picture,
+            previous.program_code AS previous_program_code;
+    """
+    
+    DELETE_MANY = """
+        DELETE FROM students
+        WHERE 1=1
+            {selection_clause}
+        RETURNING id_number, first_name, last_name, year_level, gender, program_code, picture;
+    """
+    
+    # LIKE copies the column types, including the year_level type, without
+    # the primary key, so duplicate and conflicting rows can be staged
+    CREATE_IMPORT_STAGING = """
+        CREATE TEMP TABLE students_import (LIKE students) ON COMMIT DROP;
+        ALTER TABLE students_import ADD COLUMN row_number INTEGER;
+    """
+    
+    COPY_IMPORT_STAGING = """
+        COPY students_import (row_number, id_number, first_name, last_name, year_level, gender, program_code)
+        FROM STDIN WITH (FORMAT csv);
+    """
+    
+    FIND_IMPORT_UNKNOWN_PROGRAMS = """
+        SELECT i.row_number, i.id_number, i.program_code
+        FROM students_import i
+        LEFT JOIN programs p ON p.program_code = i.program_code
+        WHERE p.program_code IS NULL
+        ORDER BY i.row_number;
+    """
+    
+    # Locks the students an updating import will overwrite and gets their
+    # current programs, which RETURNING cannot see after the merge
+    FIND_IMPORT_EXISTING = """
+        SELECT s.id_number, s.program_code
+        FROM students s
+        JOIN students_import i ON i.id_number = s.id_number
+        FOR UPDATE OF s;
+    """
+    
+    MERGE_IMPORT_SKIP = """
+        INSERT INTO students (id_number, first_name, last_name, year_level, gender, program_code)
+        SELECT i.id_number, i.first_name, i.last_name, i.year_level, i.gender, i.program_code
+        FROM students_import i
+        JOIN programs p ON p.program_code = i.program_code
+        ORDER BY i.row_number
+        ON CONFLICT (id_number) DO NOTHING
+        RETURNING id_number, program_code, (xmax = 0) AS inserted;
+    """
+    
+    # Only overwrites the rows FIND_IMPORT_EXISTING locked (the %s id array);
+    # an ID another writer inserts in between is skipped like an existing one
+    MERGE_IMPORT_UPDATE = """
+        INSERT INTO students (id_number, first_name, last_name, year_level, gender, program_code)
+        SELECT i.id_number, i.first_name, i.last_name, i.year_level, i.gender, i.program_code
+        FROM students_import i
+        JOIN programs p ON p.program_code = i.program_code
+        ORDER BY i.row_number
+        ON CONFLICT (id_number) DO UPDATE
+        SET first_name = EXCLUDED.first_name, last_name = EXCLUDED.last_name,
+            year_level = EXCLUDED.year_level, gender = EXCLUDED.gender,
+            program_code = EXCLUDED.program_code
+        WHERE students.id_number = ANY(%s)
+        RETURNING id_number, program_code, (xmax = 0) AS inserted;
+    """
+    
     GET_STUDENTS_PER_PROGRAM = """
-        SELECT p.program_code, p.program_name, COUNT(s.id_number) AS student_count
+        SELECT p.program_code, p.program_name, COALESCE(e.student_count, 0) AS student_count
         FROM programs p
-        LEFT JOIN students s ON p.program_code = s.program_code
-        GROUP BY p.program_code, p.program_name
+        LEFT JOIN program_enrollment e ON p.program_code = e.program_code
         ORDER BY student_count DESC;
     """
-    
-    GET_ALL_PROGRAMS = """
-        SELECT program_code, program_name
-        FROM programs
-        ORDER BY program_name ASC;
-    """
\ No newline at end of file
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Recompute the materialized enrollment counts and table row counters.
+
+The repositories keep program_enrollment current on every write and
+triggers keep table_counters current; run this after loading students
+outside the API, or to repair drifted counts.
+
+    python rebuild_aggregates.py
+"""
+
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from repositories.enrollment_repository import EnrollmentRepository
+from repositories.dashboard_repository import DashboardRepository
+from services.data_version_service import DataVersionService
+
+def main(argv=None):
+    EnrollmentRepository().rebuild()
+    DashboardRepository().rebuild_totals()
+    DataVersionService().bump('students')
+    print("Rebuilt program enrollment counts and table row counters.")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
\ No newline at end of file
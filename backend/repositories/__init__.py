@@ -3,11 +3,15 @@ from .college_repository import CollegeRepository
 from .program_repository import ProgramRepository
 from .student_repository import StudentRepository
 from .dashboard_repository import DashboardRepository
+from .data_version_repository import DataVersionRepository
+from .enrollment_repository import EnrollmentRepository
 
 __all__ = [
     'AuthRepository',
     'CollegeRepository',
     'ProgramRepository',
     'StudentRepository',
-    'DashboardRepository'
+    'DashboardRepository',
+    'DataVersionRepository',
+    'EnrollmentRepository'
 ]
\ No newline at end of file
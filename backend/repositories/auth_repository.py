@@ -2,7 +2,9 @@ from db import get_connection
 from psycopg2 import errors as pg_errors
 from utils.exceptions import DuplicateEntryError
 from queries.auth_queries import AuthQueries
+from utils.timing import timed_layer
 
+@timed_layer('db')
 class AuthRepository:
     def __init__(self):
         self.queries = AuthQueries()
@@ -2,15 +2,37 @@ from db import get_connection
 from psycopg2 import errors as pg_errors
 from utils.exceptions import DuplicateEntryError
 from queries.college_queries import CollegeQueries
+from utils.pagination import decode_cursor, build_keyset_clauses, build_keyset_page
+from utils.search import build_search_clause, build_relevance_order
+from utils.fields import build_select_list, strip_fields
+from utils.columnar import cursor_factory, to_columnar, fetch_page, fetch_scalar
+from utils.timing import timed_layer
 
+@timed_layer('db')
 class CollegeRepository:
     def __init__(self):
         self.queries = CollegeQueries()
         
+    # Fields a ?fields= sparse fieldset may select
+    FIELD_EXPRESSIONS = {
+        'college_code': 'college_code',
+        'college_name': 'college_name'
+    }
+    
     ALLOWED_SORT_FIELDS = ['college_code', 'college_name']
     
-    def find_all(self, page=1, per_page=10, search='', sort_field='college_code', sort_direction='asc'):
+    KEYSET_SORT_EXPRESSIONS = {
+        'college_code': 'college_code',
+        'college_name': 'college_name'
+    }
+    
+    def find_all(self, page=1, per_page=10, search='', sort_field='college_code', sort_direction='asc', fields=None, columnar=False):
         """Get paginated colleges with optional search and sorting"""
+        # Relevance ranking is only available to trigram searches
+        relevance_order = None
+        if sort_field == 'relevance':
+            relevance_order = build_relevance_order(self.queries, search, 'college_code')
+        
         # Validate sort parameters
         if sort_field not in self.ALLOWED_SORT_FIELDS:
             sort_field = 'college_code'
@@ -19,34 +41,50 @@ class CollegeRepository:
         
         offset = (page - 1) * per_page
         
-        with get_connection() as conn, conn.cursor() as cur:
+        # The page query orders by the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, self.FIELD_EXPRESSIONS, 'college_code', [sort_field]
+        )
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Page rows carry the full match count in total_count,
+            # so the count query only runs when the page comes back empty
             if search:
-                # Add wildcards for LIKE search
-                search_pattern = f'%{search.lower()}%'
+                search_clause, search_params = build_search_clause(self.queries, search)
                 
-                # Get total count
-                cur.execute(self.queries.COUNT_ALL_SEARCH, (search_pattern, search_pattern))
-                total = cur.fetchone()['total']
+                if relevance_order:
+                    order_clause, order_params = relevance_order
+                else:
+                    order_clause, order_params = f'{sort_field} {sort_direction}', ()
                 
-                # Get paginated results
                 query = self.queries.FIND_ALL_SEARCH.format(
-                    sort_field=sort_field, 
-                    sort_direction=sort_direction
+                    select_list=select_list,
+                    search_clause=search_clause,
+                    order_clause=order_clause
                 )
-                cur.execute(query, (search_pattern, search_pattern, per_page, offset))
-            else:
-                # Get total count
-                cur.execute(self.queries.COUNT_ALL)
-                total = cur.fetchone()['total']
+                cur.execute(query, search_params + order_params + (per_page, offset))
                 
-                # Get paginated results
+                count_query = self.queries.COUNT_ALL_SEARCH.format(search_clause=search_clause)
+                count_params = search_params
+            else:
                 query = self.queries.FIND_ALL.format(
+                    select_list=select_list,
                     sort_field=sort_field, 
                     sort_direction=sort_direction
                 )
                 cur.execute(query, (per_page, offset))
+                
+                count_query = self.queries.COUNT_ALL
+                count_params = ()
+            
+            colleges, total = fetch_page(cur, columnar, hidden_fields)
             
-            colleges = cur.fetchall()
+            if total is None:
+                total = 0
+                if offset > 0:
+                    # Past the last page; the window count has no row to ride on
+                    cur.execute(count_query, count_params)
+                    total = fetch_scalar(cur)
             
             return {
                 'colleges': colleges,
@@ -56,6 +94,62 @@ class CollegeRepository:
                 'total_pages': (total + per_page - 1) // per_page  # Ceiling division
             }
     
+    def find_all_keyset(self, per_page=10, search='', sort_field='college_code', sort_direction='asc', cursor=None, fields=None, columnar=False):
+        """Get one keyset page of colleges, seeking past the cursor instead of using OFFSET"""
+        cursor = decode_cursor(cursor, self.ALLOWED_SORT_FIELDS, 'college_code') if cursor else None
+        if cursor:
+            sort_field = cursor['sort_field']
+            sort_direction = cursor['sort_direction']
+        if sort_field not in self.ALLOWED_SORT_FIELDS:
+            sort_field = 'college_code'
+        sort_direction = sort_direction.lower()
+        if sort_direction not in ['asc', 'desc']:
+            sort_direction = 'asc'
+        
+        keyset_clause, keyset_params, order_clause = build_keyset_clauses(
+            self.KEYSET_SORT_EXPRESSIONS[sort_field],
+            self.KEYSET_SORT_EXPRESSIONS['college_code'],
+            sort_direction,
+            cursor
+        )
+        
+        search_clause, search_params = build_search_clause(self.queries, search)
+        
+        # Cursors are built from the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, self.FIELD_EXPRESSIONS, 'college_code', [sort_field]
+        )
+        
+        query = self.queries.FIND_ALL_KEYSET.format(
+            select_list=select_list,
+            search_clause=search_clause,
+            keyset_clause=keyset_clause,
+            order_clause=order_clause
+        )
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Fetch one extra row to know whether another page follows
+            cur.execute(query, search_params + keyset_params + (per_page + 1,))
+            rows = cur.fetchall()
+            columns = [column.name for column in cur.description] if columnar else None
+        
+        colleges, next_cursor, prev_cursor = build_keyset_page(
+            rows, per_page, sort_field, sort_direction, 'college_code', cursor, columns
+        )
+        if columnar:
+            colleges = to_columnar(columns, colleges, hidden_fields)
+        else:
+            strip_fields(colleges, hidden_fields)
+        
+        return {
+            'colleges': colleges,
+            'per_page': per_page,
+            'sort_field': sort_field,
+            'sort_direction': sort_direction,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }
+    
     def find_by_code(self, college_code):
         """Find a college by code"""
         with get_connection() as conn, conn.cursor() as cur:
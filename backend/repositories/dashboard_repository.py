@@ -1,30 +1,79 @@
-from db import get_connection
+import json
+from db import get_connection, create_listener
 from queries.dashboard_queries import DashboardQueries
+from config.dashboard_config import DashboardConfig
+from utils.timing import timed_layer
 
+@timed_layer('db')
 class DashboardRepository:
+    # One LISTEN connection per process, shared by every /dashboard/stream client
+    change_listener = create_listener(DashboardQueries.LISTEN_CHANGES, DashboardConfig.STREAM_QUEUE_SIZE)
+    
     def __init__(self):
         self.queries = DashboardQueries()
     
-    def get_total_students(self):
-        """Get total number of students"""
+    # Columns trends can be grouped and filtered by
+    TREND_FIELDS = ['program_code', 'college_code', 'year_level', 'gender']
+    
+    def get_totals(self, estimated=False):
+        """Get student, program and college totals from the row counters or planner estimates"""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(self.queries.GET_ESTIMATED_TOTALS if estimated else self.queries.GET_TOTALS)
+            counts = {row['table_name']: row['row_count'] for row in cur.fetchall()}
+            return {
+                'total_students': counts.get('students', 0),
+                'total_programs': counts.get('programs', 0),
+                'total_colleges': counts.get('colleges', 0)
+            }
+    
+    def subscribe_to_changes(self):
+        """Get a queue of count changes published after every committed write"""
+        return self.change_listener.subscribe()
+    
+    def unsubscribe_from_changes(self, subscription):
+        """Stop receiving changes on a subscription queue"""
+        self.change_listener.unsubscribe(subscription)
+    
+    @classmethod
+    def on_change(cls, callback):
+        """Call callback() once per change received by this process, however many streams are open"""
+        cls.change_listener.add_callback(lambda payload: callback())
+    
+    def decode_change(self, payload):
+        """Decode a change payload, mapping a missed-changes marker to a resync"""
+        if payload is self.change_listener.OVERFLOW:
+            return {'type': 'resync'}
+        return json.loads(payload)
+    
+    def rollup_day(self, day):
+        """Store the day's per-program, college, year level and gender counts"""
         with get_connection() as conn, conn.cursor() as cur:
-            cur.execute(self.queries.GET_TOTAL_STUDENTS)
-            result = cur.fetchone()
-            return result['total_students'] if result else 0
+            cur.execute(self.queries.ROLLUP_DAY, {'day': day})
+            return cur.rowcount
     
-    def get_total_programs(self):
-        """Get total number of programs"""
+    def get_trends(self, start, end, group_by=None, filters=None):
+        """Get daily student counts between two days, optionally per group_by value"""
+        filter_clause = ""
+        params = [start, end]
+        for field in self.TREND_FIELDS:
+            if filters and filters.get(field):
+                filter_clause += f" AND {field} = %s"
+                params.append(filters[field])
+        
+        query = self.queries.GET_TRENDS.format(
+            group_select=f"{group_by}, " if group_by else "",
+            group_clause=f", {group_by}" if group_by else "",
+            filter_clause=filter_clause
+        )
+        
         with get_connection() as conn, conn.cursor() as cur:
-            cur.execute(self.queries.GET_TOTAL_PROGRAMS)
-            result = cur.fetchone()
-            return result['total_programs'] if result else 0
+            cur.execute(query, tuple(params))
+            return cur.fetchall()
     
-    def get_total_colleges(self):
-        """Get total number of colleges"""
+    def rebuild_totals(self):
+        """Recount every table into the row counters"""
         with get_connection() as conn, conn.cursor() as cur:
-            cur.execute(self.queries.GET_TOTAL_COLLEGES)
-            result = cur.fetchone()
-            return result['total_colleges'] if result else 0
+            cur.execute(self.queries.REBUILD_TOTALS)
     
     def get_students_per_college(self):
         """Get colleges by student count"""
@@ -45,35 +94,7 @@ class DashboardRepository:
             return cur.fetchall()
     
     def get_dashboard_summary(self):
-        """Get all dashboard data using optimized separate queries"""
+        """Get all dashboard sections from a single summary query"""
         with get_connection() as conn, conn.cursor() as cur:
-            # Get totals
-            cur.execute(self.queries.GET_TOTAL_STUDENTS)
-            total_students = cur.fetchone()['total_students'] or 0
-            
-            cur.execute(self.queries.GET_TOTAL_PROGRAMS)
-            total_programs = cur.fetchone()['total_programs'] or 0
-            
-            cur.execute(self.queries.GET_TOTAL_COLLEGES)
-            total_colleges = cur.fetchone()['total_colleges'] or 0
-            
-            # Get top 7 colleges
-            cur.execute(self.queries.GET_STUDENTS_PER_COLLEGE)
-            students_per_college = cur.fetchall() or []
-            
-            # Get top 7 programs
-            cur.execute(self.queries.GET_TOP_PROGRAMS)
-            top_programs = cur.fetchall() or []
-            
-            # Get all college stats
-            cur.execute(self.queries.GET_COLLEGE_STATS)
-            college_stats = cur.fetchall() or []
-            
-            return {
-                'total_students': total_students,
-                'total_programs': total_programs,
-                'total_colleges': total_colleges,
-                'students_per_college': students_per_college,
-                'top_programs': top_programs,
-                'college_stats': college_stats
-            }
\ No newline at end of file
+            cur.execute(self.queries.GET_DASHBOARD_SUMMARY)
+            return dict(cur.fetchone())
\ No newline at end of file
@@ -0,0 +1,19 @@
+from db import get_connection
+from queries.data_version_queries import DataVersionQueries
+from utils.timing import timed_layer
+
+@timed_layer('db')
+class DataVersionRepository:
+    def __init__(self):
+        self.queries = DataVersionQueries()
+    
+    def find_versions(self, tables):
+        """Get the current version of each table"""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(self.queries.FIND_VERSIONS, (list(tables),))
+            return {row['table_name']: row['version'] for row in cur.fetchall()}
+    
+    def bump(self, tables):
+        """Increment the version of each table"""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(self.queries.BUMP_VERSIONS, (list(tables),))
\ No newline at end of file
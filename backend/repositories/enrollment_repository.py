@@ -0,0 +1,40 @@
+from collections import Counter
+from psycopg2.extras import execute_values
+from db import get_connection
+from queries.enrollment_queries import EnrollmentQueries
+from utils.timing import timed_layer
+
+@timed_layer('db')
+class EnrollmentRepository:
+    """Keeps the program_enrollment counts in step with student writes.
+
+    The adjust methods take the writer's cursor, so counts change in the
+    same transaction as the rows they count.
+    """
+    
+    def __init__(self):
+        self.queries = EnrollmentQueries()
+    
+    def adjust(self, cur, removed=(), added=()):
+        """Apply -1 per program code in removed and +1 per code in added"""
+        deltas = Counter(code for code in added if code)
+        deltas.subtract(code for code in removed if code)
+        
+        # Sorted so concurrent writers lock counter rows in the same order
+        values = sorted((code, delta) for code, delta in deltas.items() if delta)
+        if values:
+            execute_values(cur, self.queries.APPLY_DELTAS, values)
+    
+    def rename_program(self, cur, old_code, new_code):
+        """Move a program's count to its new code"""
+        if old_code != new_code:
+            cur.execute(self.queries.RENAME_PROGRAM, (new_code, old_code))
+    
+    def delete_program(self, cur, program_code):
+        """Drop a deleted program's count"""
+        cur.execute(self.queries.DELETE_PROGRAM, (program_code,))
+    
+    def rebuild(self):
+        """Recompute every program's count from the students table"""
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(self.queries.REBUILD)
\ No newline at end of file
@@ -2,15 +2,44 @@ from db import get_connection
 from psycopg2 import errors as pg_errors
 from utils.exceptions import DuplicateEntryError, ForeignKeyError
 from queries.program_queries import ProgramQueries
+from repositories.enrollment_repository import EnrollmentRepository
+from utils.pagination import decode_cursor, build_keyset_clauses, build_keyset_page
+from utils.search import build_search_clause, build_relevance_order
+from utils.fields import build_select_list, strip_fields
+from utils.columnar import cursor_factory, to_columnar, fetch_page, fetch_scalar
+from utils.timing import timed_layer
 
+@timed_layer('db')
 class ProgramRepository:
     def __init__(self):
         self.queries = ProgramQueries()
+        self.enrollment_repository = EnrollmentRepository()
+    
+    # Fields a ?fields= sparse fieldset may select
+    FIELD_EXPRESSIONS = {
+        'program_code': 'p.program_code',
+        'program_name': 'p.program_name',
+        'college_code': 'p.college_code',
+        'college_name': 'c.college_name'
+    }
     
     ALLOWED_SORT_FIELDS = ['program_code', 'program_name', 'college_code', 'college_name']
     
-    def find_all(self, page=1, per_page=10, search='', sort_field='program_code', sort_direction='asc'):
+    # Keyset pagination compares row values, so nullable columns are coalesced
+    KEYSET_SORT_EXPRESSIONS = {
+        'program_code': 'p.program_code',
+        'program_name': 'p.program_name',
+        'college_code': "COALESCE(p.college_code, '')",
+        'college_name': "COALESCE(c.college_name, '')"
+    }
+    
+    def find_all(self, page=1, per_page=10, search='', sort_field='program_code', sort_direction='asc', fields=None, columnar=False):
         """Get paginated programs with optional search and sorting"""
+        # Relevance ranking is only available to trigram searches
+        relevance_order = None
+        if sort_field == 'relevance':
+            relevance_order = build_relevance_order(self.queries, search, 'p.program_code')
+        
         # Validate sort parameters
         if sort_field not in self.ALLOWED_SORT_FIELDS:
             sort_field = 'program_code'
@@ -19,35 +48,50 @@ class ProgramRepository:
         
         offset = (page - 1) * per_page
         
-        with get_connection() as conn, conn.cursor() as cur:
+        # The page query orders by the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, self.FIELD_EXPRESSIONS, 'program_code', [sort_field]
+        )
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Page rows carry the full match count in total_count,
+            # so the count query only runs when the page comes back empty
             if search:
-                # Add wildcards for LIKE search
-                search_pattern = f'%{search.lower()}%'
-                search_params = (search_pattern,) * 4  # 4 search fields
+                search_clause, search_params = build_search_clause(self.queries, search)
                 
-                # Get total count
-                cur.execute(self.queries.COUNT_ALL_SEARCH, search_params)
-                total = cur.fetchone()['total']
+                if relevance_order:
+                    order_clause, order_params = relevance_order
+                else:
+                    order_clause, order_params = f'{sort_field} {sort_direction}', ()
                 
-                # Get paginated results
                 query = self.queries.FIND_ALL_SEARCH.format(
-                    sort_field=sort_field, 
-                    sort_direction=sort_direction
+                    select_list=select_list,
+                    search_clause=search_clause,
+                    order_clause=order_clause
                 )
-                cur.execute(query, search_params + (per_page, offset))
-            else:
-                # Get total count
-                cur.execute(self.queries.COUNT_ALL)
-                total = cur.fetchone()['total']
+                cur.execute(query, search_params + order_params + (per_page, offset))
                 
-                # Get paginated results
+                count_query = self.queries.COUNT_ALL_SEARCH.format(search_clause=search_clause)
+                count_params = search_params
+            else:
                 query = self.queries.FIND_ALL.format(
+                    select_list=select_list,
                     sort_field=sort_field, 
                     sort_direction=sort_direction
                 )
                 cur.execute(query, (per_page, offset))
+                
+                count_query = self.queries.COUNT_ALL
+                count_params = ()
+            
+            programs, total = fetch_page(cur, columnar, hidden_fields)
             
-            programs = cur.fetchall()
+            if total is None:
+                total = 0
+                if offset > 0:
+                    # Past the last page; the window count has no row to ride on
+                    cur.execute(count_query, count_params)
+                    total = fetch_scalar(cur)
             
             return {
                 'programs': programs,
@@ -57,6 +101,62 @@ class ProgramRepository:
                 'total_pages': (total + per_page - 1) // per_page  # Ceiling division
             }
     
+    def find_all_keyset(self, per_page=10, search='', sort_field='program_code', sort_direction='asc', cursor=None, fields=None, columnar=False):
+        """Get one keyset page of programs, seeking past the cursor instead of using OFFSET"""
+        cursor = decode_cursor(cursor, self.ALLOWED_SORT_FIELDS, 'program_code') if cursor else None
+        if cursor:
+            sort_field = cursor['sort_field']
+            sort_direction = cursor['sort_direction']
+        if sort_field not in self.ALLOWED_SORT_FIELDS:
+            sort_field = 'program_code'
+        sort_direction = sort_direction.lower()
+        if sort_direction not in ['asc', 'desc']:
+            sort_direction = 'asc'
+        
+        keyset_clause, keyset_params, order_clause = build_keyset_clauses(
+            self.KEYSET_SORT_EXPRESSIONS[sort_field],
+            self.KEYSET_SORT_EXPRESSIONS['program_code'],
+            sort_direction,
+            cursor
+        )
+        
+        search_clause, search_params = build_search_clause(self.queries, search)
+        
+        # Cursors are built from the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, self.FIELD_EXPRESSIONS, 'program_code', [sort_field]
+        )
+        
+        query = self.queries.FIND_ALL_KEYSET.format(
+            select_list=select_list,
+            search_clause=search_clause,
+            keyset_clause=keyset_clause,
+            order_clause=order_clause
+        )
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Fetch one extra row to know whether another page follows
+            cur.execute(query, search_params + keyset_params + (per_page + 1,))
+            rows = cur.fetchall()
+            columns = [column.name for column in cur.description] if columnar else None
+        
+        programs, next_cursor, prev_cursor = build_keyset_page(
+            rows, per_page, sort_field, sort_direction, 'program_code', cursor, columns
+        )
+        if columnar:
+            programs = to_columnar(columns, programs, hidden_fields)
+        else:
+            strip_fields(programs, hidden_fields)
+        
+        return {
+            'programs': programs,
+            'per_page': per_page,
+            'sort_field': sort_field,
+            'sort_direction': sort_direction,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }
+    
     def find_by_code(self, program_code):
         """Find a program by code"""
         with get_connection() as conn, conn.cursor() as cur:
@@ -94,7 +194,10 @@ class ProgramRepository:
                         original_code
                     )
                 )
-                return cur.fetchone()
+                program = cur.fetchone()
+                if program:
+                    self.enrollment_repository.rename_program(cur, original_code, program['program_code'])
+                return program
         except pg_errors.UniqueViolation:
             raise DuplicateEntryError()
         except pg_errors.ForeignKeyViolation:
@@ -104,7 +207,10 @@ class ProgramRepository:
         """Delete a program"""
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(self.queries.DELETE, (program_code,))
-            return cur.fetchone()
+            program = cur.fetchone()
+            if program:
+                self.enrollment_repository.delete_program(cur, program_code)
+            return program
         
     def find_all_list(self):
         """Get all programs without pagination (for dropdowns)"""
@@ -1,25 +1,59 @@
+import csv
+import io
 from db import get_connection
 from psycopg2 import errors as pg_errors
-from utils.exceptions import DuplicateEntryError, ForeignKeyError
+from utils.exceptions import DuplicateEntryError, ForeignKeyError, ValidationError
 from queries.student_queries import StudentQueries
+from repositories.enrollment_repository import EnrollmentRepository
+from utils.pagination import decode_cursor, build_keyset_clauses, build_keyset_page
+from config.student_config import StudentConfig
+from utils.search import build_search_clause, build_relevance_order
+from utils.fields import build_select_list, strip_fields
+from utils.columnar import cursor_factory, to_columnar, fetch_page, fetch_scalar
+from utils.timing import timed_layer
 
+@timed_layer('db')
 class StudentRepository:
     def __init__(self):
         self.queries = StudentQueries()
+        self.enrollment_repository = EnrollmentRepository()
+    
+    COLUMNS = ['id_number', 'first_name', 'last_name', 'year_level', 'gender', 'program_code', 'picture']
+    
+    # Fields a ?fields= sparse fieldset may select
+    FIELD_EXPRESSIONS = {column: column for column in COLUMNS}
+    
+    # Related fields each ?expand= name adds to the rows
+    EXPANSIONS = {
+        'program': ['program_name'],
+        'college': ['college_code', 'college_name']
+    }
     
     ALLOWED_SORT_FIELDS = ['id_number', 'first_name', 'last_name', 'year_level', 'gender', 'program_code']
     
-    def find_all(self, page=1, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None):
-        """Get paginated students with optional search, sorting, and filters"""
-        # Validate sort parameters
-        if sort_field not in self.ALLOWED_SORT_FIELDS:
-            sort_field = 'id_number'
-        if sort_direction.lower() not in ['asc', 'desc']:
-            sort_direction = 'asc'
-        
-        offset = (page - 1) * per_page
-        
-        # Build filter clause and params
+    # Keyset pagination compares row values, so nullable columns are coalesced
+    KEYSET_SORT_EXPRESSIONS = {
+        'id_number': 'id_number',
+        'first_name': 'first_name',
+        'last_name': 'last_name',
+        'year_level': 'year_level',
+        'gender': 'gender',
+        'program_code': "COALESCE(program_code, '')"
+    }
+    
+    # Enum-typed sort columns, whose cursor values must be one of their labels
+    KEYSET_ENUM_VALUES = {
+        'year_level': StudentConfig.YEAR_LEVELS,
+        'gender': StudentConfig.GENDERS
+    }
+    
+    FILTER_FIELDS = ['gender', 'year_level', 'program_code']
+    
+    # Columns a batch update may set on every selected student
+    BATCH_UPDATE_FIELDS = ['year_level', 'gender', 'program_code']
+    
+    def _build_filter_clause(self, filters):
+        """Build the AND-ed filter clause and its params"""
         filter_clause = ""
         filter_params = []
         
@@ -36,48 +70,129 @@ class StudentRepository:
                 filter_clause += " AND program_code = %s"
                 filter_params.append(filters['program_code'])
         
-        with get_connection() as conn, conn.cursor() as cur:
+        return filter_clause, filter_params
+    
+    def _build_expansion(self, expand):
+        """Resolve ?expand= into the selectable field expressions and the join clause"""
+        requested = [name.strip() for name in (expand or '').split(',') if name.strip()]
+        
+        unknown = [name for name in requested if name not in self.EXPANSIONS]
+        if unknown:
+            raise ValidationError(
+                f"Unknown expansions: {', '.join(unknown)}. "
+                f"Allowed expansions: {', '.join(self.EXPANSIONS)}"
+            )
+        
+        field_expressions = dict(self.FIELD_EXPRESSIONS)
+        join_clause = ''
+        if requested:
+            # Colleges are reached through the student's program
+            join_clause = self.queries.EXPAND_JOINS['program']
+            if 'college' in requested:
+                join_clause += self.queries.EXPAND_JOINS['college']
+            for name in self.EXPANSIONS:
+                if name in requested:
+                    field_expressions.update({field: field for field in self.EXPANSIONS[name]})
+        
+        return field_expressions, join_clause
+    
+    def _build_selection_clause(self, ids, filters):
+        """Build the clause selecting students by ID list and/or filters"""
+        selection_clause, selection_params = self._build_filter_clause(filters)
+        
+        if ids is not None:
+            selection_clause += " AND id_number = ANY(%s)"
+            selection_params.append(list(ids))
+        
+        return selection_clause, selection_params
+    
+    def find_all(self, page=1, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None, fields=None, columnar=False, expand=None):
+        """Get paginated students with optional search, sorting, and filters"""
+        # Relevance ranking is only available to trigram searches
+        relevance_order = None
+        if sort_field == 'relevance':
+            relevance_order = build_relevance_order(self.queries, search, 'id_number')
+        
+        # Validate sort parameters
+        if sort_field not in self.ALLOWED_SORT_FIELDS:
+            sort_field = 'id_number'
+        if sort_direction.lower() not in ['asc', 'desc']:
+            sort_direction = 'asc'
+        
+        offset = (page - 1) * per_page
+        
+        field_expressions, join_clause = self._build_expansion(expand)
+        
+        # The page query orders by the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, field_expressions, 'id_number', [sort_field]
+        )
+        
+        # Build filter clause and params
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Page rows carry the full match count in total_count,
+            # so the count query only runs when the page comes back empty
             if search:
-                # Add wildcards for LIKE search
-                search_pattern = f'%{search.lower()}%'
-                search_params = (search_pattern,) * 5  # 5 search fields
+                search_clause, search_params = build_search_clause(self.queries, search)
                 
-                # Get total count
-                count_query = self.queries.COUNT_ALL_SEARCH.format(filter_clause=filter_clause)
-                cur.execute(count_query, search_params + tuple(filter_params))
-                total = cur.fetchone()['total']
+                if relevance_order:
+                    order_clause, order_params = relevance_order
+                else:
+                    order_clause, order_params = f'{sort_field} {sort_direction}', ()
                 
-                # Get paginated results
                 query = self.queries.FIND_ALL_SEARCH.format(
-                    sort_field=sort_field, 
-                    sort_direction=sort_direction,
+                    select_list=select_list,
+                    join_clause=join_clause,
+                    search_clause=search_clause,
+                    filter_clause=filter_clause,
+                    order_clause=order_clause
+                )
+                cur.execute(
+                    query,
+                    search_params + tuple(filter_params) + order_params + (per_page, offset)
+                )
+                
+                count_query = self.queries.COUNT_ALL_SEARCH.format(
+                    search_clause=search_clause,
                     filter_clause=filter_clause
                 )
-                cur.execute(query, search_params + tuple(filter_params) + (per_page, offset))
+                count_params = search_params + tuple(filter_params)
             elif filter_clause:
                 # Only filters, no search
-                count_query = self.queries.COUNT_ALL_FILTER.format(filter_clause=filter_clause)
-                cur.execute(count_query, tuple(filter_params))
-                total = cur.fetchone()['total']
-                
                 query = self.queries.FIND_ALL_FILTER.format(
+                    select_list=select_list,
+                    join_clause=join_clause,
                     sort_field=sort_field,
                     sort_direction=sort_direction,
                     filter_clause=filter_clause
                 )
                 cur.execute(query, tuple(filter_params) + (per_page, offset))
+                
+                count_query = self.queries.COUNT_ALL_FILTER.format(filter_clause=filter_clause)
+                count_params = tuple(filter_params)
             else:
                 # No search, no filters
-                cur.execute(self.queries.COUNT_ALL)
-                total = cur.fetchone()['total']
-                
                 query = self.queries.FIND_ALL.format(
+                    select_list=select_list,
+                    join_clause=join_clause,
                     sort_field=sort_field, 
                     sort_direction=sort_direction
                 )
                 cur.execute(query, (per_page, offset))
+                
+                count_query = self.queries.COUNT_ALL
+                count_params = ()
             
-            students = cur.fetchall()
+            students, total = fetch_page(cur, columnar, hidden_fields)
+            
+            if total is None:
+                total = 0
+                if offset > 0:
+                    # Past the last page; the window count has no row to ride on
+                    cur.execute(count_query, count_params)
+                    total = fetch_scalar(cur)
             
             return {
                 'students': students,
@@ -87,6 +202,121 @@ class StudentRepository:
                 'total_pages': (total + per_page - 1) // per_page  # Ceiling division
             }
     
+    def find_all_keyset(self, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None, cursor=None, fields=None, columnar=False, expand=None):
+        """Get one keyset page of students, seeking past the cursor instead of using OFFSET"""
+        cursor = decode_cursor(
+            cursor, self.ALLOWED_SORT_FIELDS, 'id_number', self.KEYSET_ENUM_VALUES
+        ) if cursor else None
+        if cursor:
+            sort_field = cursor['sort_field']
+            sort_direction = cursor['sort_direction']
+        if sort_field not in self.ALLOWED_SORT_FIELDS:
+            sort_field = 'id_number'
+        sort_direction = sort_direction.lower()
+        if sort_direction not in ['asc', 'desc']:
+            sort_direction = 'asc'
+        
+        keyset_clause, keyset_params, order_clause = build_keyset_clauses(
+            self.KEYSET_SORT_EXPRESSIONS[sort_field],
+            self.KEYSET_SORT_EXPRESSIONS['id_number'],
+            sort_direction,
+            cursor
+        )
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        
+        search_clause, search_params = build_search_clause(self.queries, search)
+        
+        field_expressions, join_clause = self._build_expansion(expand)
+        
+        # Cursors are built from the sort field, so it is selected even when not requested
+        select_list, hidden_fields = build_select_list(
+            fields, field_expressions, 'id_number', [sort_field]
+        )
+        
+        query = self.queries.FIND_ALL_KEYSET.format(
+            select_list=select_list,
+            join_clause=join_clause,
+            search_clause=search_clause,
+            filter_clause=filter_clause,
+            keyset_clause=keyset_clause,
+            order_clause=order_clause
+        )
+        
+        with get_connection() as conn, conn.cursor(cursor_factory=cursor_factory(columnar)) as cur:
+            # Fetch one extra row to know whether another page follows
+            cur.execute(
+                query,
+                search_params + tuple(filter_params) + keyset_params + (per_page + 1,)
+            )
+            rows = cur.fetchall()
+            columns = [column.name for column in cur.description] if columnar else None
+        
+        students, next_cursor, prev_cursor = build_keyset_page(
+            rows, per_page, sort_field, sort_direction, 'id_number', cursor, columns
+        )
+        if columnar:
+            students = to_columnar(columns, students, hidden_fields)
+        else:
+            strip_fields(students, hidden_fields)
+        
+        return {
+            'students': students,
+            'per_page': per_page,
+            'sort_field': sort_field,
+            'sort_direction': sort_direction,
+            'next_cursor': next_cursor,
+            'prev_cursor': prev_cursor
+        }
+    
+    def iter_all(self, search='', sort_field='id_number', sort_direction='asc', filters=None, batch_size=1000):
+        """Yield every matching student through a server-side cursor.
+
+        Rows arrive from Postgres batch_size at a time, so memory stays flat
+        regardless of roster size. The connection is held until the
+        generator is exhausted or closed.
+        """
+        relevance_order = None
+        if sort_field == 'relevance':
+            relevance_order = build_relevance_order(self.queries, search, 'id_number')
+        
+        if sort_field not in self.ALLOWED_SORT_FIELDS:
+            sort_field = 'id_number'
+        if sort_direction.lower() not in ['asc', 'desc']:
+            sort_direction = 'asc'
+        
+        search_clause, search_params = build_search_clause(self.queries, search)
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        
+        if relevance_order:
+            order_clause, order_params = relevance_order
+        else:
+            # Tiebreak on the primary key so the export order is deterministic
+            order_clause = f'{sort_field} {sort_direction}, id_number {sort_direction}'
+            order_params = ()
+        
+        query = self.queries.FIND_ALL_EXPORT.format(
+            search_clause=search_clause,
+            filter_clause=filter_clause,
+            order_clause=order_clause
+        )
+        
+        with get_connection() as conn, conn.cursor(name='students_export') as cur:
+            cur.itersize = batch_size
+            cur.execute(query, search_params + tuple(filter_params) + order_params)
+            for row in cur:
+                yield row
+    
+    def find_detail(self, student_id, fields=None, expand=None):
+        """Find a student by ID, with any expanded program and college fields"""
+        field_expressions, join_clause = self._build_expansion(expand)
+        select_list, _ = build_select_list(fields, field_expressions, 'id_number')
+        
+        query = self.queries.FIND_DETAIL.format(select_list=select_list, join_clause=join_clause)
+        
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(query, (student_id,))
+            return cur.fetchone()
+    
     def find_by_id(self, student_id):
         """Find a student by ID"""
         with get_connection() as conn, conn.cursor() as cur:
@@ -109,12 +339,72 @@ class StudentRepository:
                         student_data['picture']
                     )
                 )
-                return cur.fetchone()
+                student = cur.fetchone()
+                self.enrollment_repository.adjust(cur, added=[student['program_code']])
+                return student
         except pg_errors.UniqueViolation:
             raise DuplicateEntryError()
         except pg_errors.ForeignKeyViolation:
             raise ForeignKeyError()
     
+    def bulk_import(self, batches, on_conflict='skip'):
+        """Stage validated rows with COPY and merge them into students in one transaction.
+
+        batches yields lists of (row_number, student) pairs. Existing IDs are
+        left alone, or overwritten when on_conflict is 'update'.
+        """
+        if on_conflict == 'update':
+            merge_query = self.queries.MERGE_IMPORT_UPDATE
+        else:
+            merge_query = self.queries.MERGE_IMPORT_SKIP
+        
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(self.queries.CREATE_IMPORT_STAGING)
+            
+            for batch in batches:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for row_number, student in batch:
+                    writer.writerow([
+                        row_number,
+                        student['id_number'],
+                        student['first_name'],
+                        student['last_name'],
+                        student['year_level'],
+                        student['gender'],
+                        student['program_code']
+                    ])
+                buffer.seek(0)
+                cur.copy_expert(self.queries.COPY_IMPORT_STAGING, buffer)
+            
+            # Reported per row and left out of the merge, so one bad
+            # program code does not abort the whole import
+            cur.execute(self.queries.FIND_IMPORT_UNKNOWN_PROGRAMS)
+            unknown_programs = cur.fetchall()
+            
+            previous_programs = {}
+            if on_conflict == 'update':
+                cur.execute(self.queries.FIND_IMPORT_EXISTING)
+                previous_programs = {row['id_number']: row['program_code'] for row in cur.fetchall()}
+                cur.execute(merge_query, (list(previous_programs),))
+            else:
+                cur.execute(merge_query)
+            merged = cur.fetchall()
+            
+            # The merge only updates locked rows, so every updated ID has a
+            # previous program; a missing one would only skip its -1
+            self.enrollment_repository.adjust(
+                cur,
+                removed=[previous_programs.get(row['id_number']) for row in merged if not row['inserted']],
+                added=[row['program_code'] for row in merged]
+            )
+        
+        return {
+            'unknown_programs': unknown_programs,
+            'inserted': [row['id_number'] for row in merged if row['inserted']],
+            'updated': [row['id_number'] for row in merged if not row['inserted']]
+        }
+    
     def update(self, original_id_number, student_data):
         """Update a student"""
         try:
@@ -132,26 +422,68 @@ class StudentRepository:
                         original_id_number
                     )
                 )
-                return cur.fetchone()
+                student = cur.fetchone()
+                if student:
+                    previous_program_code = student.pop('previous_program_code')
+                    self.enrollment_repository.adjust(
+                        cur, removed=[previous_program_code], added=[student['program_code']]
+                    )
+                return student
         except pg_errors.UniqueViolation:
             raise DuplicateEntryError()
         except pg_errors.ForeignKeyViolation:
             raise ForeignKeyError()
     
+    def update_many(self, changes, ids=None, filters=None):
+        """Apply the same changes to every selected student in one statement"""
+        fields = [field for field in self.BATCH_UPDATE_FIELDS if field in changes]
+        set_clause = ', '.join(f"{field} = %s" for field in fields)
+        selection_clause, selection_params = self._build_selection_clause(ids, filters)
+        
+        query = self.queries.UPDATE_MANY.format(
+            set_clause=set_clause,
+            selection_clause=selection_clause
+        )
+        
+        try:
+            with get_connection() as conn, conn.cursor() as cur:
+                cur.execute(query, tuple(changes[field] for field in fields) + tuple(selection_params))
+                students = cur.fetchall()
+                
+                previous_program_codes = [student.pop('previous_program_code') for student in students]
+                self.enrollment_repository.adjust(
+                    cur,
+                    removed=previous_program_codes,
+                    added=[student['program_code'] for student in students]
+                )
+                return students
+        except pg_errors.ForeignKeyViolation:
+            raise ForeignKeyError()
+    
+    def delete_many(self, ids=None, filters=None):
+        """Delete every selected student in one statement"""
+        selection_clause, selection_params = self._build_selection_clause(ids, filters)
+        query = self.queries.DELETE_MANY.format(selection_clause=selection_clause)
+        
+        with get_connection() as conn, conn.cursor() as cur:
+            cur.execute(query, tuple(selection_params))
+            students = cur.fetchall()
+            self.enrollment_repository.adjust(
+                cur, removed=[student['program_code'] for student in students]
+            )
+            return students
+    
     def delete(self, student_id):
         """Delete a student"""
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(self.queries.DELETE, (student_id,))
-            return cur.fetchone()
+            student = cur.fetchone()
+            if student:
+                self.enrollment_repository.adjust(cur, removed=[student['program_code']])
+            return student
     
     def get_students_per_program(self):
         """Get number of students per program"""
         with get_connection() as conn, conn.cursor() as cur:
             cur.execute(self.queries.GET_STUDENTS_PER_PROGRAM)
             return cur.fetchall()
-    
-    def get_programs(self):
-        """Get all programs for dropdown filter"""
-        with get_connection() as conn, conn.cursor() as cur:
-            cur.execute(self.queries.GET_ALL_PROGRAMS)
-            return cur.fetchall()
\ No newline at end of file
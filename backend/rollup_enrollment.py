@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Record the day's enrollment counts per program, college, year level and
+gender for /dashboard/trends. Run it once a day, e.g. from cron:
+
+    5 0 * * * cd /path/to/backend && python rollup_enrollment.py
+
+Counts are taken as the students table stands when the job runs. Re-running
+for the same day replaces that day's rows.
+
+    python rollup_enrollment.py                  # today
+    python rollup_enrollment.py --day 2025-06-01 # store under another day
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.dashboard_service import DashboardService
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record daily enrollment counts for trend charts")
+    parser.add_argument('--day', type=date.fromisoformat, help='Day to store the counts under (default: today)')
+    args = parser.parse_args(argv)
+
+    rows = DashboardService().rollup_enrollment(args.day)
+    print(f"Stored {rows} enrollment rollup row(s) for {args.day or date.today()}.")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
\ No newline at end of file
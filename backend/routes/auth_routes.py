@@ -1,15 +1,18 @@
 from flask import Blueprint
+from utils.admission import limit_concurrency
 from controllers.auth_controller import AuthController
 
 auth_bp = Blueprint('auth', __name__)
 auth_controller = AuthController()
 
 @auth_bp.route('/auth/register', methods=['POST'])
+@limit_concurrency('light')
 def register():
     """Register a new user"""
     return auth_controller.register()
 
 @auth_bp.route('/auth/login', methods=['POST'])
+@limit_concurrency('light')
 def login():
     """Login user"""
     return auth_controller.login()
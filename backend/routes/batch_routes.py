@@ -0,0 +1,14 @@
+from flask import Blueprint
+from utils.auth import jwt_required
+from utils.admission import limit_concurrency
+from controllers.batch_controller import BatchController
+
+batch_bp = Blueprint('batch', __name__)
+batch_controller = BatchController()
+
+@batch_bp.route('/batch', methods=['POST'])
+@jwt_required()
+@limit_concurrency('batch')
+def batch():
+    """Run several API requests in one round trip"""
+    return batch_controller.dispatch()
\ No newline at end of file
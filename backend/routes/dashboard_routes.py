@@ -1,5 +1,7 @@
 from flask import Blueprint
-from flask_jwt_extended import jwt_required
+from utils.auth import jwt_required
+from utils.admission import limit_concurrency
+from utils.etag import conditional_get
 from controllers.dashboard_controller import DashboardController
 
 dashboard_bp = Blueprint('dashboard', __name__)
@@ -7,30 +9,54 @@ dashboard_controller = DashboardController()
 
 @dashboard_bp.route('/dashboard/summary', methods=['GET'])
 @jwt_required()
+@conditional_get('colleges', 'programs', 'students')
+@limit_concurrency('heavy')
 def get_dashboard_summary():
     """Get complete dashboard summary"""
     return dashboard_controller.get_summary()
 
 @dashboard_bp.route('/dashboard/totals', methods=['GET'])
 @jwt_required()
+@conditional_get('colleges', 'programs', 'students')
+@limit_concurrency('light')
 def get_dashboard_totals():
     """Get only total counts"""
     return dashboard_controller.get_totals()
 
 @dashboard_bp.route('/dashboard/students-per-college', methods=['GET'])
 @jwt_required()
+@conditional_get('colleges', 'programs', 'students')
+@limit_concurrency('heavy')
 def get_dashboard_students_per_college():
     """Get students per college"""
     return dashboard_controller.get_students_per_college()
 
 @dashboard_bp.route('/dashboard/top-programs', methods=['GET'])
 @jwt_required()
+@conditional_get('colleges', 'programs', 'students')
+@limit_concurrency('heavy')
 def get_dashboard_top_programs():
     """Get top programs by enrollment"""
     return dashboard_controller.get_top_programs()
 
 @dashboard_bp.route('/dashboard/college-stats', methods=['GET'])
 @jwt_required()
+@conditional_get('colleges', 'programs', 'students')
+@limit_concurrency('heavy')
 def get_dashboard_college_stats():
     """Get college statistics"""
-    return dashboard_controller.get_college_stats()
\ No newline at end of file
+    return dashboard_controller.get_college_stats()
+
+@dashboard_bp.route('/dashboard/trends', methods=['GET'])
+@jwt_required()
+@conditional_get('enrollment_daily', get_key=dashboard_controller.trend_range_key)
+@limit_concurrency('heavy')
+def get_dashboard_trends():
+    """Get daily enrollment counts from the rollup table"""
+    return dashboard_controller.get_trends()
+
+@dashboard_bp.route('/dashboard/stream', methods=['GET'])
+@jwt_required(locations=['headers', 'query_string'])
+def stream_dashboard():
+    """Stream dashboard count changes (EventSource sends the token as ?jwt=)"""
+    return dashboard_controller.stream()
\ No newline at end of file
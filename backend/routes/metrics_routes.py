@@ -0,0 +1,12 @@
+from flask import Blueprint
+from utils.auth import jwt_required
+from controllers.metrics_controller import MetricsController
+
+metrics_bp = Blueprint('metrics', __name__)
+metrics_controller = MetricsController()
+
+@metrics_bp.route('/metrics/admission', methods=['GET'])
+@jwt_required()
+def get_admission_metrics():
+    """Get queue depth, rejections and pool usage (never limited itself)"""
+    return metrics_controller.get_admission()
\ No newline at end of file
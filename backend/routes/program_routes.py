@@ -1,36 +1,46 @@
 from flask import Blueprint
-from flask_jwt_extended import jwt_required
+from utils.auth import jwt_required
+from utils.admission import limit_concurrency
+from utils.etag import conditional_get
+from services.reference_data_service import ReferenceDataService
 from controllers.program_controller import ProgramController
 
 programs_bp = Blueprint('programs', __name__)
 program_controller = ProgramController()
+reference_data_service = ReferenceDataService()
 
 @programs_bp.route('/programs', methods=['GET'])
 @jwt_required()
+@conditional_get('programs')
+@limit_concurrency('light')
 def get_programs():
     """Get all programs"""
     return program_controller.get_all()
 
 @programs_bp.route('/programs', methods=['POST'])
 @jwt_required()
+@limit_concurrency('light')
 def add_program():
     """Add a new program"""
     return program_controller.create()
 
 @programs_bp.route('/programs-list', methods=['GET'])
-
+@conditional_get('programs', get_versions=reference_data_service.get_versions)
+@limit_concurrency('light')
 def get_programs_list():
     """Get all programs as simple list (for dropdowns)"""
     return program_controller.get_all_list()
 
 @programs_bp.route('/programs/<string:program_code>', methods=['PUT'])
 @jwt_required()
+@limit_concurrency('light')
 def update_program(program_code):
     """Update a program"""
     return program_controller.update(program_code)
 
 @programs_bp.route('/programs/<string:program_code>', methods=['DELETE'])
 @jwt_required()
+@limit_concurrency('light')
 def delete_program(program_code):
     """Delete a program"""
     return program_controller.delete(program_code)
\ No newline at end of file
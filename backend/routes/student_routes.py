@@ -1,43 +1,92 @@
 from flask import Blueprint
-from flask_jwt_extended import jwt_required
+from utils.auth import jwt_required
+from utils.admission import limit_concurrency
+from utils.etag import conditional_get
+from services.reference_data_service import ReferenceDataService
 from controllers.student_controller import StudentController
 
 students_bp = Blueprint('students', __name__)
 student_controller = StudentController()
+reference_data_service = ReferenceDataService()
 
 
 @students_bp.route('/students', methods=['GET'])
 @jwt_required()
+@conditional_get('students', 'programs', 'colleges')
+@limit_concurrency('light')
 def get_students():
     """Get all students"""
     return student_controller.get_all()
 
+@students_bp.route('/students/export', methods=['GET'])
+@jwt_required()
+@limit_concurrency('export')
+def export_students():
+    """Stream students as CSV or NDJSON"""
+    return student_controller.export()
+
+@students_bp.route('/students/import', methods=['POST'])
+@jwt_required()
+@limit_concurrency('heavy')
+def import_students():
+    """Bulk-import students from CSV or JSON"""
+    return student_controller.import_students()
+
 @students_bp.route('/students', methods=['POST'])
 @jwt_required()
+@limit_concurrency('light')
 def add_student():
     """Add a new student"""
     return student_controller.create()
 
+@students_bp.route('/students/batch', methods=['PATCH'])
+@jwt_required()
+@limit_concurrency('heavy')
+def batch_update_students():
+    """Update many students at once"""
+    return student_controller.batch_update()
+
+@students_bp.route('/students/batch', methods=['DELETE'])
+@jwt_required()
+@limit_concurrency('heavy')
+def batch_delete_students():
+    """Delete many students at once"""
+    return student_controller.batch_delete()
+
+@students_bp.route('/students/<string:student_id>', methods=['GET'])
+@jwt_required()
+@conditional_get('students', 'programs', 'colleges')
+@limit_concurrency('light')
+def get_student(student_id):
+    """Get a single student"""
+    return student_controller.get_one(student_id)
+
 @students_bp.route('/students/<string:student_id>', methods=['PUT'])
 @jwt_required()
+@limit_concurrency('light')
 def update_student(student_id):
     """Update a student"""
     return student_controller.update(student_id)
 
 @students_bp.route('/students/<string:student_id>', methods=['DELETE'])
 @jwt_required()
+@limit_concurrency('light')
 def delete_student(student_id):
     """Delete a student"""
     return student_controller.delete(student_id)
 
 @students_bp.route('/students/programs', methods=['GET'])
 @jwt_required()
+@conditional_get('programs', 'students')
+@limit_concurrency('heavy')
 def get_students_per_program():
     """Get number of students per program"""
     return student_controller.get_students_per_program()
 
 @students_bp.route('/students/programs/list', methods=['GET'])
 @jwt_required()
+@conditional_get('programs', get_versions=reference_data_service.get_versions)
+@limit_concurrency('light')
 def get_programs():
     """Get all programs for dropdown"""
     return student_controller.get_programs()
\ No newline at end of file
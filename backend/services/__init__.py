@@ -4,6 +4,7 @@ from .program_service import ProgramService
 from .student_service import StudentService
 from .storage_service import StorageService
 from .dashboard_service import DashboardService
+from .data_version_service import DataVersionService
 
 __all__ = [
     'AuthService',
@@ -11,5 +12,6 @@ __all__ = [
     'ProgramService',
     'StudentService',
     'StorageService',
-    'DashboardService'
+    'DashboardService',
+    'DataVersionService'
 ]
\ No newline at end of file
@@ -1,7 +1,9 @@
 import bcrypt
 from repositories.auth_repository import AuthRepository
 from utils.exceptions import AuthenticationError, DuplicateEntryError
+from utils.timing import timed_layer
 
+@timed_layer('service')
 class AuthService:
     def __init__(self):
         self.auth_repository = AuthRepository()
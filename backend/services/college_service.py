@@ -1,22 +1,37 @@
 from repositories.college_repository import CollegeRepository
+from services.data_version_service import DataVersionService
+from services.dashboard_service import DashboardService
+from services.reference_data_service import ReferenceDataService
 from utils.exceptions import DuplicateEntryError, NotFoundError
+from utils.timing import timed_layer
 
+@timed_layer('service')
 class CollegeService:
     def __init__(self):
         self.college_repository = CollegeRepository()
+        self.data_version_service = DataVersionService()
+        self.reference_data_service = ReferenceDataService()
     
-    def get_all_colleges(self, page=1, per_page=10, search='', sort_field='college_code', sort_direction='asc'):
+    def get_all_colleges(self, page=1, per_page=10, search='', sort_field='college_code', sort_direction='asc', fields=None, columnar=False):
         """Get paginated colleges with optional search and sorting"""
-        return self.college_repository.find_all(page, per_page, search, sort_field, sort_direction)
+        return self.college_repository.find_all(page, per_page, search, sort_field, sort_direction, fields, columnar)
+    
+    def get_colleges_by_cursor(self, per_page=10, search='', sort_field='college_code', sort_direction='asc', cursor=None, fields=None, columnar=False):
+        """Get a keyset page of colleges, starting after the given cursor"""
+        return self.college_repository.find_all_keyset(per_page, search, sort_field, sort_direction, cursor, fields, columnar)
     
     def get_all_colleges_list(self):
         """Get all colleges without pagination (for dropdowns)"""
-        return self.college_repository.find_all_list()
+        return self.reference_data_service.get_colleges()
     
     def create_college(self, college_data):
         """Create a new college"""
         try:
-            return self.college_repository.create(college_data)
+            result = self.college_repository.create(college_data)
+            self.data_version_service.bump('colleges')
+            DashboardService.invalidate()
+            ReferenceDataService.invalidate()
+            return result
         except DuplicateEntryError:
             raise DuplicateEntryError(
                 f"College code '{college_data['college_code']}' already exists"
@@ -28,6 +43,9 @@ class CollegeService:
             result = self.college_repository.update(original_code, college_data)
             if not result:
                 raise NotFoundError(f"College with code '{original_code}' not found")
+            self.data_version_service.bump('colleges')
+            DashboardService.invalidate()
+            ReferenceDataService.invalidate()
             return result
         except DuplicateEntryError:
             raise DuplicateEntryError(
@@ -39,6 +57,9 @@ class CollegeService:
         result = self.college_repository.delete(college_code)
         if not result:
             raise NotFoundError(f"College with code '{college_code}' not found")
+        self.data_version_service.bump('colleges')
+        DashboardService.invalidate()
+        ReferenceDataService.invalidate()
         return result
     
     def get_stats_per_college(self):
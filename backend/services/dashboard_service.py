@@ -1,29 +1,142 @@
+import queue
+import time
+from datetime import date, timedelta
 from repositories.dashboard_repository import DashboardRepository
+from services.data_version_service import DataVersionService
+from config.dashboard_config import DashboardConfig
+from utils.cache import TTLCache
+from utils.exceptions import ValidationError
+from utils.timing import timed_layer
 
+@timed_layer('service')
 class DashboardService:
+    # Shared by every instance, so each process computes a section once per TTL
+    cache = TTLCache(DashboardConfig.CACHE_TTL)
+    
+    # Tables whose data versions are part of every cache key
+    CACHE_TABLES = ('colleges', 'programs', 'students')
+    
+    # Versions last read for the cache keys, and when
+    _versions = None
+    _versions_checked_at = None
+    
     def __init__(self):
         self.dashboard_repository = DashboardRepository()
+        self.data_version_service = DataVersionService()
+    
+    @classmethod
+    def invalidate(cls):
+        """Forget cached sections after a student, program or college write"""
+        cls.cache.invalidate()
+        cls._versions_checked_at = None
+    
+    def _cache_versions(self):
+        """Get the data versions for cache keys, read at most every VERSION_CHECK_INTERVAL seconds"""
+        cls = type(self)
+        checked_at = cls._versions_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < DashboardConfig.VERSION_CHECK_INTERVAL:
+            return cls._versions
+        versions = self.data_version_service.get_versions(self.CACHE_TABLES)
+        cls._versions = tuple(versions.get(table, 0) for table in self.CACHE_TABLES)
+        cls._versions_checked_at = time.monotonic()
+        return cls._versions
+    
+    def _cached(self, section, compute):
+        """Get a section from the cache, keyed by the shared data versions.
+
+        invalidate() only clears this process; writes made by other
+        processes move the versions, which are re-read every few seconds.
+        """
+        return self.cache.get_or_compute((section,) + self._cache_versions(), compute)
     
     def get_dashboard_summary(self):
         """Get comprehensive dashboard summary"""
-        return self.dashboard_repository.get_dashboard_summary()
+        return self._cached('summary', self.dashboard_repository.get_dashboard_summary)
     
     def get_totals(self):
         """Get only total counts"""
-        return {
-            'total_students': self.dashboard_repository.get_total_students(),
-            'total_programs': self.dashboard_repository.get_total_programs(),
-            'total_colleges': self.dashboard_repository.get_total_colleges()
-        }
+        estimated = DashboardConfig.TOTALS_MODE == 'estimated'
+        return self._cached('totals', lambda: self.dashboard_repository.get_totals(estimated))
     
     def get_students_per_college(self):
         """Get students per college"""
-        return self.dashboard_repository.get_students_per_college()
+        return self._cached('students_per_college', self.dashboard_repository.get_students_per_college)
     
     def get_top_programs(self):
         """Get top programs by enrollment"""
-        return self.dashboard_repository.get_top_programs()
+        return self._cached('top_programs', self.dashboard_repository.get_top_programs)
     
     def get_college_stats(self):
         """Get comprehensive college statistics"""
-        return self.dashboard_repository.get_college_stats()
\ No newline at end of file
+        return self._cached('college_stats', self.dashboard_repository.get_college_stats)
+    
+    def rollup_enrollment(self, day=None):
+        """Record today's (or the given day's) enrollment counts for trend queries"""
+        rows = self.dashboard_repository.rollup_day(day or date.today())
+        self.data_version_service.bump('enrollment_daily')
+        return rows
+    
+    def _parse_day(self, value, name):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValidationError(f"{name} must be a date like 2025-01-31")
+    
+    def resolve_trend_range(self, start=None, end=None):
+        """Get the (from, to) dates a trends request covers; the default window ends today"""
+        end = self._parse_day(end, 'to') if end else date.today()
+        start = self._parse_day(start, 'from') if start else end - timedelta(days=DashboardConfig.TRENDS_DEFAULT_DAYS - 1)
+        if start > end:
+            raise ValidationError("from must not be after to")
+        if (end - start).days >= DashboardConfig.TRENDS_MAX_DAYS:
+            raise ValidationError(f"At most {DashboardConfig.TRENDS_MAX_DAYS} days per request")
+        return start, end
+    
+    def get_trends(self, group_by='total', start=None, end=None, filters=None):
+        """Get daily enrollment counts from the rollup table, optionally per group"""
+        if group_by != 'total' and group_by not in self.dashboard_repository.TREND_FIELDS:
+            raise ValidationError(
+                f"group_by must be one of: total, {', '.join(self.dashboard_repository.TREND_FIELDS)}"
+            )
+        
+        start, end = self.resolve_trend_range(start, end)
+        trends = self.dashboard_repository.get_trends(
+            start, end, None if group_by == 'total' else group_by, filters
+        )
+        return {
+            'group_by': group_by,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'trends': trends
+        }
+    
+    def open_change_stream(self):
+        """Subscribe to count changes, then read a fresh summary for them to apply to.
+
+        Subscribing first means no change committed after the summary is
+        missed; one committed in between may already be included in it,
+        which is why changes carry absolute counts alongside their deltas.
+        """
+        subscription = self.dashboard_repository.subscribe_to_changes()
+        try:
+            snapshot = self.dashboard_repository.get_dashboard_summary()
+        except Exception:
+            self.dashboard_repository.unsubscribe_from_changes(subscription)
+            raise
+        return snapshot, subscription
+    
+    def next_change(self, subscription):
+        """Wait for the next committed change, or return None after a quiet heartbeat interval"""
+        try:
+            payload = subscription.get(timeout=DashboardConfig.STREAM_HEARTBEAT)
+        except queue.Empty:
+            return None
+        return self.dashboard_repository.decode_change(payload)
+    
+    def close_change_stream(self, subscription):
+        """Stop receiving changes for a closed stream"""
+        self.dashboard_repository.unsubscribe_from_changes(subscription)
+
+# A change may come from another process, whose cache clear this one missed;
+# cleared once per change by the shared listener, not once per stream
+DashboardRepository.on_change(DashboardService.invalidate)
\ No newline at end of file
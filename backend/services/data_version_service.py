@@ -0,0 +1,25 @@
+from repositories.data_version_repository import DataVersionRepository
+from utils.timing import timed_layer
+
+@timed_layer('service')
+class DataVersionService:
+    # Renamed or deleted codes cascade into the tables that reference them,
+    # and program rows show their college's name, so those are bumped too
+    DEPENDENT_TABLES = {
+        'colleges': ['programs'],
+        'programs': ['students'],
+        'students': [],
+        'enrollment_daily': []
+    }
+    
+    def __init__(self):
+        self.data_version_repository = DataVersionRepository()
+    
+    def get_versions(self, tables):
+        """Get the current data version of each table"""
+        return self.data_version_repository.find_versions(tables)
+    
+    def bump(self, table):
+        """Record a write to a table, invalidating ETags built from its version"""
+        tables = [table] + self.DEPENDENT_TABLES.get(table, [])
+        self.data_version_repository.bump(tables)
\ No newline at end of file
@@ -1,22 +1,44 @@
 from repositories.program_repository import ProgramRepository
+from services.data_version_service import DataVersionService
+from services.dashboard_service import DashboardService
+from services.reference_data_service import ReferenceDataService
 from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError
+from utils.timing import timed_layer
 
+@timed_layer('service')
 class ProgramService:
     def __init__(self):
         self.program_repository = ProgramRepository()
+        self.data_version_service = DataVersionService()
+        self.reference_data_service = ReferenceDataService()
     
-    def get_all_programs(self, page=1, per_page=10, search='', sort_field='program_code', sort_direction='asc'):
+    def _check_college(self, program_data):
+        """Reject an unknown college code before touching the database"""
+        college_code = program_data.get('college_code')
+        if college_code and not self.reference_data_service.college_exists(college_code):
+            raise ForeignKeyError(f"College code '{college_code}' does not exist")
+    
+    def get_all_programs(self, page=1, per_page=10, search='', sort_field='program_code', sort_direction='asc', fields=None, columnar=False):
         """Get paginated programs with optional search and sorting"""
-        return self.program_repository.find_all(page, per_page, search, sort_field, sort_direction)
+        return self.program_repository.find_all(page, per_page, search, sort_field, sort_direction, fields, columnar)
+    
+    def get_programs_by_cursor(self, per_page=10, search='', sort_field='program_code', sort_direction='asc', cursor=None, fields=None, columnar=False):
+        """Get a keyset page of programs, starting after the given cursor"""
+        return self.program_repository.find_all_keyset(per_page, search, sort_field, sort_direction, cursor, fields, columnar)
     
     def get_all_programs_list(self):
         """Get all programs without pagination (for dropdowns)"""
-        return self.program_repository.find_all_list()
+        return self.reference_data_service.get_programs()
     
     def create_program(self, program_data):
         """Create a new program"""
+        self._check_college(program_data)
         try:
-            return self.program_repository.create(program_data)
+            result = self.program_repository.create(program_data)
+            self.data_version_service.bump('programs')
+            DashboardService.invalidate()
+            ReferenceDataService.invalidate()
+            return result
         except DuplicateEntryError:
             raise DuplicateEntryError(
                 f"Program code '{program_data['program_code']}' already exists"
@@ -28,10 +50,17 @@ class ProgramService:
     
     def update_program(self, original_code, program_data):
         """Update a program"""
+        # A missing program is reported before a bad college
+        if not self.reference_data_service.program_exists(original_code):
+            raise NotFoundError(f"Program with code '{original_code}' not found")
+        self._check_college(program_data)
         try:
             result = self.program_repository.update(original_code, program_data)
             if not result:
                 raise NotFoundError(f"Program with code '{original_code}' not found")
+            self.data_version_service.bump('programs')
+            DashboardService.invalidate()
+            ReferenceDataService.invalidate()
             return result
         except DuplicateEntryError:
             raise DuplicateEntryError(
@@ -47,4 +76,7 @@ class ProgramService:
         result = self.program_repository.delete(program_code)
         if not result:
             raise NotFoundError(f"Program with code '{program_code}' not found")
+        self.data_version_service.bump('programs')
+        DashboardService.invalidate()
+        ReferenceDataService.invalidate()
         return result
\ No newline at end of file
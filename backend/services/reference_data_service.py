@@ -0,0 +1,119 @@
+import threading
+import time
+from repositories.college_repository import CollegeRepository
+from repositories.program_repository import ProgramRepository
+from services.data_version_service import DataVersionService
+from config.reference_data_config import ReferenceDataConfig
+from utils.timing import timed_layer
+
+class ReferenceSnapshot:
+    """Immutable copy of every college and program, in dropdown order"""
+    __slots__ = ('versions', 'colleges', 'programs', 'program_options',
+                 'college_names', 'program_names', 'program_colleges')
+    
+    def __init__(self, versions, colleges, programs):
+        self.versions = versions
+        self.colleges = colleges
+        self.programs = programs
+        self.program_options = [
+            {'program_code': p['program_code'], 'program_name': p['program_name']}
+            for p in programs
+        ]
+        self.college_names = {c['college_code']: c['college_name'] for c in colleges}
+        self.program_names = {p['program_code']: p['program_name'] for p in programs}
+        self.program_colleges = {p['program_code']: p['college_code'] for p in programs}
+
+@timed_layer('service')
+class ReferenceDataService:
+    """Serves colleges and programs from a per-process snapshot.
+
+    The snapshot is rebuilt when the colleges or programs data version
+    moves, checked at most every CHECK_INTERVAL seconds, and swapped in as
+    a whole so readers never see a half-loaded copy.
+    """
+    TABLES = ('colleges', 'programs')
+    
+    # Shared by every instance in the process
+    _snapshot = None
+    _checked_at = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.college_repository = CollegeRepository()
+        self.program_repository = ProgramRepository()
+        self.data_version_service = DataVersionService()
+    
+    @classmethod
+    def invalidate(cls):
+        """Check the data versions on the next read, after a college or program write"""
+        cls._checked_at = None
+    
+    @classmethod
+    def _is_fresh(cls):
+        return (cls._snapshot is not None and cls._checked_at is not None and
+                time.monotonic() - cls._checked_at < ReferenceDataConfig.CHECK_INTERVAL)
+    
+    def get_snapshot(self):
+        """Get the current snapshot, reloading it if its data versions moved"""
+        cls = type(self)
+        if cls._is_fresh():
+            return cls._snapshot
+        
+        with cls._lock:
+            if cls._is_fresh():
+                return cls._snapshot
+            try:
+                # Versions are read before the rows, so a write racing the load
+                # leaves the snapshot looking older than it is, never newer
+                versions = self.data_version_service.get_versions(self.TABLES)
+                if cls._snapshot is None or versions != cls._snapshot.versions:
+                    cls._snapshot = ReferenceSnapshot(
+                        versions,
+                        self.college_repository.find_all_list(),
+                        self.program_repository.find_all_list()
+                    )
+                cls._checked_at = time.monotonic()
+            except Exception as e:
+                if cls._snapshot is None:
+                    raise
+                # Keep serving the last snapshot until the database answers again
+                print(f"Warning: Could not refresh reference data: {str(e)}")
+            return cls._snapshot
+    
+    def _contains(self, mapping_name, code):
+        """Look a code up in the snapshot, re-checking the versions once before saying no"""
+        if code in getattr(self.get_snapshot(), mapping_name):
+            return True
+        # It may have been created by another process since the last check
+        type(self).invalidate()
+        return code in getattr(self.get_snapshot(), mapping_name)
+    
+    def program_exists(self, program_code):
+        """Check a program code against the snapshot"""
+        return self._contains('program_names', program_code)
+    
+    def college_exists(self, college_code):
+        """Check a college code against the snapshot"""
+        return self._contains('college_names', college_code)
+    
+    def get_program_codes(self):
+        """Get every program code, re-checking the versions first so the set is current"""
+        type(self).invalidate()
+        return frozenset(self.get_snapshot().program_names)
+    
+    def get_versions(self, tables):
+        """Get the snapshot's data versions, for ETags that need no query"""
+        versions = self.get_snapshot().versions
+        return {table: versions.get(table, 0) for table in tables}
+    
+    def get_colleges(self):
+        """Get all colleges for dropdowns"""
+        return self.get_snapshot().colleges
+    
+    def get_programs(self):
+        """Get all programs with their college for dropdowns"""
+        return self.get_snapshot().programs
+    
+    def get_program_options(self):
+        """Get program codes and names for the student program filter"""
+        return self.get_snapshot().program_options
\ No newline at end of file
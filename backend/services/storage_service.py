@@ -2,7 +2,10 @@ from db import get_supabase_client
 from werkzeug.utils import secure_filename
 from config.storage_config import StorageConfig
 import os
+from urllib.parse import urlparse, unquote
+from utils.timing import timed_layer
 
+@timed_layer('storage')
 class StorageService:
     def __init__(self):
         self.supabase = get_supabase_client()
@@ -57,6 +60,29 @@ class StorageService:
         except Exception as e:
             print(f"Warning: Could not delete picture for {student_id}: {str(e)}")
     
+    def _object_name(self, picture_url):
+        """Get the bucket object name from a public URL returned by upload_picture"""
+        marker = f"/object/public/{self.bucket_name}/"
+        path = urlparse(picture_url).path
+        if marker not in path:
+            return None
+        return unquote(path.split(marker, 1)[1])
+    
+    def delete_pictures(self, picture_urls):
+        """Delete many pictures with one remove call, by their stored public URLs.
+
+        The object names come from the URLs rather than a bucket listing,
+        which is capped at one page of files.
+        """
+        names = [name for name in map(self._object_name, picture_urls) if name]
+        if not names:
+            return
+        
+        try:
+            self.supabase.storage.from_(self.bucket_name).remove(names)
+        except Exception as e:
+            print(f"Warning: Could not delete {len(names)} pictures: {str(e)}")
+    
     def rename_picture(self, old_id, new_id):
         """Rename student picture when ID changes (copy to new name, delete old)"""
         try:
@@ -1,18 +1,146 @@
 from repositories.student_repository import StudentRepository
 from services.storage_service import StorageService
-from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError
+from services.data_version_service import DataVersionService
+from services.dashboard_service import DashboardService
+from services.reference_data_service import ReferenceDataService
+from config.student_config import StudentConfig
+from utils.exceptions import DuplicateEntryError, NotFoundError, ForeignKeyError, ValidationError
+from utils.validators import Validator
+from utils.timing import timed_layer
 
+@timed_layer('service')
 class StudentService:
     def __init__(self):
         self.student_repository = StudentRepository()
         self.storage_service = StorageService()
+        self.data_version_service = DataVersionService()
+        self.reference_data_service = ReferenceDataService()
     
-    def get_all_students(self, page=1, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None):
+    def get_all_students(self, page=1, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None, fields=None, columnar=False, expand=None):
         """Get paginated students with optional search, sorting, and filters"""
-        return self.student_repository.find_all(page, per_page, search, sort_field, sort_direction, filters)
+        return self.student_repository.find_all(page, per_page, search, sort_field, sort_direction, filters, fields, columnar, expand)
+    
+    def get_students_by_cursor(self, per_page=10, search='', sort_field='id_number', sort_direction='asc', filters=None, cursor=None, fields=None, columnar=False, expand=None):
+        """Get a keyset page of students, starting after the given cursor"""
+        return self.student_repository.find_all_keyset(per_page, search, sort_field, sort_direction, filters, cursor, fields, columnar, expand)
+    
+    def get_student(self, student_id, fields=None, expand=None):
+        """Get one student, optionally expanded with program and college fields"""
+        student = self.student_repository.find_detail(student_id, fields, expand)
+        
+        if not student:
+            raise NotFoundError(f"Student with ID '{student_id}' not found")
+        
+        return student
+    
+    def export_students(self, search='', sort_field='id_number', sort_direction='asc', filters=None):
+        """Get the export columns and a row iterator over every matching student"""
+        rows = self.student_repository.iter_all(search, sort_field, sort_direction, filters)
+        return self.student_repository.COLUMNS, rows
+    
+    def _check_program(self, program_code):
+        """Reject an unknown program code before any storage or database work"""
+        if program_code and not self.reference_data_service.program_exists(program_code):
+            raise ForeignKeyError(f"Program code '{program_code}' does not exist")
+    
+    def import_students(self, records, on_conflict='skip'):
+        """Bulk-load student records, reporting bad rows instead of failing the whole file.
+
+        Rows are validated in batches and COPY-ed into a staging table as they
+        go; the staged rows are merged into students in one statement.
+        on_conflict decides whether existing IDs are skipped or updated.
+        """
+        if on_conflict not in ('skip', 'update'):
+            raise ValidationError("on_conflict must be 'skip' or 'update'")
+        
+        errors = []
+        staged = {}  # id_number -> row it was first seen on
+        # Read up front: the batches are consumed inside bulk_import's open
+        # connection, so validating them must not touch the database
+        program_codes = self.reference_data_service.get_program_codes()
+        
+        def validated_batches():
+            batch = []
+            for row_number, record in enumerate(records, start=1):
+                try:
+                    if not isinstance(record, dict):
+                        raise ValidationError("Row must be an object with student fields")
+                    student = Validator.validate_student(
+                        record, StudentConfig.YEAR_LEVELS, StudentConfig.GENDERS
+                    )
+                except ValidationError as e:
+                    errors.append({
+                        'row': row_number,
+                        'id_number': record.get('id_number') if isinstance(record, dict) else None,
+                        'error': str(e)
+                    })
+                    continue
+                
+                program_code = student['program_code']
+                if program_code not in program_codes:
+                    errors.append({
+                        'row': row_number,
+                        'id_number': student['id_number'],
+                        'error': f"Program code '{program_code}' does not exist"
+                    })
+                    continue
+                
+                if student['id_number'] in staged:
+                    errors.append({
+                        'row': row_number,
+                        'id_number': student['id_number'],
+                        'error': f"Duplicate of row {staged[student['id_number']]} in this import"
+                    })
+                    continue
+                
+                staged[student['id_number']] = row_number
+                batch.append((row_number, student))
+                if len(batch) >= StudentConfig.IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        
+        result = self.student_repository.bulk_import(validated_batches(), on_conflict)
+        if result['inserted'] or result['updated']:
+            self.data_version_service.bump('students')
+            DashboardService.invalidate()
+        
+        unknown_ids = set()
+        for row in result['unknown_programs']:
+            unknown_ids.add(row['id_number'])
+            errors.append({
+                'row': row['row_number'],
+                'id_number': row['id_number'],
+                'error': f"Program code '{row['program_code']}' does not exist"
+            })
+        
+        merged = set(result['inserted']) | set(result['updated'])
+        skipped = [
+            id_number for id_number in staged
+            if id_number not in merged and id_number not in unknown_ids
+        ]
+        for id_number in skipped:
+            errors.append({
+                'row': staged[id_number],
+                'id_number': id_number,
+                'error': f"Student ID '{id_number}' already exists"
+            })
+        
+        errors.sort(key=lambda error: error['row'])
+        
+        return {
+            'total': len(errors) + len(merged),
+            'inserted': len(result['inserted']),
+            'updated': len(result['updated']),
+            'skipped': len(skipped),
+            'failed': len(errors) - len(skipped),
+            'errors': errors
+        }
     
     def create_student(self, student_data, picture_file=None):
         """Create a new student with optional picture"""
+        self._check_program(student_data.get('program_code'))
         picture_url = None
         
         try:
@@ -27,7 +155,10 @@ class StudentService:
             student_data['picture'] = picture_url
             
             # Create student in database
-            return self.student_repository.create(student_data)
+            result = self.student_repository.create(student_data)
+            self.data_version_service.bump('students')
+            DashboardService.invalidate()
+            return result
             
         except DuplicateEntryError:
             if picture_url:
@@ -44,15 +175,16 @@ class StudentService:
     
     def update_student(self, original_id_number, student_data, picture_file=None):
         """Update a student with optional new picture"""
+        # Get current student data; a missing student is reported before a bad program
+        current_student = self.student_repository.find_by_id(original_id_number)
+        
+        if not current_student:
+            raise NotFoundError(
+                f"Student with ID '{original_id_number}' not found"
+            )
+        
+        self._check_program(student_data.get('program_code'))
         try:
-            # Get current student data
-            current_student = self.student_repository.find_by_id(original_id_number)
-            
-            if not current_student:
-                raise NotFoundError(
-                    f"Student with ID '{original_id_number}' not found"
-                )
-            
             current_picture_url = current_student['picture']
             picture_url = None
             
@@ -94,6 +226,8 @@ class StudentService:
                     f"Student with ID '{original_id_number}' not found"
                 )
             
+            self.data_version_service.bump('students')
+            DashboardService.invalidate()
             return result
             
         except DuplicateEntryError:
@@ -130,15 +264,93 @@ class StudentService:
         if not result:
             raise NotFoundError(f"Student with ID '{student_id}' not found")
         
+        self.data_version_service.bump('students')
+        DashboardService.invalidate()
+        
         # Delete picture from storage
         self.storage_service.delete_picture(student_id)
         
         return result
     
+    def _validate_field_values(self, values):
+        """Check year_level and gender values against the allowed choices"""
+        if 'year_level' in values and values['year_level'] not in StudentConfig.YEAR_LEVELS:
+            raise ValidationError(f"Year level must be one of: {', '.join(StudentConfig.YEAR_LEVELS)}")
+        if 'gender' in values and values['gender'] not in StudentConfig.GENDERS:
+            raise ValidationError(f"Gender must be one of: {', '.join(StudentConfig.GENDERS)}")
+    
+    def _validate_batch_selection(self, ids, filters):
+        """Check which students a batch operation targets, refusing to select everyone"""
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+                raise ValidationError("ids must be a list of student IDs")
+            if not ids:
+                raise ValidationError("ids must not be empty")
+            if len(ids) > StudentConfig.BATCH_MAX_IDS:
+                raise ValidationError(f"At most {StudentConfig.BATCH_MAX_IDS} ids per batch")
+        
+        filters = filters or {}
+        if not isinstance(filters, dict):
+            raise ValidationError("filters must be an object")
+        unknown = set(filters) - set(self.student_repository.FILTER_FIELDS)
+        if unknown:
+            raise ValidationError(f"Unknown filter fields: {', '.join(sorted(unknown))}")
+        filters = {field: value for field, value in filters.items() if value}
+        self._validate_field_values(filters)
+        
+        if ids is None and not filters:
+            raise ValidationError("Select students with 'ids' or 'filters'")
+        
+        return ids, filters or None
+    
+    def batch_update_students(self, changes, ids=None, filters=None):
+        """Apply the same field changes to every selected student in one transaction"""
+        ids, filters = self._validate_batch_selection(ids, filters)
+        
+        if not isinstance(changes, dict) or not changes:
+            raise ValidationError("changes must be a non-empty object")
+        unknown = set(changes) - set(self.student_repository.BATCH_UPDATE_FIELDS)
+        if unknown:
+            raise ValidationError(
+                f"Batch updates can only change: {', '.join(self.student_repository.BATCH_UPDATE_FIELDS)}"
+            )
+        self._validate_field_values(changes)
+        if 'program_code' in changes and not changes['program_code']:
+            raise ValidationError("program_code must not be empty")
+        if 'program_code' in changes:
+            self._check_program(changes['program_code'])
+        
+        try:
+            students = self.student_repository.update_many(changes, ids, filters)
+        except ForeignKeyError:
+            raise ForeignKeyError(f"Program code '{changes['program_code']}' does not exist")
+        
+        if students:
+            self.data_version_service.bump('students')
+            DashboardService.invalidate()
+        
+        return {'updated': len(students), 'students': students}
+    
+    def batch_delete_students(self, ids=None, filters=None):
+        """Delete every selected student in one transaction, then their pictures in one call"""
+        ids, filters = self._validate_batch_selection(ids, filters)
+        
+        students = self.student_repository.delete_many(ids, filters)
+        
+        if students:
+            self.data_version_service.bump('students')
+            DashboardService.invalidate()
+        
+        self.storage_service.delete_pictures(
+            [student['picture'] for student in students if student['picture']]
+        )
+        
+        return {'deleted': len(students), 'students': students}
+    
     def get_students_per_program(self):
         """Get number of students per program"""
         return self.student_repository.get_students_per_program()
     
     def get_programs(self):
         """Get all programs for dropdown filter"""
-        return self.student_repository.get_programs()
\ No newline at end of file
+        return self.reference_data_service.get_program_options()
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+The single-statement dashboard summary must match the per-section queries
+and the original joins over students.
+
+Seeds its own schema in the database at DATABASE_URL and drops it again;
+skipped when DATABASE_URL is not set. The large roster only runs when
+DASHBOARD_TEST_STUDENTS is set, with that many students (100000 if empty):
+
+    DASHBOARD_TEST_STUDENTS=1000000 pytest tests/test_dashboard_summary.py
+"""
+
+import os
+
+import psycopg2
+import pytest
+from psycopg2.extras import RealDictCursor
+
+from benchmarks.check_dashboard_summary import (
+    AGGREGATE_MIGRATIONS, MIGRATIONS_DIR, SEED_SQL,
+    legacy_path, section_path, single_path, normalize, compare
+)
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+SCHEMA = "test_dashboard_summary"
+LARGE_STUDENTS = int(os.getenv("DASHBOARD_TEST_STUDENTS") or 100_000)
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL is not set")
+
+# An empty roster, and one with colleges without programs, programs without
+# a college or students, students without a program and tied counts
+@pytest.fixture(scope="module", ids=["empty", "seeded", "large"], params=[
+    0,
+    5000,
+    pytest.param(LARGE_STUDENTS, marks=pytest.mark.skipif(
+        "DASHBOARD_TEST_STUDENTS" not in os.environ, reason="DASHBOARD_TEST_STUDENTS is not set"
+    ))
+])
+def cursor(request):
+    conn = psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(SEED_SQL.format(schema=SCHEMA), (request.param,))
+            for filename in AGGREGATE_MIGRATIONS:
+                with open(os.path.join(MIGRATIONS_DIR, filename), encoding='utf-8') as f:
+                    cur.execute(f.read())
+        conn.commit()
+        
+        with conn.cursor() as cur:
+            yield cur
+        conn.rollback()
+    finally:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.commit()
+        conn.close()
+
+def test_section_queries_match_legacy(cursor):
+    expected = normalize(legacy_path(cursor))
+    assert compare(expected, normalize(section_path(cursor))) == []
+
+def test_single_query_matches_legacy(cursor):
+    expected = normalize(legacy_path(cursor))
+    actual = normalize(single_path(cursor))
+    assert compare(expected, actual) == [], {key: (expected[key], actual.get(key)) for key in compare(expected, actual)}
\ No newline at end of file
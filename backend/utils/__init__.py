@@ -5,9 +5,11 @@ from .exceptions import (
     DuplicateEntryError,
     NotFoundError,
     ForeignKeyError,
-    StorageError
+    StorageError,
+    PoolTimeoutError
 )
 from .validators import Validator
+from .connection_pool import ConnectionPool
 
 __all__ = [
     'BaseAppException',
@@ -17,5 +19,7 @@ __all__ = [
     'NotFoundError',
     'ForeignKeyError',
     'StorageError',
-    'Validator'
+    'PoolTimeoutError',
+    'Validator',
+    'ConnectionPool'
 ]
\ No newline at end of file
@@ -0,0 +1,131 @@
+import threading
+import time
+from functools import wraps
+from flask import jsonify, make_response
+from config.admission_config import AdmissionConfig
+
+class AdmissionLimiter:
+    """Bounds how many requests of one class run at once.
+
+    Up to max_concurrent requests are admitted; up to queue_size more wait
+    at most queue_timeout seconds for a slot. Anything beyond that is
+    rejected straight away, so a burst fails fast instead of piling onto
+    the connection pool. max_concurrent <= 0 admits everything.
+    """
+
+    def __init__(self, name, max_concurrent, queue_size=0, queue_timeout=1.0):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._active = 0
+        self._queued = 0
+        self._counters = {
+            'admitted': 0,
+            'queued': 0,
+            'rejected_queue_full': 0,
+            'rejected_timeout': 0,
+            'peak_queued': 0,
+            'total_wait_ms': 0.0
+        }
+
+    def acquire(self):
+        """Take a slot, waiting in the queue if there is room; False when rejected"""
+        started = time.monotonic()
+
+        with self._cond:
+            if self.max_concurrent <= 0 or self._active < self.max_concurrent:
+                self._active += 1
+                self._counters['admitted'] += 1
+                return True
+
+            if self._queued >= self.queue_size:
+                self._counters['rejected_queue_full'] += 1
+                return False
+
+            self._queued += 1
+            self._counters['queued'] += 1
+            self._counters['peak_queued'] = max(self._counters['peak_queued'], self._queued)
+            deadline = started + self.queue_timeout
+            try:
+                while self._active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counters['rejected_timeout'] += 1
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._queued -= 1
+
+            self._active += 1
+            self._counters['admitted'] += 1
+            self._counters['total_wait_ms'] += (time.monotonic() - started) * 1000
+            return True
+
+    def release(self):
+        """Give a slot back and wake one queued request"""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def stats(self):
+        """Get a snapshot of this budget's usage"""
+        with self._cond:
+            # Queued requests end up either admitted or timed out
+            waited = self._counters['queued'] - self._counters['rejected_timeout']
+            return {
+                'concurrency': self.max_concurrent,
+                'queue_size': self.queue_size,
+                'active': self._active,
+                'queue_depth': self._queued,
+                'peak_queue_depth': self._counters['peak_queued'],
+                'admitted': self._counters['admitted'],
+                'queued': self._counters['queued'],
+                'rejected_queue_full': self._counters['rejected_queue_full'],
+                'rejected_timeout': self._counters['rejected_timeout'],
+                'avg_queue_wait_ms': round(self._counters['total_wait_ms'] / waited, 3) if waited else 0.0
+            }
+
+_limiters = {
+    name: AdmissionLimiter(
+        name, budget['concurrency'], budget['queue_size'], AdmissionConfig.QUEUE_TIMEOUT
+    )
+    for name, budget in AdmissionConfig.BUDGETS.items()
+}
+
+def get_admission_stats():
+    """Get usage for every admission budget, keyed by class"""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
+
+def limit_concurrency(budget):
+    """Run the view inside one of the AdmissionConfig budgets.
+
+    Saturated budgets answer 503 with Retry-After before the view touches
+    the database. Streamed responses keep their slot until the stream closes.
+    """
+    limiter = _limiters[budget]
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not limiter.acquire():
+                response = jsonify({'error': f"Server is busy ({budget} requests), try again shortly"})
+                response.status_code = 503
+                response.headers['Retry-After'] = str(AdmissionConfig.RETRY_AFTER)
+                return response
+            
+            try:
+                response = make_response(view(*args, **kwargs))
+            except Exception:
+                limiter.release()
+                raise
+            
+            if response.is_streamed:
+                response.call_on_close(limiter.release)
+            else:
+                limiter.release()
+            return response
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,38 @@
+from functools import wraps
+from flask import current_app, g, request
+from flask_jwt_extended import jwt_required as _jwt_required
+
+# Set by POST /batch on each sub-request's WSGI environ. Clients cannot set
+# environ keys over HTTP, so only the batch controller can supply it.
+VERIFIED_JWT_KEY = 'app.verified_jwt'
+
+def get_verified_jwt():
+    """Capture the JWT that @jwt_required verified for the current request"""
+    return (
+        g._jwt_extended_jwt_header,
+        g._jwt_extended_jwt,
+        g._jwt_extended_jwt_user,
+        g._jwt_extended_jwt_location
+    )
+
+def jwt_required(**options):
+    """flask_jwt_extended.jwt_required that trusts a token the batch already verified.
+
+    A batch sub-request carries the outer request's verified JWT in its
+    environ; it is restored so get_jwt_identity() and friends work, and the
+    token is not decoded again. Every other request is checked as usual.
+    """
+    def decorator(view):
+        checked_view = _jwt_required(**options)(view)
+        
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            verified = request.environ.get(VERIFIED_JWT_KEY)
+            if verified is None:
+                return checked_view(*args, **kwargs)
+            
+            (g._jwt_extended_jwt_header, g._jwt_extended_jwt,
+             g._jwt_extended_jwt_user, g._jwt_extended_jwt_location) = verified
+            return current_app.ensure_sync(view)(*args, **kwargs)
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,80 @@
+import threading
+import time
+
+class _Flight:
+    """One in-progress computation that other callers can wait on"""
+    __slots__ = ('generation', 'done', 'value', 'error')
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after ttl seconds.
+
+    Concurrent misses for the same key share one computation: the first
+    caller computes while the others wait for its result (or its error).
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (expires_at, value)
+        self._in_flight = {}  # key -> _Flight
+        self._generation = 0  # Bumped by invalidate()
+
+    def get_or_compute(self, key, compute):
+        """Get the cached value for key, computing it at most once at a time"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            flight = self._in_flight.get(key)
+            if flight:
+                leader = False
+            else:
+                leader = True
+                flight = self._in_flight[key] = _Flight(self._generation)
+
+        if not leader:
+            return flight.wait()
+
+        try:
+            value = compute()
+        except Exception as e:
+            flight.error = e
+            raise
+        else:
+            flight.value = value
+            with self._lock:
+                # A result computed before an invalidation may predate the write
+                if self.ttl > 0 and flight.generation == self._generation:
+                    now = time.monotonic()
+                    # Keys can carry versions, so superseded ones are dropped here
+                    # rather than waiting to be overwritten
+                    for stale_key in [k for k, entry in self._entries.items() if entry[0] <= now]:
+                        del self._entries[stale_key]
+                    self._entries[key] = (now + self.ttl, value)
+            return value
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+            flight.done.set()
+
+    def invalidate(self):
+        """Drop every entry; computations already running are not cached or shared"""
+        with self._lock:
+            self._entries.clear()
+            self._in_flight.clear()
+            self._generation += 1
\ No newline at end of file
@@ -0,0 +1,38 @@
+from psycopg2.extensions import cursor as TupleCursor
+from utils.pagination import pop_total_count
+from utils.fields import strip_fields
+
+def cursor_factory(columnar):
+    """Plain tuple cursor for columnar pages, else the connection's RealDictCursor"""
+    return TupleCursor if columnar else None
+
+def to_columnar(columns, rows, hidden_fields=()):
+    """Build {'columns': [...], 'rows': [[...], ...]} from tuple rows, leaving out hidden columns"""
+    keep = [i for i, column in enumerate(columns) if column not in hidden_fields]
+    if len(keep) == len(columns):
+        return {'columns': list(columns), 'rows': [list(row) for row in rows]}
+    return {
+        'columns': [columns[i] for i in keep],
+        'rows': [[row[i] for i in keep] for row in rows]
+    }
+
+def fetch_page(cur, columnar=False, hidden_fields=(), total_column='total_count'):
+    """Fetch page rows that carry their total in total_column.
+
+    Returns (rows, total), where rows are dicts or, for a tuple cursor,
+    a columnar page. total is None for an empty page.
+    """
+    rows = cur.fetchall()
+    
+    if not columnar:
+        total = pop_total_count(rows, total_column)
+        return strip_fields(rows, hidden_fields), total
+    
+    columns = [column.name for column in cur.description]
+    total = rows[0][columns.index(total_column)] if rows else None
+    return to_columnar(columns, rows, list(hidden_fields) + [total_column]), total
+
+def fetch_scalar(cur):
+    """Fetch the first column of the first row from either cursor type"""
+    row = cur.fetchone()
+    return next(iter(row.values())) if isinstance(row, dict) else row[0]
\ No newline at end of file
@@ -0,0 +1,91 @@
+import gzip
+import mimetypes
+import os
+import re
+from flask import request, send_from_directory
+from config.compression_config import CompressionConfig
+
+try:
+    import brotli
+except ImportError:
+    # Optional: without it responses fall back to gzip
+    brotli = None
+
+_hashed_asset = re.compile(CompressionConfig.HASHED_ASSET_PATTERN)
+
+def _choose_encoding(accept_encodings, brotli_available):
+    """Pick brotli or gzip from the client's Accept-Encoding, or None"""
+    if brotli_available and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+def compress_response(response):
+    """after_request hook compressing API bodies above the size threshold"""
+    if (response.mimetype not in CompressionConfig.MIMETYPES or
+            response.direct_passthrough or response.is_streamed or
+            'Content-Encoding' in response.headers):
+        # Files and streamed exports are sent as they are
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return response
+    
+    encoding = _choose_encoding(request.accept_encodings, brotli is not None)
+    if not encoding:
+        return response
+    
+    data = response.get_data()
+    if len(data) < CompressionConfig.MIN_SIZE:
+        return response
+    
+    if encoding == 'br':
+        data = brotli.compress(data, quality=CompressionConfig.BROTLI_QUALITY)
+    else:
+        # A fixed mtime keeps the bytes stable for the same body
+        data = gzip.compress(data, compresslevel=CompressionConfig.GZIP_LEVEL, mtime=0)
+    
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    
+    # Each encoding is a different representation, so it needs its own strong ETag
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{encoding}", weak)
+    
+    return response
+
+def send_static(directory, filename):
+    """Serve a built frontend file, preferring its precompressed .br/.gz sibling"""
+    response = None
+    encoding = _choose_encoding(request.accept_encodings, True)
+    
+    for candidate in (encoding, 'gzip') if encoding else ():
+        suffix = '.br' if candidate == 'br' else '.gz'
+        if os.path.isfile(os.path.join(directory, filename + suffix)):
+            response = send_from_directory(
+                directory,
+                filename + suffix,
+                mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            )
+            response.headers['Content-Encoding'] = candidate
+            break
+    
+    if response is None:
+        response = send_from_directory(directory, filename)
+    
+    response.vary.add('Accept-Encoding')
+    
+    if _hashed_asset.match(filename):
+        # The name changes whenever the content does
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = CompressionConfig.HASHED_ASSET_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    
+    return response
\ No newline at end of file
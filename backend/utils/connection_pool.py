@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from psycopg2 import extensions
+from utils.exceptions import PoolTimeoutError
+
+class _PooledEntry:
+    """A pooled connection plus the bookkeeping needed to recycle it"""
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+class ConnectionPool:
+    """Thread-safe pool of PostgreSQL connections"""
+
+    def __init__(self, connect, min_size=1, max_size=10, timeout=10.0,
+                 max_age=1800.0, health_check_interval=30.0):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_age = max_age
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0  # Open connections, including ones being opened
+        self._waiting = 0
+        self._closed = False
+        self._counters = {
+            'checkouts': 0,
+            'timeouts': 0,
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'recycled': 0,
+            'health_check_failures': 0,
+            'total_wait_ms': 0.0
+        }
+
+        self._fill_min_size()
+
+    def _fill_min_size(self):
+        """Open connections until the pool holds min_size of them"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            entry = self._open()
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    def _open(self):
+        """Open a new connection for a slot already reserved in _size"""
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._counters['connections_opened'] += 1
+        return _PooledEntry(conn)
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._counters['connections_closed'] += 1
+
+    def _is_healthy(self, conn):
+        """Ping a connection that has been idle for a while"""
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _prepare(self, entry):
+        """Recycle an idle connection if it is too old or no longer answers"""
+        now = time.monotonic()
+
+        if self.max_age and now - entry.created_at > self.max_age:
+            self._close_quietly(entry.conn)
+            with self._cond:
+                self._counters['recycled'] += 1
+            return self._open()
+
+        if entry.conn.closed or (
+            now - entry.last_used > self.health_check_interval and
+            not self._is_healthy(entry.conn)
+        ):
+            self._close_quietly(entry.conn)
+            with self._cond:
+                self._counters['health_check_failures'] += 1
+            return self._open()
+
+        return entry
+
+    def acquire(self, timeout=None):
+        """Check out a connection, waiting up to timeout seconds for one to free up"""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+                if self._idle:
+                    # LIFO keeps the most recently used connections warm
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    entry = None
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"Timed out after {timeout}s waiting for a database connection"
+                    )
+
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        entry = self._open() if entry is None else self._prepare(entry)
+
+        with self._cond:
+            self._in_use[id(entry.conn)] = entry
+            self._counters['checkouts'] += 1
+            self._counters['total_wait_ms'] += (time.monotonic() - started) * 1000
+        return entry.conn
+
+    def release(self, conn, discard=False):
+        """Return a connection to the pool, or close it if it cannot be reused"""
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+
+        if entry is None:
+            # Not checked out from this pool
+            self._close_quietly(conn)
+            return
+
+        reusable = not discard and not conn.closed and not self._closed
+        if reusable and self.max_age and time.monotonic() - entry.created_at > self.max_age:
+            reusable = False
+            with self._cond:
+                self._counters['recycled'] += 1
+
+        if reusable:
+            try:
+                status = conn.get_transaction_status()
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    reusable = False
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                if reusable and conn.autocommit:
+                    conn.autocommit = False
+            except Exception:
+                reusable = False
+
+        if not reusable:
+            self._close_quietly(conn)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            return
+
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Check out a connection for the duration of a with block.
+
+        Commits on success and rolls back on error, then hands the
+        connection back to the pool instead of closing it.
+        """
+        conn = self.acquire(timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close idle connections and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+
+        for entry in idle:
+            self._close_quietly(entry.conn)
+
+    def stats(self):
+        """Get a snapshot of pool usage"""
+        with self._cond:
+            checkouts = self._counters['checkouts']
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': self._waiting,
+                'checkouts': checkouts,
+                'timeouts': self._counters['timeouts'],
+                'connections_opened': self._counters['connections_opened'],
+                'connections_closed': self._counters['connections_closed'],
+                'recycled': self._counters['recycled'],
+                'health_check_failures': self._counters['health_check_failures'],
+                'avg_wait_ms': round(self._counters['total_wait_ms'] / checkouts, 3) if checkouts else 0.0
+            }
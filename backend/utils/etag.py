@@ -0,0 +1,55 @@
+import hashlib
+from functools import wraps
+from flask import request, make_response
+from services.data_version_service import DataVersionService
+
+_data_version_service = DataVersionService()
+
+def conditional_get(*tables, get_versions=None, get_key=None):
+    """Answer If-None-Match with 304 while the given tables are unchanged.
+
+    The ETag hashes the request URL with the tables' data versions, so a
+    matching request is answered before the view runs its queries.
+    get_versions replaces the data_versions lookup, e.g. with versions
+    already held in memory. get_key returns extra ETag input for responses
+    that depend on more than the URL, such as today's date.
+    """
+    get_versions = get_versions or _data_version_service.get_versions
+    
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                versions = get_versions(tables)
+            except Exception as e:
+                # Without versions nothing can be validated; serve the full response
+                print(f"Warning: Could not read data versions: {str(e)}")
+                return view(*args, **kwargs)
+            
+            key = request.full_path + '|' + ','.join(
+                f"{table}:{versions.get(table, 0)}" for table in tables
+            )
+            if get_key:
+                key += '|' + get_key()
+            etag = hashlib.sha1(key.encode('utf-8')).hexdigest()
+            
+            # Compressed responses carry the encoding as an ETag suffix
+            matched = next((
+                candidate for candidate in (etag, f"{etag}-br", f"{etag}-gzip")
+                if request.if_none_match.contains(candidate)
+            ), None)
+            
+            if matched:
+                response = make_response('', 304)
+                response.set_etag(matched)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(etag)
+            
+            # Cached copies must be revalidated, and never shared between users
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -24,4 +24,8 @@ class ForeignKeyError(BaseAppException):
 
 class StorageError(BaseAppException):
     """Exception raised for storage-related errors"""
+    pass
+
+class PoolTimeoutError(BaseAppException):
+    """Exception raised when no database connection becomes available in time"""
     pass
\ No newline at end of file
@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+def _close(rows):
+    # Release the server-side cursor even if the client disconnects mid-stream
+    close = getattr(rows, 'close', None)
+    if close:
+        close()
+
+def prefetch_first(rows):
+    """Start a lazy row iterator now so query errors surface before streaming.
+
+    Returns an equivalent iterator that still closes the original.
+    """
+    first_row = next(rows, None)
+    
+    def generate():
+        try:
+            if first_row is not None:
+                yield first_row
+            yield from rows
+        finally:
+            _close(rows)
+    
+    return generate()
+
+def stream_csv(rows, columns, chunk_rows=500):
+    """Yield CSV text in chunks of chunk_rows rows, header first"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    
+    try:
+        for count, row in enumerate(rows, 1):
+            writer.writerow([row[column] for column in columns])
+            if count % chunk_rows == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        yield buffer.getvalue()
+    finally:
+        _close(rows)
+
+def stream_ndjson(rows, chunk_rows=500):
+    """Yield newline-delimited JSON in chunks of chunk_rows rows"""
+    lines = []
+    
+    try:
+        for row in rows:
+            lines.append(json.dumps(row, default=str))
+            if len(lines) >= chunk_rows:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+    finally:
+        _close(rows)
\ No newline at end of file
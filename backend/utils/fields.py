@@ -0,0 +1,46 @@
+from utils.exceptions import ValidationError
+
+def build_select_list(fields, field_expressions, pk_field, extra_fields=()):
+    """Build the SELECT list for a ?fields= sparse fieldset.
+
+    fields is the comma-separated parameter value, or empty for every field.
+    The primary key is always selected. extra_fields the query needs
+    internally, such as the sort field, are selected as well and returned
+    as hidden fields for strip_fields to remove afterwards.
+    Returns (select_list, hidden_fields).
+    """
+    if fields:
+        requested = []
+        for field in fields.split(','):
+            field = field.strip()
+            if field and field not in requested:
+                requested.append(field)
+        
+        unknown = [field for field in requested if field not in field_expressions]
+        if unknown:
+            raise ValidationError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Allowed fields: {', '.join(field_expressions)}"
+            )
+        
+        if pk_field not in requested:
+            requested.insert(0, pk_field)
+    else:
+        requested = list(field_expressions)
+    
+    hidden_fields = [field for field in extra_fields if field not in requested]
+    
+    columns = []
+    for field in requested + hidden_fields:
+        expression = field_expressions[field]
+        columns.append(expression if expression == field else f"{expression} AS {field}")
+    
+    return ', '.join(columns), hidden_fields
+
+def strip_fields(rows, hidden_fields):
+    """Remove the internally needed columns the client did not ask for"""
+    if hidden_fields:
+        for row in rows:
+            for field in hidden_fields:
+                del row[field]
+    return rows
\ No newline at end of file
@@ -0,0 +1,32 @@
+import csv
+import io
+import json
+from utils.exceptions import ValidationError
+
+def read_csv_records(stream):
+    """Yield one dict per CSV data row, keyed by the header row"""
+    if not isinstance(stream, io.TextIOBase):
+        # Uploads arrive as bytes; utf-8-sig drops the BOM spreadsheet apps add
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    
+    reader = csv.DictReader(stream)
+    if not reader.fieldnames:
+        raise ValidationError("CSV file is empty")
+    
+    for record in reader:
+        yield record
+
+def read_json_records(data):
+    """Get student records from a JSON list or a {"students": [...]} object"""
+    if hasattr(data, 'read'):
+        try:
+            data = json.load(data)
+        except (ValueError, UnicodeDecodeError):
+            raise ValidationError("File is not valid JSON")
+    
+    if isinstance(data, dict):
+        data = data.get('students')
+    if not isinstance(data, list):
+        raise ValidationError("JSON must be a list of students or an object with a 'students' list")
+    
+    return data
\ No newline at end of file
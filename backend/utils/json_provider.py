@@ -0,0 +1,76 @@
+import decimal
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+from utils.timing import timed
+
+try:
+    import orjson
+except ImportError:
+    # Optional: without it the standard library encoder is used
+    orjson = None
+
+def _orjson_default(o):
+    """Serialize what orjson leaves to us the way DefaultJSONProvider does"""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    return DefaultJSONProvider.default(o)
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson when it is installed.
+
+    Output matches DefaultJSONProvider: dates as HTTP dates, Decimal as
+    strings and sorted keys, except that non-ASCII text is sent as UTF-8
+    instead of being escaped. Anything orjson rejects, such as non-string
+    keys or custom json.dumps arguments, goes through the standard encoder.
+    """
+    
+    def _orjson_options(self, indent=False):
+        # Datetimes are passed through to keep Flask's HTTP date format
+        options = orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+    
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.pop('indent', None)
+        separators = kwargs.pop('separators', None)
+        
+        if orjson is not None and not kwargs and indent in (None, 2) and separators in (None, (',', ':')):
+            try:
+                return orjson.dumps(
+                    obj, default=_orjson_default, option=self._orjson_options(indent == 2)
+                ).decode('utf-8')
+            except TypeError:
+                pass
+        
+        if indent is not None:
+            kwargs['indent'] = indent
+        if separators is not None:
+            kwargs['separators'] = separators
+        return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+    
+    @timed('serialize')
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        
+        try:
+            # Bytes go straight into the response, skipping a decode and re-encode
+            data = orjson.dumps(obj, default=_orjson_default, option=self._orjson_options(indent))
+        except TypeError:
+            return super().response(*args, **kwargs)
+        
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
\ No newline at end of file
@@ -0,0 +1,129 @@
+import queue
+import select
+import threading
+import time
+
+class NotificationListener:
+    """Shares one LISTEN connection between every subscriber in the process.
+
+    A background thread holds the connection while anyone is subscribed and
+    copies each NOTIFY payload onto every subscriber's queue. A subscriber
+    that may have missed payloads (its queue overflowed, or the connection
+    dropped) receives OVERFLOW instead and should resynchronize. Callbacks
+    added with add_callback run once per payload (or OVERFLOW after a
+    dropped connection), on the listener thread, before the queues fill.
+    """
+
+    OVERFLOW = object()
+
+    def __init__(self, connect, listen_query, queue_size=100, poll_interval=5.0, reconnect_delay=1.0):
+        self._connect = connect
+        self.listen_query = listen_query
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._callbacks = []
+        self._thread = None
+
+    def add_callback(self, callback):
+        """Call callback(payload) once per notification while anyone is subscribed"""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def subscribe(self):
+        """Get a queue that receives every notification from now on"""
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='notification-listener', daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Stop delivering to a queue; the connection closes with the last subscriber"""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _run_callbacks(self, payload):
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                print(f"Warning: Notification callback failed: {str(e)}")
+
+    def _publish(self, payload):
+        self._run_callbacks(payload)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(payload)
+            except queue.Full:
+                self._overflow(subscriber)
+
+    def _overflow(self, subscriber):
+        """Replace a subscriber's backlog with a single OVERFLOW marker"""
+        while True:
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            subscriber.put_nowait(self.OVERFLOW)
+        except queue.Full:
+            pass
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _should_stop(self):
+        """Check for subscribers, marking the thread finished if there are none"""
+        with self._lock:
+            if self._subscribers:
+                return False
+            self._thread = None
+            return True
+
+    def _run(self):
+        while not self._should_stop():
+            conn = None
+            try:
+                conn = self._connect()
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(self.listen_query)
+
+                while not self._should_stop():
+                    if select.select([conn], [], [], self.poll_interval)[0]:
+                        conn.poll()
+                        while conn.notifies:
+                            self._publish(conn.notifies.pop(0).payload)
+                    else:
+                        # Idle: ping so a dropped connection is noticed and replaced
+                        with conn.cursor() as cur:
+                            cur.execute("SELECT 1")
+                return
+            except Exception as e:
+                print(f"Warning: Notification listener lost its connection: {str(e)}")
+                self._run_callbacks(self.OVERFLOW)
+                with self._lock:
+                    subscribers = list(self._subscribers)
+                for subscriber in subscribers:
+                    self._overflow(subscriber)
+                time.sleep(self.reconnect_delay)
+            finally:
+                if conn is not None:
+                    self._close_quietly(conn)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import base64
+import binascii
+import json
+from utils.exceptions import ValidationError
+
+def encode_cursor(sort_field, sort_direction, values, backward=False):
+    """Encode a keyset position as an opaque URL-safe token"""
+    payload = {
+        'f': sort_field,
+        'd': sort_direction,
+        'v': list(values),
+        'b': backward
+    }
+    raw = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, allowed_sort_fields, pk_field, enum_values=None):
+    """Decode a cursor token, rejecting anything that was not issued by encode_cursor.
+
+    Every sortable column is text or an enum, so cursor values must be
+    strings; enum_values maps enum-typed sort fields to their labels.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        sort_field = payload['f']
+        sort_direction = payload['d']
+        values = payload['v']
+        backward = bool(payload['b'])
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise ValidationError("Invalid pagination cursor")
+
+    expected_length = 1 if sort_field == pk_field else 2
+    if (sort_field not in allowed_sort_fields or
+            sort_direction not in ('asc', 'desc') or
+            not isinstance(values, list) or len(values) != expected_length):
+        raise ValidationError("Invalid pagination cursor")
+    
+    # The values become query params compared against the sort columns, so
+    # anything else would fail in the database instead of here
+    if not all(isinstance(value, str) for value in values):
+        raise ValidationError("Invalid pagination cursor")
+    if (sort_field != pk_field and enum_values and sort_field in enum_values and
+            values[0] not in enum_values[sort_field]):
+        raise ValidationError("Invalid pagination cursor")
+
+    return {
+        'sort_field': sort_field,
+        'sort_direction': sort_direction,
+        'values': values,
+        'backward': backward
+    }
+
+def build_keyset_clauses(sort_expression, pk_expression, sort_direction, cursor=None):
+    """Build the seek predicate, its params and the ORDER BY for one keyset page.
+
+    Walking backward from a cursor flips both the comparison and the scan
+    order; the caller reverses the fetched rows afterwards.
+    """
+    backward = cursor['backward'] if cursor else False
+    reverse = (sort_direction == 'desc') != backward
+    operator = '<' if reverse else '>'
+    scan_direction = 'DESC' if reverse else 'ASC'
+
+    if sort_expression == pk_expression:
+        columns = [pk_expression]
+    else:
+        columns = [sort_expression, pk_expression]
+
+    order_clause = ', '.join(f'{column} {scan_direction}' for column in columns)
+
+    if not cursor:
+        return '', (), order_clause
+
+    placeholders = ', '.join(['%s'] * len(columns))
+    keyset_clause = f" AND ({', '.join(columns)}) {operator} ({placeholders})"
+    return keyset_clause, tuple(cursor['values']), order_clause
+
+def _cursor_values(row, sort_field, pk_field, columns=None):
+    if columns:
+        # Tuple rows from a columnar page
+        row = dict(zip(columns, row))
+    values = [row[sort_field]] if sort_field != pk_field else []
+    values.append(row[pk_field])
+    # NULL sort keys are compared as empty strings by the keyset queries
+    return ['' if value is None else value for value in values]
+
+def build_keyset_page(rows, per_page, sort_field, sort_direction, pk_field, cursor=None, columns=None):
+    """Trim the look-ahead row and work out the cursors for the neighbouring pages.
+
+    rows must have been fetched with LIMIT per_page + 1. Pass the column
+    names when rows are tuples rather than dicts.
+    """
+    backward = cursor['backward'] if cursor else False
+    has_more = len(rows) > per_page
+    rows = list(rows[:per_page])
+
+    if backward:
+        rows.reverse()
+        # Coming back from a later page means there is always a next page
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, cursor is not None
+
+    next_cursor = None
+    prev_cursor = None
+
+    if rows and has_next:
+        next_cursor = encode_cursor(
+            sort_field, sort_direction, _cursor_values(rows[-1], sort_field, pk_field, columns)
+        )
+    if rows and has_prev:
+        prev_cursor = encode_cursor(
+            sort_field, sort_direction, _cursor_values(rows[0], sort_field, pk_field, columns),
+            backward=True
+        )
+
+    return rows, next_cursor, prev_cursor
+
+def pop_total_count(rows, column='total_count'):
+    """Strip the total_count column from page rows and return the total it carried.
+
+    Returns None for an empty page, where there is no row to carry it.
+    """
+    if not rows:
+        return None
+    total = rows[0][column]
+    for row in rows:
+        del row[column]
+    return total
@@ -0,0 +1,97 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+import uuid
+from flask import request, current_app
+from flask_jwt_extended import verify_jwt_in_request
+from config.profiling_config import ProfilingConfig
+from utils.auth import VERIFIED_JWT_KEY
+
+_ENVIRON_KEY = 'app.request_profiler'
+
+# One profiled request at a time: a nested or concurrent profiler on the
+# same thread would replace the running one's hooks
+_profile_lock = threading.Lock()
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _is_authenticated():
+    if VERIFIED_JWT_KEY in request.environ:
+        return True
+    try:
+        return verify_jwt_in_request(optional=True) is not None
+    except Exception:
+        return False
+
+def start_profile():
+    """before_request hook running cProfile for authenticated ?profile=1 requests"""
+    if ProfilingConfig.MODE == 'off' or request.args.get('profile') != '1':
+        return
+    if not _is_authenticated():
+        return
+    if not _profile_lock.acquire(blocking=False):
+        return
+    
+    profiler = cProfile.Profile()
+    request.environ[_ENVIRON_KEY] = profiler
+    profiler.enable()
+
+def _describe(function):
+    """Format a pstats (file, line, name) key with paths relative to the backend"""
+    filename, line, name = function
+    if filename.startswith(_BASE_DIR):
+        filename = os.path.relpath(filename, _BASE_DIR)
+    return f"{filename}:{line}({name})" if line else name
+
+def finish_profile(response):
+    """after_request hook replacing the body with the request's profile.
+
+    The body lists the slowest functions by cumulative time, with the
+    status the request would have returned. With REQUEST_PROFILE_DIR set, the full profile is
+    also saved there as a .prof file.
+    """
+    profiler = request.environ.pop(_ENVIRON_KEY, None)
+    if profiler is None:
+        return response
+    
+    try:
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        
+        functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        profile = {
+            'status': response.status_code,
+            'total_calls': stats.total_calls,
+            'total_ms': round(stats.total_tt * 1000, 3),
+            'functions': [
+                {
+                    'function': _describe(function),
+                    'calls': calls,
+                    'self_ms': round(self_time * 1000, 3),
+                    'cumulative_ms': round(cumulative_time * 1000, 3)
+                }
+                for function, (_, calls, self_time, cumulative_time, _) in functions[:ProfilingConfig.TOP_FUNCTIONS]
+            ]
+        }
+        
+        if ProfilingConfig.OUTPUT_DIR:
+            os.makedirs(ProfilingConfig.OUTPUT_DIR, exist_ok=True)
+            filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.endpoint}-{uuid.uuid4().hex[:8]}.prof"
+            stats.dump_stats(os.path.join(ProfilingConfig.OUTPUT_DIR, filename))
+            profile['file'] = filename
+    finally:
+        _profile_lock.release()
+    
+    # Streamed bodies are never sent, so close them to run their cleanup
+    response.close()
+    
+    return current_app.json.response(profile)
+
+def discard_profile(exc=None):
+    """teardown_request hook stopping a profile the after_request hooks never reached"""
+    profiler = request.environ.pop(_ENVIRON_KEY, None)
+    if profiler is not None:
+        profiler.disable()
+        _profile_lock.release()
\ No newline at end of file
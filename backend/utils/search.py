@@ -0,0 +1,31 @@
+from config.search_config import SearchConfig
+
+def build_search_clause(queries, search):
+    """Pick the search predicate for the configured engine.
+
+    Returns the clause to splice into {search_clause} and its params.
+    """
+    if not search:
+        return "", ()
+    
+    # Add wildcards for LIKE search
+    search_pattern = f'%{search.lower()}%'
+    
+    if SearchConfig.ENGINE == 'trigram':
+        clause = queries.SEARCH_CLAUSE_TRIGRAM
+    else:
+        clause = queries.SEARCH_CLAUSE
+    
+    return clause, (search_pattern,) * clause.count('%s')
+
+def build_relevance_order(queries, search, pk_field):
+    """Build an ORDER BY that ranks trigram matches first.
+
+    Returns None when relevance ranking is unavailable, so callers can fall
+    back to their default sort.
+    """
+    if not search or SearchConfig.ENGINE != 'trigram':
+        return None
+    
+    rank = queries.SEARCH_RANK_TRIGRAM
+    return f"{rank} DESC, {pk_field} ASC", (search.lower(),) * rank.count('%s')
\ No newline at end of file
@@ -0,0 +1,8 @@
+import json
+
+# Comment line sent on idle streams so proxies and browsers keep them open
+KEEPALIVE = ": keepalive\n\n"
+
+def format_event(event, data):
+    """Format one Server-Sent Event with a JSON data line"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
\ No newline at end of file
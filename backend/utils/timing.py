@@ -0,0 +1,99 @@
+import inspect
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import request, has_request_context
+
+_ENVIRON_KEY = 'app.request_timer'
+
+class RequestTimer:
+    """Per-request wall time, split by layer.
+
+    Layers nest (controller -> service -> db), so each one records only
+    its own time: a layer's elapsed time minus that of the layers it called.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.layers = {}  # layer -> exclusive milliseconds, in first-seen order
+        self._stack = []  # [layer, started, child_ms] for each open layer
+
+    def enter(self, layer):
+        self._stack.append([layer, time.perf_counter(), 0.0])
+
+    def exit(self):
+        layer, started, child_ms = self._stack.pop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.layers[layer] = self.layers.get(layer, 0.0) + elapsed_ms - child_ms
+        if self._stack:
+            self._stack[-1][2] += elapsed_ms
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+def start_request_timer():
+    """before_request hook starting the timer for this request"""
+    request.environ[_ENVIRON_KEY] = RequestTimer()
+
+def current_timer():
+    """Get the running request's timer, or None outside a request"""
+    if not has_request_context():
+        return None
+    return request.environ.get(_ENVIRON_KEY)
+
+@contextmanager
+def timing(layer):
+    """Count the with block's time towards layer in the current request"""
+    timer = current_timer()
+    if timer is None:
+        yield
+        return
+    timer.enter(layer)
+    try:
+        yield
+    finally:
+        timer.exit()
+
+def timed(layer):
+    """Decorator counting each call's time towards layer"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timing(layer):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def timed_layer(layer):
+    """Class decorator timing every public method as layer.
+
+    Generator methods are left alone: their work happens after the call
+    returns, while the response streams.
+    """
+    def decorator(cls):
+        for name, attr in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.isfunction(attr) or inspect.isgeneratorfunction(attr):
+                continue
+            setattr(cls, name, timed(layer)(attr))
+        return cls
+    return decorator
+
+def add_timing_headers(response):
+    """after_request hook reporting the request's layer times.
+
+    Server-Timing lists each layer's own time, plus the total; browsers
+    show it in the network panel. X-Response-Time carries the total.
+    """
+    timer = current_timer()
+    if timer is None:
+        return response
+    
+    total_ms = timer.total_ms()
+    entries = [f"{layer};dur={ms:.2f}" for layer, ms in timer.layers.items()]
+    entries.append(f"total;dur={total_ms:.2f}")
+    
+    response.headers['Server-Timing'] = ', '.join(entries)
+    response.headers['X-Response-Time'] = f"{total_ms:.2f}ms"
+    # Lets the frontend, served from another origin, read the timings
+    response.headers['Timing-Allow-Origin'] = '*'
+    return response
\ No newline at end of file
@@ -1,3 +1,4 @@
+import re
 from utils.exceptions import ValidationError
 
 class Validator:
@@ -51,4 +52,42 @@ class Validator:
             raise ValidationError(
                 f"File size exceeds maximum allowed size of {max_size / (1024*1024)}MB"
             )
-        return True
\ No newline at end of file
+        return True
+    
+    @staticmethod
+    def validate_student(data, year_levels, genders):
+        """Validate and normalize a student record, as the frontend form does"""
+        Validator.validate_required_fields(
+            data, ['id_number', 'first_name', 'last_name', 'year_level', 'gender', 'program_code']
+        )
+        
+        id_number = re.sub(r'[\s\-]', '', str(data['id_number']))
+        if not re.fullmatch(r'\d{8}', id_number):
+            raise ValidationError("ID number must be exactly 8 digits (format: XXXX-XXXX)")
+        
+        first_name = str(data['first_name']).strip()
+        if not 2 <= len(first_name) <= 50 or not re.fullmatch(r'[A-Za-z\s\-]+', first_name):
+            raise ValidationError(
+                "First name must be 2-50 characters of letters, spaces, and hyphens"
+            )
+        
+        last_name = str(data['last_name']).strip()
+        if not 2 <= len(last_name) <= 50 or not re.fullmatch(r'[A-Za-z\s]+', last_name):
+            raise ValidationError("Last name must be 2-50 characters of letters and spaces")
+        
+        year_level = str(data['year_level']).strip()
+        if year_level not in year_levels:
+            raise ValidationError(f"Year level must be one of: {', '.join(year_levels)}")
+        
+        gender = str(data['gender']).strip()
+        if gender not in genders:
+            raise ValidationError(f"Gender must be one of: {', '.join(genders)}")
+        
+        return {
+            'id_number': f'{id_number[:4]}-{id_number[4:]}',
+            'first_name': first_name.title(),
+            'last_name': last_name.title(),
+            'year_level': year_level,
+            'gender': gender,
+            'program_code': str(data['program_code']).strip()
+        }
\ No newline at end of file
@@ -0,0 +1,51 @@
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { extname, join, resolve } from 'node:path'
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib'
+
+// Text assets worth compressing; images and fonts are already compressed
+const COMPRESSIBLE = new Set(['.js', '.mjs', '.css', '.html', '.svg', '.json', '.txt', '.ico', '.map'])
+const MIN_SIZE = 1024
+
+function* walk(dir) {
+  for (const name of readdirSync(dir)) {
+    const path = join(dir, name)
+    if (statSync(path).isDirectory()) yield* walk(path)
+    else yield path
+  }
+}
+
+// Write .br and .gz siblings next to each compressible file, for the
+// backend to serve instead of compressing on every request
+export function compressDirectory(dir) {
+  for (const path of walk(dir)) {
+    if (!COMPRESSIBLE.has(extname(path))) continue
+
+    const data = readFileSync(path)
+    if (data.length < MIN_SIZE) continue
+
+    const br = brotliCompressSync(data, {
+      params: {
+        [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+        [constants.BROTLI_PARAM_SIZE_HINT]: data.length,
+      },
+    })
+    const gz = gzipSync(data, { level: 9 })
+
+    if (br.length < data.length) writeFileSync(`${path}.br`, br)
+    if (gz.length < data.length) writeFileSync(`${path}.gz`, gz)
+  }
+}
+
+export default function precompress() {
+  let outDir
+  return {
+    name: 'precompress',
+    apply: 'build',
+    configResolved(config) {
+      outDir = resolve(config.root, config.build.outDir)
+    },
+    closeBundle() {
+      compressDirectory(outDir)
+    },
+  }
+}